@@ -207,6 +207,7 @@ async function loadContests() {
 function renderContests() {
     if (contests.length === 0) {
         contestsList.innerHTML = '<div class="no-contests" style="text-align: center; padding: var(--space-32); color: var(--color-text-secondary);"><p>No upcoming contests found.</p></div>';
+        registerCountdowns();
         return;
     }
     
@@ -237,7 +238,7 @@ function renderContests() {
                     </div>
                     <div class="contest-detail">
                         <span class="contest-detail-label">Time Until Start</span>
-                        <span class="contest-detail-value ${getTimeStatusClass(timeUntilStart)}">${timeUntilStart}</span>
+                        <span class="contest-detail-value ${getTimeStatusClass(timeUntilStart)}" data-countdown-start="${contest.startTimeSeconds}">${timeUntilStart}</span>
                     </div>
                     <div class="contest-detail">
                         <span class="contest-detail-label">Contest ID</span>
@@ -268,6 +269,8 @@ function renderContests() {
             addToCalendar(contestId);
         });
     });
+    
+    registerCountdowns();
 }
 
 function formatDateTime(date) {
@@ -379,9 +382,69 @@ function showToast(message, type) {
     }, 3000);
 }
 
-// Update contest times periodically
-setInterval(() => {
-    if (contests.length > 0) {
-        renderContests();
+// Countdown ticker: a single timer for every "Time Until Start" label.
+// Labels only change on minute boundaries (hour boundaries when a contest is
+// more than a day away), so the timer sleeps until the earliest such change,
+// rewrites just the labels that changed and stops while the page is hidden.
+const MINUTE_MS = 60 * 1000;
+const HOUR_MS = 60 * MINUTE_MS;
+const DAY_MS = 24 * HOUR_MS;
+const MAX_TIMER_DELAY_MS = 2147483647;
+
+let countdownLabels = [];
+let countdownTimer = null;
+
+function registerCountdowns() {
+    countdownLabels = Array.from(contestsList.querySelectorAll('[data-countdown-start]'), node => ({
+        node,
+        startMs: parseInt(node.dataset.countdownStart) * 1000,
+        text: node.textContent,
+        statusClass: getTimeStatusClass(node.textContent)
+    }));
+    scheduleCountdownTick();
+}
+
+// Milliseconds until getTimeUntilStart() returns a different label, or Infinity once started
+function msUntilLabelChange(startMs, now) {
+    const diff = startMs - now;
+    if (diff < 0) return Infinity;
+    const step = diff >= DAY_MS ? HOUR_MS : MINUTE_MS;
+    return diff % step + 1;
+}
+
+function scheduleCountdownTick() {
+    clearTimeout(countdownTimer);
+    countdownTimer = null;
+    if (document.hidden || countdownLabels.length === 0) return;
+    
+    const now = Date.now();
+    const delay = Math.min(...countdownLabels.map(label => msUntilLabelChange(label.startMs, now)));
+    if (delay !== Infinity) {
+        countdownTimer = setTimeout(tickCountdowns, Math.min(delay, MAX_TIMER_DELAY_MS));
     }
-}, 60000); // Update every minute
\ No newline at end of file
+}
+
+function tickCountdowns() {
+    countdownLabels.forEach(label => {
+        const text = getTimeUntilStart(new Date(label.startMs));
+        if (text === label.text) return;
+        
+        const statusClass = getTimeStatusClass(text);
+        label.node.firstChild.nodeValue = text;
+        if (statusClass !== label.statusClass) {
+            label.node.classList.replace(label.statusClass, statusClass);
+            label.statusClass = statusClass;
+        }
+        label.text = text;
+    });
+    scheduleCountdownTick();
+}
+
+// No wakeups while the tab is in the background; catch up as soon as it is shown again
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        scheduleCountdownTick();
+    } else {
+        tickCountdowns();
+    }
+});
@@ -4,32 +4,192 @@
 const CODEFORCES_API_URL = 'https://codeforces.com/api/contest.list';
 const GOOGLE_CALENDAR_API_URL = 'https://www.googleapis.com/calendar/v3/calendars/primary/events';
 const CACHE_DURATION = 5 * 60 * 1000; // 5 minutes
+const TOKEN_VALIDATION_URL = 'https://www.googleapis.com/calendar/v3/calendars/primary';
+const TOKEN_EXPIRY_MARGIN = 60 * 1000; // Re-validate tokens this close to expiry
+const AUTH_KEYS = ['isAuthenticated', 'googleAccessToken', 'tokenExpiresAt'];
+const CACHED_KEYS = ['contests', 'lastFetch', 'nextRefreshAt', 'addedContests', ...AUTH_KEYS];
+const POPUP_PORT_NAME = 'popup';
+
+// Adaptive refresh: the contest list is polled often only in the day before a
+// contest, when registration opens and start times still move
+const REFRESH_ALARM = 'updateContests';
+const REFRESH_MINUTES = {
+    imminent: 30,      // a contest starts within IMMINENT_WINDOW_MINUTES
+    sparse: 6 * 60,    // the next contest is further out
+    quiet: 24 * 60,    // nothing announced
+    retry: 15          // the last fetch failed
+};
+const IMMINENT_WINDOW_MINUTES = 24 * 60;
+const IDLE_DETECTION_SECONDS = 15 * 60; // no polling while the machine is idle or locked
+
+// Reminders for contests added to the calendar, fired by chrome.alarms
+const REMINDER_MINUTES = [30, 10];
+const REMINDER_ALARM_PREFIX = 'reminder:';
+
+// Bulk inserts: a few requests in flight, paced below the Calendar API's
+// per-user quota (requestsPerSecond 0 disables pacing), retried with
+// jittered exponential backoff on rate limits and server errors
+const BULK_ADD_CONCURRENCY = 4;
+const CALENDAR_QUOTA = { requestsPerSecond: 5, burst: 5 };
+const CALENDAR_RETRY = { maxAttempts: 5, baseDelayMs: 1000, maxDelayMs: 32000 };
+
+// Events get a client-chosen id derived from the contest (base32hex: a-v, 0-9),
+// so a retried insert that already went through answers 409 instead of duplicating
+const CALENDAR_EVENT_ID_PREFIX = 'cfcontest';
+
+// In-memory tier in front of chrome.storage.local. Storage is read once per
+// worker lifetime; every write goes to both tiers. Stats count popup
+// responses: a hit was answered from memory, a miss needed storage or the network.
+let memoryCache = null;
+let memoryCacheLoading = null;
+const cacheStats = { hits: 0, misses: 0, storageReads: 0 };
+self.cacheStats = cacheStats;
+
+// Fill the memory tier from storage (once per cold start)
+function loadMemoryCache() {
+    if (!memoryCacheLoading) {
+        cacheStats.storageReads++;
+        memoryCacheLoading = chrome.storage.local.get(CACHED_KEYS).then(result => {
+            memoryCache = result;
+            return result;
+        }, error => {
+            memoryCacheLoading = null;
+            throw error;
+        });
+    }
+    return memoryCacheLoading;
+}
+
+function pickCached(keys) {
+    const result = {};
+    keys.forEach(key => {
+        if (key in memoryCache) {
+            result[key] = memoryCache[key];
+        }
+    });
+    return result;
+}
+
+// Copy of the requested keys, or null while the worker is cold
+function cacheGetSync(keys) {
+    if (!memoryCache) {
+        return null;
+    }
+    return pickCached(keys);
+}
+
+async function cacheGet(keys) {
+    if (!memoryCache) {
+        await loadMemoryCache();
+    }
+    return pickCached(keys);
+}
+
+// Write-through: memory first so concurrent readers see it, then storage
+async function cacheSet(items) {
+    await loadMemoryCache();
+    Object.assign(memoryCache, items);
+    await chrome.storage.local.set(items);
+}
+
+async function cacheRemove(keys) {
+    await loadMemoryCache();
+    keys.forEach(key => delete memoryCache[key]);
+    await chrome.storage.local.remove(keys);
+}
+
+// Keep the memory tier in step with writes made elsewhere (e.g. the popup's refresh)
+chrome.storage.onChanged.addListener((changes, areaName) => {
+    if (areaName !== 'local' || !memoryCache) {
+        return;
+    }
+    Object.entries(changes).forEach(([key, change]) => {
+        if (!CACHED_KEYS.includes(key)) {
+            return;
+        }
+        if ('newValue' in change) {
+            memoryCache[key] = change.newValue;
+        } else {
+            delete memoryCache[key];
+        }
+    });
+});
+
+loadMemoryCache().catch(error => console.error('Error warming cache:', error));
 
 // Install event
 chrome.runtime.onInstalled.addListener(() => {
     console.log('CodeForces Calendar Extension installed');
     
-    // Set up periodic contest updates
-    chrome.alarms.create('updateContests', {
-        delayInMinutes: 30,
-        periodInMinutes: 60
-    });
+    // Replaces the fixed hourly alarm of earlier versions; fetching reschedules it
+    chrome.alarms.clear(REFRESH_ALARM);
+    refreshContests();
+});
+
+chrome.runtime.onStartup.addListener(() => {
+    restoreAlarms().catch(error => console.error('Error restoring alarms:', error));
+    refreshIfDue();
+});
+
+chrome.idle.setDetectionInterval(IDLE_DETECTION_SECONDS);
+
+// Catch up on a refresh skipped while the user was away
+chrome.idle.onStateChanged.addListener((state) => {
+    if (state === 'active') {
+        refreshIfDue();
+    }
 });
 
-// Alarm listener for periodic updates
+// Alarm listener for contest refreshes and reminders
 chrome.alarms.onAlarm.addListener((alarm) => {
-    if (alarm.name === 'updateContests') {
-        fetchAndCacheContests();
+    if (alarm.name === REFRESH_ALARM) {
+        refreshIfDue();
+    } else if (alarm.name.startsWith(REMINDER_ALARM_PREFIX)) {
+        showReminder(alarm.name);
     }
 });
 
 // Message handler for popup communication
 chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
+    return dispatchMessage(message, sendResponse);
+});
+
+// Long-lived popup channel: requests carry an id, replies echo it back as
+// { id, type: 'response', response } after any { id, type: 'progress', progress }
+chrome.runtime.onConnect.addListener((port) => {
+    if (port.name !== POPUP_PORT_NAME) {
+        return;
+    }
+    
+    let connected = true;
+    port.onDisconnect.addListener(() => {
+        connected = false;
+    });
+    
+    port.onMessage.addListener((message) => {
+        const reply = (type, payload) => {
+            if (connected) {
+                port.postMessage({ id: message.id, type, [type]: payload });
+            }
+        };
+        dispatchMessage(message, response => reply('response', response), progress => reply('progress', progress));
+    });
+});
+
+// Route a request to its handler. Returns true while the response is still pending.
+function dispatchMessage(message, sendResponse, sendProgress = () => {}) {
     switch (message.action) {
         case 'fetchContests':
+            if (respondFromMemory(cachedContestsResponse(), sendResponse)) {
+                return false;
+            }
             handleFetchContests(sendResponse);
             return true; // Keep the message channel open for async response
             
+        case 'refreshContests':
+            handleRefreshContests(sendResponse);
+            return true;
+            
         case 'authenticateGoogle':
             handleGoogleAuth(sendResponse);
             return true;
@@ -38,22 +198,93 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             handleAddToCalendar(message.contest, sendResponse);
             return true;
             
-        // case 'checkAuthStatus':
-        //     handleCheckAuthStatus(sendResponse);
-        //     return true;
+        case 'addManyToCalendar':
+            handleAddManyToCalendar(message.contests, sendResponse, sendProgress, message.concurrency);
+            return true;
+            
         case 'checkAuthStatus':
-        // Simply return the stored flag, don’t re‑verify over network
-            chrome.storage.local.get(['isAuthenticated'], ({ isAuthenticated }) => {
-              sendResponse({ isAuthenticated: !!isAuthenticated });
-            });
+            if (respondFromMemory(cachedAuthStatusResponse(), sendResponse)) {
+                return false;
+            }
+            handleCheckAuthStatus(sendResponse);
             return true;
-
             
         case 'logout':
             handleLogout(sendResponse);
             return true;
+            
+        case 'getCacheStats':
+            sendResponse(getCacheStats());
+            return false;
     }
-});
+    return false;
+}
+
+// Answer synchronously when the warm memory tier already has the response
+function respondFromMemory(response, sendResponse) {
+    if (!response) {
+        return false;
+    }
+    cacheStats.hits++;
+    sendResponse(response);
+    return true;
+}
+
+function getCacheStats() {
+    const lookups = cacheStats.hits + cacheStats.misses;
+    return { ...cacheStats, hitRatio: lookups ? cacheStats.hits / lookups : 0 };
+}
+
+// Minutes until the contest list is worth fetching again
+function nextRefreshDelayMinutes(contests, now = Date.now()) {
+    const starts = contests
+        .map(contest => contest.startTimeSeconds * 1000)
+        .filter(start => start > now);
+    if (starts.length === 0) {
+        return REFRESH_MINUTES.quiet;
+    }
+    
+    const untilNext = (Math.min(...starts) - now) / 60000;
+    if (untilNext <= IMMINENT_WINDOW_MINUTES) {
+        return REFRESH_MINUTES.imminent;
+    }
+    // Wake up as the next contest enters the imminent window, if that comes first
+    return Math.max(REFRESH_MINUTES.imminent,
+        Math.min(REFRESH_MINUTES.sparse, untilNext - IMMINENT_WINDOW_MINUTES));
+}
+
+async function scheduleRefresh(delayMinutes) {
+    const nextRefreshAt = Date.now() + delayMinutes * 60000;
+    chrome.alarms.create(REFRESH_ALARM, { when: nextRefreshAt });
+    await cacheSet({ nextRefreshAt });
+}
+
+// Chrome can drop alarms across a browser restart; re-arm the pending refresh
+// and the reminders of added contests from the cached state
+async function restoreAlarms() {
+    const { nextRefreshAt, addedContests = {} } = await cacheGet(['nextRefreshAt', 'addedContests']);
+    if (nextRefreshAt && !(await chrome.alarms.get(REFRESH_ALARM))) {
+        chrome.alarms.create(REFRESH_ALARM, { when: nextRefreshAt });
+    }
+    await scheduleReminders(addedContests);
+}
+
+// Fetch now unless the machine is idle or locked; a skipped refresh runs
+// when the user comes back (idle.onStateChanged)
+async function refreshIfDue() {
+    const { nextRefreshAt } = await cacheGet(['nextRefreshAt']);
+    if (nextRefreshAt && Date.now() < nextRefreshAt) {
+        return;
+    }
+    if (await chrome.idle.queryState(IDLE_DETECTION_SECONDS) !== 'active') {
+        return;
+    }
+    refreshContests();
+}
+
+function refreshContests() {
+    fetchAndCacheContests().catch(() => scheduleRefresh(REFRESH_MINUTES.retry));
+}
 
 // Fetch contests from CodeForces API
 async function fetchAndCacheContests() {
@@ -63,16 +294,21 @@ async function fetchAndCacheContests() {
         
         if (data.status === 'OK') {
             // Filter for upcoming contests only
-            const upcomingContests = data.result.filter(contest => 
+            const allUpcoming = data.result.filter(contest => 
                 contest.phase === 'BEFORE'
-            ).slice(0, 10); // Limit to 10 contests
+            );
+            const upcomingContests = allUpcoming.slice(0, 10); // Limit to 10 contests
             
             // Cache the results
-            await chrome.storage.local.set({
+            await cacheSet({
                 contests: upcomingContests,
                 lastFetch: Date.now()
             });
             
+            // Schedule from the full list, not just the cached slice
+            await scheduleRefresh(nextRefreshDelayMinutes(allUpcoming));
+            await updateAddedContests(data.result);
+            
             return upcomingContests;
         } else {
             throw new Error('Failed to fetch contests from CodeForces API');
@@ -83,34 +319,66 @@ async function fetchAndCacheContests() {
     }
 }
 
+// Contests plus the ids already added to the calendar, so the popup does not offer them again
+function contestsResponse(contests, addedContests = {}) {
+    return { success: true, contests, addedContestIds: Object.keys(addedContests).map(Number) };
+}
+
+// Cached contests if they are still fresh, from the given cache snapshot (memory if omitted)
+function cachedContestsResponse(result = cacheGetSync(['contests', 'lastFetch', 'addedContests'])) {
+    if (result && result.contests && result.lastFetch && (Date.now() - result.lastFetch) < CACHE_DURATION) {
+        return contestsResponse(result.contests, result.addedContests);
+    }
+    return null;
+}
+
+async function freshContestsResponse() {
+    const contests = await fetchAndCacheContests();
+    const { addedContests } = await cacheGet(['addedContests']);
+    return contestsResponse(contests, addedContests);
+}
+
 // Handle contest fetching request from popup
 async function handleFetchContests(sendResponse) {
+    cacheStats.misses++;
     try {
         // Check if we have cached data
-        const result = await chrome.storage.local.get(['contests', 'lastFetch']);
-        const now = Date.now();
+        const cached = cachedContestsResponse(await cacheGet(['contests', 'lastFetch', 'addedContests']));
         
-        if (result.contests && result.lastFetch && (now - result.lastFetch) < CACHE_DURATION) {
+        if (cached) {
             // Return cached data
-            sendResponse({ success: true, contests: result.contests });
+            sendResponse(cached);
         } else {
             // Fetch fresh data
-            const contests = await fetchAndCacheContests();
-            sendResponse({ success: true, contests });
+            sendResponse(await freshContestsResponse());
         }
     } catch (error) {
         sendResponse({ success: false, error: error.message });
     }
 }
 
+// Refresh requested from the popup: drop the cached list in this worker (the
+// memory tier answers fetchContests, so clearing storage from the popup would
+// race storage.onChanged) and fetch a fresh one
+async function handleRefreshContests(sendResponse) {
+    cacheStats.misses++;
+    try {
+        await cacheRemove(['contests', 'lastFetch']);
+        sendResponse(await freshContestsResponse());
+    } catch (error) {
+        sendResponse({ success: false, error: error.message });
+    }
+}
+
 // Handle Google authentication
 async function handleGoogleAuth(sendResponse) {
     try {
-        const token = await getGoogleAccessToken();
+        const { token, expiresAt } = await getGoogleAccessToken();
         if (token) {
-            await chrome.storage.local.set({ 
+            await cacheSet({
                 googleAccessToken: token,
-                isAuthenticated: true 
+                isAuthenticated: true,
+                tokenExpiresAt: expiresAt
             });
             sendResponse({ success: true, token });
         } else {
@@ -142,8 +410,10 @@ async function getGoogleAccessToken() {
             }
             
             if (responseUrl) {
-                const token = extractTokenFromUrl(responseUrl);
-                resolve(token);
+                resolve({
+                    token: extractTokenFromUrl(responseUrl),
+                    expiresAt: extractExpiryFromUrl(responseUrl)
+                });
             } else {
                 reject(new Error('No response URL received'));
             }
@@ -157,46 +427,242 @@ function extractTokenFromUrl(url) {
     return params.get('access_token');
 }
 
+// Turn the OAuth expires_in (seconds) into an absolute timestamp
+function extractExpiryFromUrl(url) {
+    const params = new URLSearchParams(url.split('#')[1]);
+    const expiresIn = parseInt(params.get('expires_in'), 10);
+    return Number.isFinite(expiresIn) ? Date.now() + expiresIn * 1000 : null;
+}
+
+// Validate the stored token only when it is about to be used. Tokens with a
+// known expiry are trusted until shortly before it; others are checked live.
+async function getValidAccessToken() {
+    const result = await cacheGet(AUTH_KEYS);
+    
+    if (!result.isAuthenticated || !result.googleAccessToken) {
+        return null;
+    }
+    
+    if (result.tokenExpiresAt && Date.now() < result.tokenExpiresAt - TOKEN_EXPIRY_MARGIN) {
+        return result.googleAccessToken;
+    }
+    
+    const testResponse = await fetch(TOKEN_VALIDATION_URL, {
+        headers: {
+            'Authorization': `Bearer ${result.googleAccessToken}`
+        }
+    });
+    
+    if (testResponse.ok) {
+        return result.googleAccessToken;
+    }
+    
+    // Token expired, clear auth state
+    await cacheRemove(AUTH_KEYS);
+    return null;
+}
+
+// Create one calendar event; resolves to the response sent back to the popup
+async function insertCalendarEvent(accessToken, contest) {
+    const event = createCalendarEvent(contest);
+    const result = await sendCalendarEvent(accessToken, 'POST', GOOGLE_CALENDAR_API_URL, event);
+    if (result.conflict) {
+        // The event exists already: an earlier attempt whose response was lost,
+        // or an event the user deleted (Calendar keeps it as cancelled). Bring it
+        // up to date instead of failing.
+        return sendCalendarEvent(accessToken, 'PATCH', `${GOOGLE_CALENDAR_API_URL}/${event.id}`,
+            { ...event, status: 'confirmed' });
+    }
+    return result;
+}
+
+function calendarEventId(contest) {
+    return `${CALENDAR_EVENT_ID_PREFIX}${contest.id}`;
+}
+
+async function sendCalendarEvent(accessToken, method, url, event) {
+    const response = await fetch(url, {
+        method,
+        headers: {
+            'Authorization': `Bearer ${accessToken}`,
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify(event)
+    });
+    
+    if (response.ok) {
+        const createdEvent = await response.json();
+        return { success: true, event: createdEvent };
+    } else if (response.status === 401) {
+        // Token was revoked before its expiry
+        await cacheRemove(AUTH_KEYS);
+        return { success: false, error: 'Google Calendar session expired. Please reconnect.', unauthorized: true };
+    } else if (response.status === 409) {
+        return { success: false, error: 'Event already exists', conflict: true };
+    } else {
+        const error = await response.text();
+        // Quota errors come back as 429 or as 403 with a rate-limit reason
+        const rateLimited = response.status === 429 ||
+            (response.status === 403 && /rateLimitExceeded/.test(error));
+        return {
+            success: false,
+            error: `Failed to create event: ${error}`,
+            rateLimited,
+            retryable: rateLimited || response.status >= 500,
+            retryAfterMs: parseRetryAfter(response.headers.get('Retry-After'))
+        };
+    }
+}
+
+// Retry-After is either delay-seconds or an HTTP date
+function parseRetryAfter(value) {
+    if (!value) return null;
+    const seconds = Number(value);
+    const delay = Number.isFinite(seconds) ? seconds * 1000 : Date.parse(value) - Date.now();
+    return Number.isFinite(delay) ? Math.max(0, delay) : null;
+}
+
+function sleep(ms) {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+// Token bucket shared by every Calendar request from this worker
+const calendarQuota = { tokens: CALENDAR_QUOTA.burst, updatedAt: Date.now(), pausedUntil: 0 };
+
+async function takeCalendarQuota() {
+    for (;;) {
+        const now = Date.now();
+        if (now < calendarQuota.pausedUntil) {
+            await sleep(calendarQuota.pausedUntil - now);
+            continue;
+        }
+        if (!CALENDAR_QUOTA.requestsPerSecond) {
+            return;
+        }
+        
+        const refill = (now - calendarQuota.updatedAt) / 1000 * CALENDAR_QUOTA.requestsPerSecond;
+        calendarQuota.tokens = Math.min(CALENDAR_QUOTA.burst, calendarQuota.tokens + refill);
+        calendarQuota.updatedAt = now;
+        if (calendarQuota.tokens >= 1) {
+            calendarQuota.tokens -= 1;
+            return;
+        }
+        await sleep((1 - calendarQuota.tokens) / CALENDAR_QUOTA.requestsPerSecond * 1000);
+    }
+}
+
+// Full-jitter exponential backoff for the given (1-based) attempt
+function backoffDelay(attempt) {
+    const ceiling = Math.min(CALENDAR_RETRY.maxDelayMs, CALENDAR_RETRY.baseDelayMs * 2 ** (attempt - 1));
+    return Math.random() * ceiling;
+}
+
+// insertCalendarEvent, paced by the quota bucket and retried on transient failures.
+// A rate-limit response pauses the whole bucket, not just this request. Resending
+// after a lost response is safe: the event id makes the second insert a 409.
+async function insertCalendarEventWithRetry(accessToken, contest) {
+    for (let attempt = 1; ; attempt++) {
+        await takeCalendarQuota();
+        
+        let result;
+        try {
+            result = await insertCalendarEvent(accessToken, contest);
+        } catch (error) {
+            result = { success: false, error: error.message, retryable: true };
+        }
+        
+        if (result.success || !result.retryable || attempt >= CALENDAR_RETRY.maxAttempts) {
+            return result;
+        }
+        
+        const delay = result.retryAfterMs ?? backoffDelay(attempt);
+        if (result.rateLimited) {
+            calendarQuota.pausedUntil = Math.max(calendarQuota.pausedUntil, Date.now() + delay);
+        }
+        await sleep(delay);
+    }
+}
+
 // Handle adding contest to Google Calendar
 async function handleAddToCalendar(contest, sendResponse) {
     try {
-        const result = await chrome.storage.local.get(['googleAccessToken', 'isAuthenticated']);
+        const accessToken = await getValidAccessToken();
         
-        if (!result.isAuthenticated || !result.googleAccessToken) {
+        if (!accessToken) {
             sendResponse({ success: false, error: 'Not authenticated with Google Calendar' });
             return;
         }
         
-        const event = createCalendarEvent(contest);
-        
-        const response = await fetch(GOOGLE_CALENDAR_API_URL, {
-            method: 'POST',
-            headers: {
-                'Authorization': `Bearer ${result.googleAccessToken}`,
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify(event)
-        });
-        
-        if (response.ok) {
-            const createdEvent = await response.json();
-            sendResponse({ success: true, event: createdEvent });
-        } else {
-            const error = await response.text();
-            sendResponse({ success: false, error: `Failed to create event: ${error}` });
+        const result = await insertCalendarEventWithRetry(accessToken, contest);
+        if (result.success) {
+            await recordAddedContests([contest]);
         }
+        sendResponse(result);
     } catch (error) {
         console.error('Error adding to calendar:', error);
         sendResponse({ success: false, error: error.message });
     }
 }
 
+// Add several contests in one request with a bounded pool of workers, reporting
+// each result as a progress event as soon as it is known
+async function handleAddManyToCalendar(contests, sendResponse, sendProgress, concurrency = BULK_ADD_CONCURRENCY) {
+    try {
+        const accessToken = await getValidAccessToken();
+        
+        if (!accessToken) {
+            sendResponse({ success: false, error: 'Not authenticated with Google Calendar' });
+            return;
+        }
+        
+        const results = [];
+        let next = 0;
+        let unauthorized = false;
+        
+        const worker = async () => {
+            while (next < contests.length && !unauthorized) {
+                const contest = contests[next++];
+                const result = await insertCalendarEventWithRetry(accessToken, contest);
+                const progress = {
+                    contestId: contest.id,
+                    success: result.success,
+                    eventId: result.event ? result.event.id : undefined,
+                    error: result.error
+                };
+                results.push(progress);
+                sendProgress({ done: results.length, total: contests.length, ...progress });
+                
+                // A revoked token fails every remaining insert; stop handing out work
+                unauthorized = unauthorized || !!result.unauthorized;
+            }
+        };
+        const workers = Math.max(1, Math.min(concurrency, contests.length));
+        await Promise.all(Array.from({ length: workers }, worker));
+        
+        const addedIds = new Set(results.filter(result => result.success).map(result => result.contestId));
+        await recordAddedContests(contests.filter(contest => addedIds.has(contest.id)));
+        
+        const added = addedIds.size;
+        sendResponse({
+            success: added === contests.length,
+            added,
+            failed: results.length - added,
+            skipped: contests.length - results.length,
+            results
+        });
+    } catch (error) {
+        console.error('Error adding contests to calendar:', error);
+        sendResponse({ success: false, error: error.message });
+    }
+}
+
 // Create calendar event object from contest data
 function createCalendarEvent(contest) {
     const startTime = new Date(contest.startTimeSeconds * 1000);
     const endTime = new Date(startTime.getTime() + (contest.durationSeconds * 1000));
     
     return {
+        id: calendarEventId(contest),
         summary: contest.name,
         description: `CodeForces Contest\n\nType: ${contest.type}\nContest ID: ${contest.id}\nURL: https://codeforces.com/contest/${contest.id}\n\nGood luck with the contest!`,
         start: {
@@ -209,37 +675,102 @@ function createCalendarEvent(contest) {
         },
         reminders: {
             useDefault: false,
-            overrides: [
-                { method: 'popup', minutes: 30 },
-                { method: 'popup', minutes: 10 }
-            ]
+            overrides: REMINDER_MINUTES.map(minutes => ({ method: 'popup', minutes }))
         }
     };
 }
 
-// Check authentication status
-async function handleCheckAuthStatus(sendResponse) {
-    try {
-        const result = await chrome.storage.local.get(['isAuthenticated', 'googleAccessToken']);
-        
-        if (result.isAuthenticated && result.googleAccessToken) {
-            // Verify token is still valid
-            const testResponse = await fetch('https://www.googleapis.com/calendar/v3/calendars/primary', {
-                headers: {
-                    'Authorization': `Bearer ${result.googleAccessToken}`
-                }
-            });
-            
-            if (testResponse.ok) {
-                sendResponse({ isAuthenticated: true });
-            } else {
-                // Token expired, clear auth state
-                await chrome.storage.local.remove(['isAuthenticated', 'googleAccessToken']);
-                sendResponse({ isAuthenticated: false });
+// Remember contests added to the calendar so their reminders can be scheduled
+async function recordAddedContests(added) {
+    if (added.length === 0) return;
+    
+    const { addedContests = {} } = await cacheGet(['addedContests']);
+    const updated = { ...addedContests };
+    added.forEach(contest => {
+        updated[contest.id] = { id: contest.id, name: contest.name, startTimeSeconds: contest.startTimeSeconds };
+    });
+    await cacheSet({ addedContests: updated });
+    await scheduleReminders(updated);
+}
+
+// Follow reschedules and drop contests that started or disappeared from the list
+async function updateAddedContests(allContests) {
+    const { addedContests = {} } = await cacheGet(['addedContests']);
+    const byId = new Map(allContests.map(contest => [contest.id, contest]));
+    const now = Date.now();
+    const updated = {};
+    
+    Object.values(addedContests).forEach(added => {
+        const contest = byId.get(added.id);
+        if (contest && contest.startTimeSeconds * 1000 > now) {
+            updated[added.id] = { ...added, name: contest.name, startTimeSeconds: contest.startTimeSeconds };
+        }
+    });
+    await cacheSet({ addedContests: updated });
+    await scheduleReminders(updated);
+}
+
+// One alarm per contest and reminder offset, at the exact reminder time.
+// Alarms that already match are left alone; stale ones are cleared.
+async function scheduleReminders(addedContests) {
+    const now = Date.now();
+    const wanted = new Map();
+    Object.values(addedContests).forEach(contest => {
+        REMINDER_MINUTES.forEach(minutes => {
+            const when = contest.startTimeSeconds * 1000 - minutes * 60000;
+            if (when > now) {
+                wanted.set(`${REMINDER_ALARM_PREFIX}${contest.id}:${minutes}`, when);
             }
-        } else {
-            sendResponse({ isAuthenticated: false });
+        });
+    });
+    
+    const alarms = await chrome.alarms.getAll();
+    alarms.filter(alarm => alarm.name.startsWith(REMINDER_ALARM_PREFIX)).forEach(alarm => {
+        if (!wanted.has(alarm.name)) {
+            chrome.alarms.clear(alarm.name);
+        } else if (alarm.scheduledTime === wanted.get(alarm.name)) {
+            wanted.delete(alarm.name);
         }
+    });
+    wanted.forEach((when, name) => chrome.alarms.create(name, { when }));
+}
+
+async function showReminder(alarmName) {
+    const [contestId, minutes] = alarmName.slice(REMINDER_ALARM_PREFIX.length).split(':');
+    const { reminders } = await chrome.storage.sync.get(['reminders']);
+    const { addedContests = {} } = await cacheGet(['addedContests']);
+    const contest = addedContests[contestId];
+    
+    if (reminders === false || !contest) {
+        return;
+    }
+    chrome.notifications.create(alarmName, {
+        type: 'basic',
+        iconUrl: 'icons/icon128.png',
+        title: contest.name,
+        message: `Starts in ${minutes} minutes`
+    });
+}
+
+// Auth status from a cache snapshot (memory if omitted); expired tokens are cleared
+function cachedAuthStatusResponse(result = cacheGetSync(AUTH_KEYS)) {
+    if (!result) {
+        return null;
+    }
+    const hasToken = !!(result.isAuthenticated && result.googleAccessToken);
+    const expired = !!result.tokenExpiresAt && Date.now() >= result.tokenExpiresAt;
+    
+    if (hasToken && expired) {
+        cacheRemove(AUTH_KEYS).catch(error => console.error('Error clearing expired token:', error));
+    }
+    return { isAuthenticated: hasToken && !expired };
+}
+
+// Check authentication status from the cached expiry; no network round trip
+async function handleCheckAuthStatus(sendResponse) {
+    cacheStats.misses++;
+    try {
+        sendResponse(cachedAuthStatusResponse(await cacheGet(AUTH_KEYS)));
     } catch (error) {
         console.error('Error checking auth status:', error);
         sendResponse({ isAuthenticated: false });
@@ -249,7 +780,7 @@ async function handleCheckAuthStatus(sendResponse) {
 // Handle logout
 async function handleLogout(sendResponse) {
     try {
-        await chrome.storage.local.remove(['isAuthenticated', 'googleAccessToken']);
+        await cacheRemove(AUTH_KEYS);
         sendResponse({ success: true });
     } catch (error) {
         console.error('Error during logout:', error);
@@ -0,0 +1,137 @@
+# Offline test: bulk "Add All" through background.js against the fake Calendar API
+#
+# Runs the extension's background.js (from script_3.py) under Node with a
+# stand-in for the chrome.* APIs, points its Calendar requests at
+# FakeCalendarServer and times addManyToCalendar for 200 contests at
+# concurrency 1, 4 and 16. Some inserts fail and some are stored but answered
+# with an error, so retries must not duplicate events (the events column
+# should equal the contest count). The first rows keep the shipped
+# CALENDAR_QUOTA, which bounds wall time at any concurrency; the rows with
+# pacing off show what the worker pool alone would give and are not what the
+# extension does. A last pass puts a per-user quota on the server and
+# compares unpaced workers with the client-side token bucket.
+#
+# Usage: python scripts/bench_bulk_add.py [contests] [--node PATH]
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from fake_calendar_server import FakeCalendarServer
+from fixtures import make_contests
+from script_3 import background_js
+
+LATENCY = 0.05  # seconds per Calendar API round trip
+FAIL_RATE = 0.02  # share of inserts answered with 503
+LOST_RATE = 0.02  # share of inserts stored but answered with 503
+BACKOFF_MS = 50  # CALENDAR_RETRY.baseDelayMs for the run (the extension uses 1000)
+SERVER_QUOTA = 40  # requests per second per user, for the quota pass
+SHIPPED_QUOTA = int(re.search(r"CALENDAR_QUOTA = \{ requestsPerSecond: (\d+)", background_js).group(1))
+
+DRIVER = """
+// Loads background.js with chrome.* stand-ins and runs one addManyToCalendar request
+const fs = require('fs');
+const vm = require('vm');
+
+const [backgroundPath, contestsPath] = process.argv.slice(2);
+const { BASE_URL, CONCURRENCY, QUOTA_RPS, BACKOFF_MS } = process.env;
+
+const store = { isAuthenticated: true, googleAccessToken: 'bench-token', tokenExpiresAt: Date.now() + 3600e3 };
+const noopEvent = { addListener() {} };
+globalThis.self = globalThis;
+globalThis.chrome = {
+    runtime: { onInstalled: noopEvent, onStartup: noopEvent, onMessage: noopEvent, onConnect: noopEvent },
+    alarms: { create() {}, clear() {}, getAll: async () => [], onAlarm: noopEvent },
+    idle: { setDetectionInterval() {}, onStateChanged: noopEvent },
+    storage: {
+        onChanged: noopEvent,
+        local: {
+            get: async keys => Object.fromEntries(keys.filter(key => key in store).map(key => [key, store[key]])),
+            set: async items => Object.assign(store, items),
+            remove: async keys => keys.forEach(key => delete store[key])
+        }
+    }
+};
+const realFetch = globalThis.fetch;
+globalThis.fetch = (url, options) => realFetch(url.replace('https://www.googleapis.com', BASE_URL), options);
+
+const background = vm.runInThisContext(fs.readFileSync(backgroundPath, 'utf8') +
+    '\\n;({ CALENDAR_QUOTA, CALENDAR_RETRY, handleAddManyToCalendar })');
+if (QUOTA_RPS) {
+    background.CALENDAR_QUOTA.requestsPerSecond = Number(QUOTA_RPS);
+    background.CALENDAR_QUOTA.burst = Math.max(1, Number(QUOTA_RPS));
+}
+background.CALENDAR_RETRY.baseDelayMs = Number(BACKOFF_MS);
+
+const contests = JSON.parse(fs.readFileSync(contestsPath, 'utf8'));
+let progressEvents = 0;
+const start = performance.now();
+background.handleAddManyToCalendar(contests, response => {
+    const elapsedMs = performance.now() - start;
+    console.log(JSON.stringify({ elapsedMs, progressEvents, ...response, results: undefined }));
+}, () => progressEvents++, Number(CONCURRENCY));
+"""
+
+
+# quota_rps=None keeps the shipped CALENDAR_QUOTA; 0 turns client pacing off
+def run_node(node, tmp, base_url, concurrency, quota_rps):
+    env = dict(os.environ, BASE_URL=base_url, CONCURRENCY=str(concurrency),
+               QUOTA_RPS="" if quota_rps is None else str(quota_rps), BACKOFF_MS=str(BACKOFF_MS))
+    output = subprocess.run(
+        [node, os.path.join(tmp, "driver.js"), os.path.join(tmp, "background.js"),
+         os.path.join(tmp, "contests.json")],
+        env=env, capture_output=True, text=True, timeout=600, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(node, tmp, label, concurrency, quota_rps=None, server_quota=None):
+    with FakeCalendarServer(latency=LATENCY, fail_rate=FAIL_RATE, lost_rate=LOST_RATE, seed=concurrency,
+                            quota_per_second=server_quota) as server:
+        result = run_node(node, tmp, server.base_url, concurrency, quota_rps)
+        calendar = server.calendar
+        stored = calendar.event_count()
+    print(f"{label:<22}{concurrency:>5}{result['elapsedMs'] / 1000:>9.2f} s"
+          f"{calendar.http_requests:>9}{calendar.rate_limited:>9}{stored:>8}{result['failed']:>8}"
+          f"{result['progressEvents']:>10}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time bulk calendar inserts at several concurrency levels")
+    parser.add_argument("contests", nargs="?", type=int, default=200)
+    parser.add_argument("--node", default=shutil.which("node"), help="Node.js binary (18+)")
+    args = parser.parse_args()
+    if not args.node:
+        print("Node.js not found; pass --node", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, content in (("driver.js", DRIVER), ("background.js", background_js),
+                              ("contests.json", json.dumps(make_contests(args.contests)))):
+            with open(os.path.join(tmp, name), "w", encoding="utf-8") as f:
+                f.write(content)
+
+        print(f"{args.contests} contests, {LATENCY * 1000:.0f} ms latency, "
+              f"{FAIL_RATE:.0%} transient failures, {LOST_RATE:.0%} lost responses")
+        print(f"{'':<22}{'conc':>5}{'wall':>11}{'requests':>9}{'403s':>9}{'events':>8}"
+              f"{'failed':>8}{'progress':>10}")
+        for concurrency in (1, 4, 16):
+            run(args.node, tmp, f"shipped quota {SHIPPED_QUOTA}/s", concurrency)
+        for concurrency in (1, 4, 16):
+            run(args.node, tmp, "pacing off *", concurrency, quota_rps=0)
+        print("* client pacing disabled: not representative of the extension")
+
+        print(f"\nserver quota {SERVER_QUOTA} requests/s per user")
+        run(args.node, tmp, "unpaced", 16, quota_rps=0, server_quota=SERVER_QUOTA)
+        run(args.node, tmp, f"paced {SERVER_QUOTA}/s", 16, quota_rps=SERVER_QUOTA,
+            server_quota=SERVER_QUOTA)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
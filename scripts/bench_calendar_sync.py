@@ -0,0 +1,64 @@
+# Benchmark: per-event POSTs vs the batched sync engine, against the fake server
+#
+# Usage: python scripts/bench_calendar_sync.py [accounts] [contests_per_account]
+import json
+import sys
+import time
+import urllib.request
+
+from calendar_event import build_calendar_event
+from calendar_sync import EVENTS_PATH, CalendarSyncEngine
+from fake_calendar_server import FakeCalendarServer
+from fixtures import make_contests
+
+LATENCY = 0.005  # seconds per HTTP round trip
+
+
+# What the extension does today: one POST per contest, one account after another
+def per_event(base_url, accounts):
+    for token, contests in accounts.values():
+        for contest in contests:
+            request = urllib.request.Request(
+                base_url + EVENTS_PATH,
+                data=json.dumps(build_calendar_event(contest)).encode(),
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+                method="POST",
+            )
+            urllib.request.urlopen(request).read()
+
+
+def run(label, accounts, fn, **server_options):
+    with FakeCalendarServer(latency=LATENCY, **server_options) as server:
+        start = time.perf_counter()
+        results = fn(server.base_url, accounts)
+        elapsed = time.perf_counter() - start
+        stored = server.calendar.event_count()
+        print(f"{label:<28}{elapsed:>9.3f} s{server.calendar.http_requests:>10} requests"
+              f"{stored:>10} events")
+        return results
+
+
+def batched(base_url, accounts):
+    with CalendarSyncEngine(base_url, max_connections=8, max_accounts=8,
+                            backoff_seconds=0.01) as engine:
+        return engine.sync_accounts(accounts)
+
+
+def main():
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    contest_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    contests = make_contests(contest_count)
+    accounts = {f"user{i}": (f"token-{i}", contests) for i in range(account_count)}
+    expected = account_count * contest_count
+
+    print(f"{account_count} accounts x {contest_count} contests ({expected} events)")
+    run("per-event POST", accounts, per_event)
+    run("batched", accounts, batched)
+
+    results = run("batched, 10% failures", accounts, batched, fail_rate=0.1, seed=7)
+    failed = sum(1 for items in results.values() for item in items if item.status != 200)
+    print(f"operations still failing after retries: {failed}")
+
+
+if __name__ == "__main__":
+    main()
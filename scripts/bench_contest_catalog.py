@@ -0,0 +1,139 @@
+# Benchmark: SQLite contest catalog vs filtering the cached JSON list
+#
+# Generates a CodeForces-like archive, then replays 10k refreshes into the
+# catalog: each refresh is the contest.list slice a client would see at that
+# moment (recently finished, running and upcoming rounds, with phases as of
+# that time), upserted in one transaction. Afterwards every query is timed
+# against the catalog and against filtering the same contests in Python,
+# both from the JSON string (what background.js keeps cached) and from an
+# already-parsed list. Queries that return thousands of rows (by type, by
+# division) are dominated by building the result rows and stay slower than
+# filtering a parsed list; the catalog wins on selective queries and over
+# re-parsing the JSON.
+#
+# Usage: python scripts/bench_contest_catalog.py [snapshots] [contests]
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from contest_catalog import ContestCatalog
+from contest_classifier import in_division
+
+DAY = 86400
+T0 = 1_600_000_000
+KINDS = (
+    ("Codeforces Round {n} (Div. 2)", "CF"),
+    ("Codeforces Round {n} (Div. 1 + Div. 2)", "CF"),
+    ("Codeforces Round {n} (Div. 3)", "ICPC"),
+    ("Educational Codeforces Round {n} (Rated for Div. 2)", "ICPC"),
+    ("Codeforces Round {n} (Div. 4)", "ICPC"),
+    ("Codeforces Global Round {n}", "CF"),
+)
+
+
+def make_archive(count, rng):
+    contests = []
+    start = T0
+    for i in range(count):
+        start += rng.randint(DAY // 4, 2 * DAY) // 300 * 300
+        template, contest_type = rng.choice(KINDS)
+        contests.append({
+            "id": 1000 + i,
+            "name": template.format(n=i),
+            "startTimeSeconds": start,
+            "durationSeconds": rng.choice((7200, 8100, 9000, 10800)),
+            "type": contest_type,
+        })
+    return contests
+
+
+def phase_at(contest, now):
+    if now < contest["startTimeSeconds"]:
+        return "BEFORE"
+    if now < contest["startTimeSeconds"] + contest["durationSeconds"]:
+        return "CODING"
+    return "FINISHED"
+
+
+# contest.list as seen at `now`: two days of history and three weeks ahead
+def snapshot_at(archive, now):
+    return [
+        dict(contest, phase=phase_at(contest, now))
+        for contest in archive
+        if now - 2 * DAY <= contest["startTimeSeconds"] < now + 21 * DAY
+    ]
+
+
+def time_ms(fn, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    snapshots = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    rng = random.Random(11)
+    archive = make_archive(count, rng)
+    span = archive[-1]["startTimeSeconds"] - T0
+    times = [T0 + span * k // snapshots for k in range(snapshots)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.sqlite")
+        upsert_ms, written = [], 0
+        with ContestCatalog(path) as catalog:
+            # Walk the archive with a sliding window instead of rescanning it per snapshot
+            lo = hi = 0
+            for now in times:
+                while lo < count and archive[lo]["startTimeSeconds"] < now - 2 * DAY:
+                    lo += 1
+                while hi < count and archive[hi]["startTimeSeconds"] < now + 21 * DAY:
+                    hi += 1
+                snapshot = snapshot_at(archive[lo:hi], now)
+                start = time.perf_counter()
+                written += catalog.upsert(snapshot)
+                upsert_ms.append((time.perf_counter() - start) * 1000)
+            print(f"{snapshots} refreshes upserted, {written} rows written, {len(catalog)} contests stored")
+            print(f"upsert per refresh: median {statistics.median(upsert_ms):.2f} ms, "
+                  f"max {max(upsert_ms):.2f} ms, total {sum(upsert_ms) / 1000:.1f} s")
+            print(f"database {sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp)) / 2**20:.2f} MB")
+
+            # Final state as the JSON list background.js would cache
+            stored = catalog.in_window(0, 2**62)
+            cached = json.dumps(stored)
+            now = times[-1] - 10 * DAY
+            window = (now - 30 * DAY, now)
+            queries = (
+                ("upcoming",
+                 lambda: catalog.upcoming(now),
+                 lambda contests: sorted(
+                     (c for c in contests if c["phase"] == "BEFORE" and c["startTimeSeconds"] > now),
+                     key=lambda c: c["startTimeSeconds"])),
+                ("by type ICPC",
+                 lambda: catalog.by_type("ICPC"),
+                 lambda contests: [c for c in contests if c["type"] == "ICPC"]),
+                ("by division 3",
+                 lambda: catalog.by_division(3),
+                 lambda contests: in_division(contests, 3)),
+                ("30-day window",
+                 lambda: catalog.in_window(*window),
+                 lambda contests: [c for c in contests if window[0] <= c["startTimeSeconds"] < window[1]]),
+            )
+            print(f"{'query':<16}{'rows':>7}{'sqlite (ms)':>13}{'json (ms)':>11}{'list (ms)':>11}")
+            for label, query, python_filter in queries:
+                sql_ms, rows = time_ms(query)
+                json_ms, expected = time_ms(lambda: python_filter(json.loads(cached)), repeat=10)
+                list_ms, _ = time_ms(lambda: python_filter(stored), repeat=10)
+                assert [c["id"] for c in rows] == [c["id"] for c in expected], label
+                print(f"{label:<16}{len(rows):>7}{sql_ms:>13.3f}{json_ms:>11.3f}{list_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Benchmark: memoized contest name classification
+#
+# Classifies a contest history (every round plus its mirrors and re-listings,
+# as contest.list and the history store return them) three ways: per contest
+# without the memo, in bulk with a cold memo, and in bulk again once the memo
+# is warm, as on the next render or sync.
+#
+# Usage: python scripts/bench_contest_classifier.py [rounds] [passes]
+import random
+import sys
+import time
+
+from contest_classifier import classify, classify_all
+
+TEMPLATES = (
+    "Codeforces Round {n} (Div. 2)",
+    "Codeforces Round {n} (Div. 1 + Div. 2)",
+    "Codeforces Round {n} (Div. 1 + 2)",
+    "Codeforces Round {n} (Div. 3)",
+    "Codeforces Round {n} (Div. 4)",
+    "Educational Codeforces Round {n} (Rated for Div. 2)",
+    "Codeforces Global Round {n}",
+    "CodeTON Round {n} (Div. 1 + Div. 2, Rated, Prizes!)",
+    "Codeforces Round #{n} (Div. 2, based on VK Cup 2019)",
+)
+
+
+def make_history(rounds, rng):
+    names = [rng.choice(TEMPLATES).format(n=n) for n in range(rounds)]
+    # Mirrors and re-listings repeat names across the history
+    names += [rng.choice(names) for _ in range(rounds)]
+    return [{"id": i, "name": name} for i, name in enumerate(names)]
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 8_000
+    passes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    history = make_history(rounds, random.Random(2))
+    unmemoized = classify.__wrapped__
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        for contest in history:
+            unmemoized(contest["name"])
+    baseline = (time.perf_counter() - start) / passes
+
+    classify.cache_clear()
+    start = time.perf_counter()
+    classify_all(history)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        classify_all(history)
+    warm = (time.perf_counter() - start) / passes
+
+    info = classify.cache_info()
+    print(f"{len(history)} contests, {rounds} distinct rounds")
+    for label, seconds in (
+        ("per contest, no memo", baseline),
+        ("bulk pass, cold memo", cold),
+        ("bulk pass, warm memo", warm),
+    ):
+        print(f"{label:<32}{seconds * 1000:>9.1f} ms{seconds * 1e9 / len(history):>9.0f} ns/contest")
+    print(f"memo: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} entries")
+
+
+if __name__ == "__main__":
+    main()
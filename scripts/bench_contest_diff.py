@@ -0,0 +1,64 @@
+# Benchmark: typed snapshot diffs against a bare record comparison
+#
+# Builds snapshots of growing size, changes about 1% of the records
+# (reschedules, renames, removals and additions) and times SnapshotDiffer
+# against the least a refresh can do: look up each new record's previous
+# version by id and compare the two dicts. Both start from the previous
+# snapshot's index, as on a refresh.
+#
+# Usage: python scripts/bench_contest_diff.py
+import random
+import time
+
+from contest_diff import SnapshotDiffer, delta
+from fixtures import make_contests
+
+
+def make_snapshot(count):
+    return make_contests(count, first_id=0, spacing=3600)
+
+
+def mutate(snapshot, rng, share=0.01):
+    contests = [dict(contest) for contest in snapshot]
+    for _ in range(int(len(contests) * share)):
+        contest = rng.choice(contests)
+        kind = rng.randrange(3)
+        if kind == 0:
+            contest["startTimeSeconds"] += 3600
+        elif kind == 1:
+            contest["name"] += " (rated)"
+        else:
+            contest["phase"] = "CODING"
+    del contests[::500]
+    contests.append(dict(contests[-1], id=len(snapshot) + 1))
+    return contests
+
+
+# Baseline: the changed and added records, with no typed changes or removals
+def direct_changed(before, new):
+    return [contest for contest in new if before.get(contest["id"]) != contest]
+
+
+def main():
+    rng = random.Random(3)
+    print(f"{'contests':>10}{'differ (ms)':>14}{'direct (ms)':>13}{'changes':>10}{'updated':>10}")
+    for count in (10_000, 100_000, 400_000):
+        old = make_snapshot(count)
+        new = mutate(old, rng)
+        # Previous snapshot already indexed on both sides, as on a refresh
+        differ = SnapshotDiffer(old)
+        before = {contest["id"]: contest for contest in old}
+
+        start = time.perf_counter()
+        changes = differ.update(new)
+        differ_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        direct_changed(before, new)
+        direct_ms = (time.perf_counter() - start) * 1000
+        print(f"{count:>10}{differ_ms:>14.1f}{direct_ms:>13.1f}{len(changes):>10}"
+              f"{len(delta(changes).updated):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Benchmark: bytes per contest for dicts vs Contest vs ContestTable
+#
+# Usage: python scripts/bench_contest_model.py [count]
+import json
+import sys
+import tracemalloc
+
+from contest_model import Contest, ContestTable
+from fixtures import make_contests
+
+
+def make_payload(count):
+    # Decode from JSON so every record owns its strings, as with a real API response
+    return json.dumps(make_contests(count, first_id=100000, phase="FINISHED", varied=True))
+
+
+def measure(build, payload):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build(json.loads(payload))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    payload = make_payload(count)
+    original = json.loads(payload)
+
+    builders = [
+        ("dict", lambda data: data),
+        ("Contest", lambda data: [Contest.from_dict(c) for c in data]),
+        ("ContestTable", ContestTable.from_dicts),
+    ]
+
+    print(f"{count} contests")
+    print(f"{'representation':<16}{'bytes/contest':>14}")
+    for label, build in builders:
+        result, used = measure(build, payload)
+        if label == "Contest":
+            assert [c.to_dict() for c in result] == original
+        elif label == "ContestTable":
+            assert result.to_dicts() == original
+            assert json.loads(result.to_json()) == original
+        print(f"{label:<16}{used / count:>14.1f}")
+        del result
+
+
+if __name__ == "__main__":
+    main()
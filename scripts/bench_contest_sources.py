@@ -0,0 +1,67 @@
+# Benchmark: end-to-end refresh latency of the async contest fan-out
+#
+# Two local contest.list stand-ins inject latency; the gym source is
+# occasionally very slow. Reports p50/p99 refresh latency when waiting for
+# every source vs returning at a deadline with the last good gym data.
+#
+# Usage: python scripts/bench_contest_sources.py [refreshes]
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from contest_sources import ContestAggregator, HttpContestSource
+from fake_codeforces_server import FakeCodeforcesServer
+from fixtures import make_contests
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(aggregator, refreshes, deadline):
+    samples = []
+    for _ in range(refreshes):
+        start = time.perf_counter()
+        contests = await aggregator.refresh(deadline=deadline)
+        samples.append(time.perf_counter() - start)
+        assert contests
+    # Let stragglers finish so they do not leak into the next run
+    await asyncio.gather(*aggregator.inflight.values())
+    return samples
+
+
+def main():
+    refreshes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rng = random.Random(3)
+    now = int(time.time())
+
+    def main_latency():
+        return rng.uniform(0.02, 0.06)
+
+    def gym_latency():
+        return 1.0 if rng.random() < 0.05 else rng.uniform(0.03, 0.09)
+
+    contests = make_contests(20, first_id=2100, start=now + 3600, spacing=3600, newest_first=True)
+    gym_contests = make_contests(50, first_id=105000, start=now + 3600, spacing=3600, newest_first=True)
+    with FakeCodeforcesServer(contests=contests, latency=main_latency) as main_api, \
+            FakeCodeforcesServer(gym_contests=gym_contests, latency=gym_latency) as gym_api:
+        sources = [
+            HttpContestSource("codeforces", main_api.contest_list_url, timeout=2.0),
+            HttpContestSource("codeforces-gym", gym_api.contest_list_url + "?gym=true", timeout=2.0),
+        ]
+
+        print(f"{refreshes} refreshes")
+        print(f"{'mode':<22}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+        for label, deadline in (("wait for all sources", None), ("deadline 150 ms", 0.15)):
+            aggregator = ContestAggregator(sources)
+            asyncio.run(aggregator.refresh())  # warm up so stale gym data exists
+            samples = asyncio.run(measure(aggregator, refreshes, deadline))
+            print(f"{label:<22}{statistics.median(samples) * 1000:>10.1f}"
+                  f"{percentile(samples, 0.99) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Benchmark: a year of contest.list snapshots in the columnar contest store
+#
+# Appends one snapshot per day of a growing CodeForces-like archive (each
+# day adds rounds, moves a few start times and finishes the rounds that
+# started), then reopens the file and times the read paths. Resident memory
+# is sampled from /proc so the effect of mmap reads is visible.
+#
+# Usage: python scripts/bench_contest_store.py [days] [initial_contests]
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from contest_store import ContestStore
+from fixtures import DAY, make_contests
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def history(days, initial, seed=5):
+    rng = random.Random(seed)
+    t0 = 1_700_000_000
+    archive = make_contests(initial, first_id=0, start=t0 - initial * DAY // 3, spacing=DAY // 3,
+                            phase="FINISHED")
+    contests = {contest["id"]: contest for contest in archive}
+    next_id = initial
+    for day in range(days):
+        now = t0 + day * DAY
+        for _ in range(rng.randint(0, 2)):
+            contests[next_id] = {"id": next_id, "name": f"Codeforces Round {next_id}",
+                                 "startTimeSeconds": now + rng.randint(3, 14) * DAY,
+                                 "durationSeconds": rng.choice((7200, 9000, 10800)),
+                                 "type": rng.choice(("CF", "ICPC")), "phase": "BEFORE"}
+            next_id += 1
+        for contest in contests.values():
+            if contest["phase"] == "BEFORE" and contest["startTimeSeconds"] <= now:
+                contest["phase"] = "FINISHED"
+            elif contest["phase"] == "BEFORE" and rng.random() < 0.02:
+                contest["startTimeSeconds"] += 3600
+        yield now, [dict(contest) for contest in contests.values()]
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    initial = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "contests.store")
+        json_bytes = 0
+        start = time.perf_counter()
+        with ContestStore(path) as store:
+            for now, snapshot in history(days, initial):
+                store.append_snapshot(snapshot, snapshot_time=now)
+                json_bytes += len(json.dumps(snapshot))
+            last = snapshot
+        build = time.perf_counter() - start
+        size = os.path.getsize(path)
+        print(f"{days} daily snapshots of {initial}-{len(last)} contests, appended in {build:.1f} s")
+        print(f"store {size / 2**20:.2f} MB vs {json_bytes / 2**20:.1f} MB of full JSON snapshots")
+
+        before = rss_mb()
+        start = time.perf_counter()
+        store = ContestStore(path)
+        opened = time.perf_counter() - start
+
+        start = time.perf_counter()
+        latest = store.state_at()
+        scan = time.perf_counter() - start
+
+        lo = last[-1]["startTimeSeconds"] - 30 * DAY
+        start = time.perf_counter()
+        window = store.contests_between(lo, lo + 30 * DAY)
+        query = time.perf_counter() - start
+
+        start = time.perf_counter()
+        versions = sum(1 for _ in store.rows_between(lo, lo + 30 * DAY))
+        versions_time = time.perf_counter() - start
+        grown = rss_mb() - before
+
+        for label, value, unit in (
+            (f"open ({len(store.blocks)} blocks)", opened * 1000, "ms"),
+            (f"latest snapshot ({len(latest)} rows)", scan * 1000, "ms"),
+            (f"30-day range ({len(window)} contests)", query * 1000, "ms"),
+            (f"30-day history ({versions} versions)", versions_time * 1000, "ms"),
+            ("RSS growth", grown, "MB"),
+        ):
+            print(f"{label:<34}{value:>8.2f} {unit}")
+        assert sorted(latest, key=lambda c: c["id"]) == sorted(last, key=lambda c: c["id"])
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Benchmark: streaming contest.list parser vs json.load
+#
+# Usage: python scripts/bench_contest_stream.py [recorded_contest_list.json]
+# Without an argument a 10k-contest payload shaped like the real API response
+# is generated into a temporary file.
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from contest_stream import iter_upcoming_contests
+from fixtures import DAY, make_contests
+
+FIXTURE_SIZE = 10000
+UPCOMING = 10
+
+
+def write_fixture(path, size=FIXTURE_SIZE, upcoming=UPCOMING):
+    now = int(time.time())
+    # Newest first: ids count down from 3000, the first `upcoming` still ahead
+    result = make_contests(size, first_id=3001 - size, start=now + (upcoming - size + 1) * 3 * DAY,
+                           spacing=3 * DAY, varied=True, newest_first=True)
+    for contest in result:
+        contest["phase"] = "BEFORE" if contest["startTimeSeconds"] > now else "FINISHED"
+        contest["frozen"] = False
+        contest["relativeTimeSeconds"] = now - contest["startTimeSeconds"]
+    with open(path, "w") as f:
+        json.dump({"status": "OK", "result": result}, f)
+
+
+def with_json_load(path):
+    with open(path, "rb") as f:
+        data = json.load(f)
+    return [c for c in data["result"] if c["phase"] == "BEFORE"]
+
+
+def with_stream(path):
+    with open(path, "rb") as f:
+        return list(iter_upcoming_contests(f))
+
+
+def measure(fn, path, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    contests = fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return contests, best, peak
+
+
+def main():
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        write_fixture(path)
+
+    try:
+        print(f"Fixture: {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+        baseline, load_time, load_peak = measure(with_json_load, path)
+        streamed, stream_time, stream_peak = measure(with_stream, path)
+        assert streamed == baseline, "stream parser disagrees with json.load"
+
+        print(f"{'method':<12}{'time (ms)':>12}{'peak (KiB)':>14}")
+        print(f"{'json.load':<12}{load_time * 1000:>12.2f}{load_peak / 1024:>14.1f}")
+        print(f"{'stream':<12}{stream_time * 1000:>12.2f}{stream_peak / 1024:>14.1f}")
+        print(f"Upcoming contests: {len(streamed)}")
+    finally:
+        if len(sys.argv) == 1:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Benchmark: NumPy batch formatter vs the per-row loop from script_1.py
+#
+# Usage: python scripts/bench_contest_timefmt.py [rows]
+import random
+import sys
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from contest_timefmt import POPUP_TIMEZONES, format_contest_times
+
+FORMAT = "%B %d, %Y at %I:%M %p"
+
+
+def per_row(start_seconds, duration_seconds, zones):
+    formatted = {}
+    for zone_name in zones:
+        zone = ZoneInfo(zone_name)
+        starts, ends = [], []
+        for start, duration in zip(start_seconds, duration_seconds):
+            start_time = datetime.fromtimestamp(start, zone)
+            starts.append(start_time.strftime(FORMAT))
+            end_time = datetime.fromtimestamp(start + duration, zone)
+            ends.append(end_time.strftime(FORMAT))
+        formatted[zone_name] = (starts, ends)
+    return formatted
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(42)
+    # Contest history spans 2010 onwards and crosses plenty of DST transitions
+    start_seconds = [rng.randrange(1262304000, 1830000000, 300) for _ in range(rows)]
+    duration_seconds = [rng.choice((5400, 7200, 9000, 10800)) for _ in range(rows)]
+
+    start = time.perf_counter()
+    expected = per_row(start_seconds, duration_seconds, POPUP_TIMEZONES)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = format_contest_times(start_seconds, duration_seconds)
+    batch_time = time.perf_counter() - start
+
+    for zone_name in POPUP_TIMEZONES:
+        assert list(batched[zone_name][0]) == expected[zone_name][0], zone_name
+        assert list(batched[zone_name][1]) == expected[zone_name][1], zone_name
+
+    # Warm caches: per-zone transitions are already computed
+    start = time.perf_counter()
+    format_contest_times(start_seconds, duration_seconds)
+    warm_time = time.perf_counter() - start
+
+    print(f"{rows} rows x {len(POPUP_TIMEZONES)} zones")
+    print(f"per-row loop   {loop_time:8.3f} s")
+    print(f"batch (cold)   {batch_time:8.3f} s")
+    print(f"batch (warm)   {warm_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Benchmark page: keyed and virtual contest rendering vs full innerHTML rebuilds
+#
+# Writes dist/bench/render.html, the popup markup plus popup.js, a stand-in
+# for the chrome.* APIs and a driver that renders 1,000 contests, then
+# updates a few of them every frame. Open it in Chrome; frame times for the
+# keyed renderer, the virtual list and the old innerHTML rebuild are printed
+# on the page. Each run calls its render path directly, so renderContests()'s
+# VIRTUAL_LIST_THRESHOLD does not pick the mode.
+#
+# Usage: python scripts/bench_render.py [out_dir]
+import os
+import sys
+
+from build import DIST_DIR
+from fixtures import popup_chrome_stub
+from script_4 import popup_js
+from script_5 import popup_html
+
+CHROME_STUB = popup_chrome_stub("benchmark", {"fetchContests": "{ success: true, contests: [] }"})
+
+DRIVER = """
+// Renders CONTESTS cards, then changes UPDATES_PER_FRAME of them on each of FRAMES frames
+(() => {
+    const CONTESTS = 1000;
+    const FRAMES = 120;
+    const UPDATES_PER_FRAME = 10;
+
+    function makeContests() {
+        const now = Math.floor(Date.now() / 1000);
+        return Array.from({ length: CONTESTS }, (_, i) => ({
+            id: 3000 + i,
+            name: `Codeforces Round ${1000 + i} (Div. ${1 + i % 3})`,
+            startTimeSeconds: now + i * 3600,
+            durationSeconds: 7200,
+            type: 'CF',
+            phase: 'BEFORE'
+        }));
+    }
+
+    // What renderContests() used to do on every call
+    function fullRebuild() {
+        contestsList.innerHTML = contests.map(contest => createContestCard(contest)).join('');
+        contests.forEach(contest => {
+            const button = document.getElementById(`add-btn-${contest.id}`);
+            if (button) {
+                button.addEventListener('click', () => handleAddToCalendar(contest));
+            }
+        });
+    }
+
+    function nextFrame() {
+        return new Promise(resolve => requestAnimationFrame(resolve));
+    }
+
+    function percentile(values, p) {
+        const sorted = [...values].sort((a, b) => a - b);
+        return sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+    }
+
+    // Leave no keyed cards or virtual container behind for the next run
+    function reset() {
+        teardownVirtualList();
+        renderedCards.clear();
+        contestsList.innerHTML = '';
+    }
+
+    async function run(label, render) {
+        reset();
+        contests = makeContests();
+
+        let start = performance.now();
+        render();
+        await nextFrame();
+        const initial = performance.now() - start;
+
+        const renderTimes = [];
+        const frameTimes = [];
+        let last = await nextFrame();
+        for (let frame = 0; frame < FRAMES; frame++) {
+            for (let i = 0; i < UPDATES_PER_FRAME; i++) {
+                const index = (frame * UPDATES_PER_FRAME + i * 97) % CONTESTS;
+                contests[index] = { ...contests[index], name: `${contests[index].name.split(' #')[0]} #${frame}` };
+            }
+            start = performance.now();
+            render();
+            renderTimes.push(performance.now() - start);
+            const now = await nextFrame();
+            frameTimes.push(now - last);
+            last = now;
+        }
+        reset();
+
+        return `${label.padEnd(14)} initial ${initial.toFixed(1).padStart(7)} ms` +
+            `  render p50 ${percentile(renderTimes, 0.5).toFixed(2).padStart(6)} ms` +
+            `  p95 ${percentile(renderTimes, 0.95).toFixed(2).padStart(6)} ms` +
+            `  frame p50 ${percentile(frameTimes, 0.5).toFixed(1).padStart(6)} ms` +
+            `  p95 ${percentile(frameTimes, 0.95).toFixed(1).padStart(6)} ms`;
+    }
+
+    window.addEventListener('load', async () => {
+        await new Promise(resolve => setTimeout(resolve, 100)); // let popup init settle
+        const results = [
+            `${CONTESTS} contests, ${UPDATES_PER_FRAME} changed per frame, ${FRAMES} frames`,
+            await run('keyed', renderKeyedContests),
+            await run('virtual', renderVirtualContests),
+            await run('innerHTML', fullRebuild)
+        ];
+        const output = document.createElement('pre');
+        output.id = 'bench-results';
+        output.textContent = results.join('\\n');
+        document.body.prepend(output);
+        console.log(output.textContent);
+    });
+})();
+"""
+
+
+def write_bench(out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "popup.js"), "w", encoding="utf-8") as f:
+        f.write(popup_js)
+    with open(os.path.join(out_dir, "chrome_stub.js"), "w", encoding="utf-8") as f:
+        f.write(CHROME_STUB)
+    with open(os.path.join(out_dir, "render_driver.js"), "w", encoding="utf-8") as f:
+        f.write(DRIVER)
+
+    html = popup_html.replace(
+        '<script src="popup.js"></script>',
+        '<script src="chrome_stub.js"></script>\n'
+        '    <script src="popup.js"></script>\n'
+        '    <script src="render_driver.js"></script>',
+    )
+    path = os.path.join(out_dir, "render.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return path
+
+
+if __name__ == "__main__":
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(DIST_DIR, "bench")
+    print(f"Open {write_bench(out_dir)} in Chrome")
@@ -0,0 +1,197 @@
+# Build the Chrome extension from the assets held in scripts/
+#
+# script_2.py .. script_5.py hold manifest.json, background.js, popup.js and
+# popup.html as Python values. This writes them (plus the icons) into dist/,
+# minifying the JavaScript and the popup's inline stylesheet, and leaves any
+# file whose content hash is unchanged untouched so reloads stay cheap.
+#
+# Usage:
+#   python scripts/build.py                   build into dist/
+#   python scripts/build.py --no-minify       readable build
+#   python scripts/build.py --check           fail if the checked-in copies drifted
+#   python scripts/build.py --contests cache.json
+#                                             prerender cached contests into popup.html
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from script_2 import manifest_json
+from script_3 import background_js
+from script_4 import popup_js
+from script_5 import popup_html
+from prerender import load_contests, prerender_popup
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIST_DIR = os.path.join(REPO_ROOT, "dist")
+ICON_DIR = "icons"
+
+# Characters after which a `/` starts a regular expression rather than a division
+_REGEX_PREFIX = set("(,=:[!&|?{};+-*%<>~^")
+
+
+# Strip comments and indentation from JavaScript, keeping line breaks for ASI.
+# String, template and regex literals are copied through untouched.
+def minify_js(source):
+    out = []
+    code = []
+    i = 0
+    length = len(source)
+    last_significant = ""
+
+    def flush_code():
+        text = re.sub(r"[ \t]*\n\s*", "\n", "".join(code))
+        out.append(re.sub(r"[ \t]+", " ", text))
+        code.clear()
+
+    while i < length:
+        char = source[i]
+        nxt = source[i + 1] if i + 1 < length else ""
+
+        if char in "'\"`":
+            end = i + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == "\\" else 1
+            flush_code()
+            out.append(source[i:end + 1])
+            i = end + 1
+            last_significant = char
+        elif char == "/" and nxt == "/":
+            while i < length and source[i] != "\n":
+                i += 1
+        elif char == "/" and nxt == "*":
+            end = source.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+            code.append(" ")
+        elif char == "/" and (last_significant in _REGEX_PREFIX or not last_significant):
+            end = i + 1
+            in_class = False
+            while end < length and (source[end] != "/" or in_class):
+                if source[end] == "\\":
+                    end += 1
+                elif source[end] == "[":
+                    in_class = True
+                elif source[end] == "]":
+                    in_class = False
+                end += 1
+            flush_code()
+            out.append(source[i:end + 1])
+            i = end + 1
+            last_significant = "/"
+        else:
+            code.append(char)
+            if not char.isspace():
+                last_significant = char
+            i += 1
+
+    flush_code()
+    return "".join(out).strip() + "\n"
+
+
+def minify_css(source):
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};,>])\s*", r"\1", source)
+    source = re.sub(r":\s+", ":", source)
+    return source.replace(";}", "}").strip()
+
+
+# Minify the popup's inline <style> block and drop indentation between tags
+def minify_html(source):
+    source = re.sub(
+        r"(<style[^>]*>)(.*?)(</style>)",
+        lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3),
+        source,
+        flags=re.S,
+    )
+    source = re.sub(r"<!--(?!\[).*?-->", "", source, flags=re.S)
+    lines = (line.strip() for line in source.split("\n"))
+    return "\n".join(line for line in lines if line) + "\n"
+
+
+# name -> text content of every generated asset
+def generate_assets(minify=True, contests=None, time_zone="UTC"):
+    assets = {
+        "manifest.json": json.dumps(manifest_json, indent=2) + "\n",
+        "background.js": background_js,
+        "popup.js": popup_js,
+        "popup.html": popup_html,
+    }
+    if contests:
+        assets["popup.html"] = prerender_popup(popup_html, contests, time_zone)
+    if minify:
+        assets["manifest.json"] = json.dumps(manifest_json, separators=(",", ":"))
+        assets["background.js"] = minify_js(assets["background.js"])
+        assets["popup.js"] = minify_js(assets["popup.js"])
+        assets["popup.html"] = minify_html(assets["popup.html"])
+    return assets
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_if_changed(path, data):
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if _digest(f.read()) == _digest(data):
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build(out_dir=DIST_DIR, minify=True, contests=None, time_zone="UTC"):
+    written, unchanged = [], []
+    assets = generate_assets(minify, contests, time_zone)
+    files = {name: text.encode("utf-8") for name, text in assets.items()}
+    for icon in sorted(os.listdir(os.path.join(REPO_ROOT, ICON_DIR))):
+        with open(os.path.join(REPO_ROOT, ICON_DIR, icon), "rb") as f:
+            files[f"{ICON_DIR}/{icon}"] = f.read()
+
+    for name, data in files.items():
+        path = os.path.join(out_dir, name)
+        (written if _write_if_changed(path, data) else unchanged).append(name)
+    return written, unchanged
+
+
+# Compare the checked-in, unminified copies at the repo root with scripts/
+def check():
+    drifted = []
+    for name, text in generate_assets(minify=False).items():
+        with open(os.path.join(REPO_ROOT, name), encoding="utf-8") as f:
+            if f.read() != text:
+                drifted.append(name)
+    return drifted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the extension into dist/")
+    parser.add_argument("--out", default=DIST_DIR, help="output directory (default: dist/)")
+    parser.add_argument("--no-minify", action="store_true", help="write readable assets")
+    parser.add_argument("--check", action="store_true",
+                        help="verify the checked-in assets match scripts/ and exit")
+    parser.add_argument("--contests", help="cached contest list to prerender into popup.html")
+    parser.add_argument("--timezone", default="UTC", help="timezone for prerendered start times")
+    args = parser.parse_args()
+
+    if args.check:
+        drifted = check()
+        for name in drifted:
+            print(f"{name} differs from its scripts/ source")
+        sys.exit(1 if drifted else 0)
+
+    contests = load_contests(args.contests) if args.contests else None
+    written, unchanged = build(args.out, not args.no_minify, contests, args.timezone)
+    for name in written:
+        print(f"wrote {os.path.join(args.out, name)}")
+    print(f"{len(written)} written, {len(unchanged)} unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Calendar event content shared by every output path
+#
+# Mirrors createCalendarEvent() in background.js (script_3.py) so the ICS
+# feed and the Python sync engines describe a contest exactly like the
+# extension does.
+import hashlib
+import json
+from datetime import datetime, timezone
+
+CONTEST_URL = "https://codeforces.com/contest/{id}"
+REMINDER_MINUTES = (30, 10)
+# Client-chosen event ids (base32hex) make a resent insert a 409, not a duplicate
+EVENT_ID_PREFIX = "cfcontest"
+
+
+def event_id(contest):
+    return f"{EVENT_ID_PREFIX}{contest['id']}"
+
+
+def contest_url(contest):
+    return CONTEST_URL.format(id=contest["id"])
+
+
+def event_description(contest):
+    return (
+        "CodeForces Contest\n\n"
+        f"Type: {contest['type']}\n"
+        f"Contest ID: {contest['id']}\n"
+        f"URL: {contest_url(contest)}\n\n"
+        "Good luck with the contest!"
+    )
+
+
+# Stable digest of a contest or event body, used to detect changed records
+def content_hash(data):
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def _iso_utc(timestamp):
+    # Same shape as Date.prototype.toISOString()
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+# Google Calendar event body, field for field what createCalendarEvent() sends
+def build_calendar_event(contest, time_zone="UTC"):
+    start = contest["startTimeSeconds"]
+    return {
+        "id": event_id(contest),
+        "summary": contest["name"],
+        "description": event_description(contest),
+        "start": {"dateTime": _iso_utc(start), "timeZone": time_zone},
+        "end": {"dateTime": _iso_utc(start + contest["durationSeconds"]), "timeZone": time_zone},
+        "reminders": {
+            "useDefault": False,
+            "overrides": [{"method": "popup", "minutes": minutes} for minutes in REMINDER_MINUTES],
+        },
+    }
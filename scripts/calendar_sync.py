@@ -0,0 +1,268 @@
+# Batched Google Calendar sync engine
+#
+# handleAddToCalendar() in background.js sends one POST per contest. This
+# engine builds the same events (calendar_event.build_calendar_event) and
+# sends them through the Calendar batch endpoint as multipart/mixed requests
+# of up to 50 operations. It reuses keep-alive connections from a shared pool
+# and syncs several accounts at once with bounded concurrency.
+import http.client
+import json
+import queue
+import random
+import time
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from calendar_event import build_calendar_event
+
+GOOGLE_API_ROOT = "https://www.googleapis.com"
+BATCH_PATH = "/batch/calendar/v3"
+EVENTS_PATH = "/calendar/v3/calendars/primary/events"
+BATCH_LIMIT = 50
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+# Google answers quota errors with 403 and one of these reasons
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+# One inner request of a batch; `key` is echoed back in the matching result
+CalendarOperation = namedtuple("CalendarOperation", "key method path body")
+CalendarResult = namedtuple("CalendarResult", "key status body")
+
+
+class CalendarSyncError(Exception):
+    pass
+
+
+# Multipart helpers (shared with fake_calendar_server.py)
+def encode_multipart(parts, boundary):
+    chunks = []
+    for headers, payload in parts:
+        chunks.append(f"--{boundary}\r\n".encode())
+        for name, value in headers.items():
+            chunks.append(f"{name}: {value}\r\n".encode())
+        chunks.append(b"\r\n" + payload + b"\r\n")
+    chunks.append(f"--{boundary}--\r\n".encode())
+    return b"".join(chunks)
+
+
+def split_multipart(content_type, body):
+    boundary = None
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        raise CalendarSyncError(f"No multipart boundary in {content_type!r}")
+
+    parts = []
+    for chunk in body.split(b"--" + boundary.encode())[1:]:
+        if chunk.startswith(b"--"):
+            break
+        head, _, payload = chunk.strip(b"\r\n").partition(b"\r\n\r\n")
+        parts.append((_parse_headers(head), payload))
+    return parts
+
+
+def _parse_headers(block):
+    headers = {}
+    for line in block.decode("latin-1").split("\r\n"):
+        if ":" in line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def encode_http_message(start_line, body=None, headers=None):
+    lines = [start_line]
+    payload = b""
+    if body is not None:
+        payload = json.dumps(body).encode("utf-8")
+        lines.append("Content-Type: application/json")
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + payload
+
+
+def parse_http_message(message):
+    head, _, payload = message.partition(b"\r\n\r\n")
+    start_line, _, header_block = head.partition(b"\r\n")
+    body = json.loads(payload) if payload.strip() else None
+    return start_line.decode("latin-1"), _parse_headers(header_block), body
+
+
+# A keep-alive connection the server closed while it sat in the pool: the send
+# is reset, or the connection ends before any byte of a status line. The server
+# never processed the request. Timeouts and anything later may have been applied.
+def _closed_while_idle(error, sent):
+    if isinstance(error, TimeoutError):
+        return False
+    if sent:
+        return isinstance(error, http.client.RemoteDisconnected)
+    return isinstance(error, (BrokenPipeError, ConnectionResetError))
+
+
+# Transient failures, and 403s that report a quota rather than a permission error
+def _retryable(result):
+    if result.status in RETRYABLE_STATUSES or result.status == 0:
+        return True
+    if result.status == 403 and isinstance(result.body, dict):
+        error = result.body.get("error") or {}
+        return any(e.get("reason") in RATE_LIMIT_REASONS for e in error.get("errors", ()))
+    return False
+
+
+# Fixed-size pool of keep-alive connections to one host
+class ConnectionPool:
+    def __init__(self, base_url, size=8, timeout=30):
+        parts = urlsplit(base_url)
+        self.connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self.netloc = parts.netloc
+        self.timeout = timeout
+        self.idle = queue.LifoQueue()
+        for _ in range(size):
+            self.idle.put(None)  # connections are opened lazily
+
+    def request(self, method, path, body=None, headers=None):
+        connection = self.idle.get()
+        try:
+            while True:
+                reused = connection is not None
+                if not reused:
+                    connection = self.connection_class(self.netloc, timeout=self.timeout)
+                sent = False
+                try:
+                    connection.request(method, path, body=body, headers=headers or {})
+                    sent = True
+                    response = connection.getresponse()
+                    return response.status, dict(response.getheaders()), response.read()
+                except (http.client.HTTPException, OSError) as error:
+                    connection.close()
+                    connection = None
+                    # Batches are not idempotent: resend (on a fresh connection)
+                    # only when a reused connection had gone stale
+                    if not (reused and _closed_while_idle(error, sent)):
+                        raise
+        finally:
+            self.idle.put(connection)
+
+    def close(self):
+        while not self.idle.empty():
+            connection = self.idle.get_nowait()
+            if connection is not None:
+                connection.close()
+
+
+class CalendarSyncEngine:
+    def __init__(self, base_url=GOOGLE_API_ROOT, max_connections=8, max_accounts=4,
+                 max_attempts=3, backoff_seconds=0.5):
+        self.pool = ConnectionPool(base_url, size=max_connections)
+        self.max_accounts = max_accounts
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Send one batch request; returns a CalendarResult per operation, in order
+    def send_batch(self, token, operations):
+        if len(operations) > BATCH_LIMIT:
+            raise CalendarSyncError(f"A batch holds at most {BATCH_LIMIT} operations")
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = [
+            (
+                {"Content-Type": "application/http", "Content-ID": f"<item-{index}>"},
+                encode_http_message(f"{op.method} {op.path} HTTP/1.1", op.body),
+            )
+            for index, op in enumerate(operations)
+        ]
+        status, headers, body = self.pool.request(
+            "POST",
+            BATCH_PATH,
+            body=encode_multipart(parts, boundary),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": f"multipart/mixed; boundary={boundary}",
+            },
+        )
+        if status != 200:
+            # The whole batch failed; report it (and its error body) on every operation
+            try:
+                error = json.loads(body) if body else None
+            except ValueError:
+                error = None
+            return [CalendarResult(op.key, status, error) for op in operations]
+
+        # Status 0: no response for that operation, so its outcome is unknown
+        results = [CalendarResult(op.key, 0, None) for op in operations]
+        content_type = {name.lower(): value for name, value in headers.items()}.get("content-type", "")
+        try:
+            parts = split_multipart(content_type, body)
+        except CalendarSyncError:
+            # No readable multipart body: fail the whole batch as unanswered
+            return results
+        for part_headers, payload in parts:
+            content_id = part_headers.get("content-id", "")
+            index = int(content_id.strip("<>").rsplit("-", 1)[-1])
+            start_line, _, inner_body = parse_http_message(payload)
+            results[index] = CalendarResult(
+                operations[index].key, int(start_line.split()[1]), inner_body
+            )
+        return results
+
+    # Run operations in batches of 50, retrying retryable failures with backoff
+    def execute(self, token, operations):
+        results = {}
+        pending = list(operations)
+        for attempt in range(self.max_attempts):
+            retry = []
+            for offset in range(0, len(pending), BATCH_LIMIT):
+                batch = pending[offset:offset + BATCH_LIMIT]
+                while batch:
+                    restores = []
+                    for op, result in zip(batch, self.send_batch(token, batch)):
+                        if result.status == 409 and op.method == "POST" and op.body and "id" in op.body:
+                            # Our id exists already: an earlier attempt whose response was
+                            # lost, or an event deleted since (Calendar keeps it as
+                            # cancelled). Confirm and update it, as background.js does.
+                            restores.append(CalendarOperation(
+                                op.key, "PATCH", f"{EVENTS_PATH}/{op.body['id']}",
+                                dict(op.body, status="confirmed"),
+                            ))
+                            continue
+                        results[op.key] = result
+                        if _retryable(result):
+                            retry.append(op)
+                    batch = restores
+            if not retry:
+                break
+            pending = retry
+            if attempt + 1 < self.max_attempts:
+                time.sleep(self.backoff_seconds * (2 ** attempt) * (0.5 + random.random()))
+        return [results[op.key] for op in operations]
+
+    def insert_contests(self, token, contests, time_zone="UTC"):
+        operations = [
+            CalendarOperation(contest["id"], "POST", EVENTS_PATH,
+                              build_calendar_event(contest, time_zone))
+            for contest in contests
+        ]
+        return self.execute(token, operations)
+
+    # accounts: {account: (token, contests)} -> {account: [CalendarResult, ...]}
+    def sync_accounts(self, accounts, time_zone="UTC"):
+        with ThreadPoolExecutor(max_workers=self.max_accounts) as executor:
+            futures = {
+                account: executor.submit(self.insert_contests, token, contests, time_zone)
+                for account, (token, contests) in accounts.items()
+            }
+            return {account: future.result() for account, future in futures.items()}
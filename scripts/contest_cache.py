@@ -0,0 +1,143 @@
+# Conditional-fetch cache for contest.list with stale-while-revalidate
+#
+# handleFetchContests() in background.js refetches the full list once a fixed
+# 5 minute CACHE_DURATION has passed. This cache keeps the raw payload on disk
+# next to its ETag/Last-Modified validators and the parsed upcoming contests.
+# Stale data is served immediately while one background request revalidates
+# it. Concurrent refreshes collapse into a single upstream request, both
+# across threads (single-flight) and across worker processes (a lock file).
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+
+from contest_stream import API_ENDPOINT, iter_upcoming_contests
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process single-flight only
+    fcntl = None
+
+CACHE_DURATION = 5 * 60  # seconds, same as background.js
+
+
+class ContestCache:
+    def __init__(self, cache_dir, url=API_ENDPOINT, max_age=CACHE_DURATION, timeout=30):
+        self.url = url
+        self.max_age = max_age
+        self.timeout = timeout
+        os.makedirs(cache_dir, exist_ok=True)
+        self.payload_path = os.path.join(cache_dir, "contest_list.json")
+        self.snapshot_path = os.path.join(cache_dir, "contest_list.snapshot.json")
+        self.lock_path = os.path.join(cache_dir, "contest_list.lock")
+
+        self.lock = threading.Lock()
+        self.flight = None
+        self.snapshot = None
+        self.upstream_requests = 0
+
+    def _load_snapshot(self):
+        try:
+            with open(self.snapshot_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_fresh(self, snapshot):
+        return snapshot is not None and time.time() - snapshot["fetchedAt"] < self.max_age
+
+    # Upcoming contests; never blocks on the network once anything is cached
+    def get(self):
+        with self.lock:
+            if self.snapshot is None:
+                self.snapshot = self._load_snapshot()
+            snapshot = self.snapshot
+
+        if snapshot is None:
+            return self.refresh().result()["contests"]
+        if not self._is_fresh(snapshot):
+            self.refresh()
+        return snapshot["contests"]
+
+    # Start (or join) a revalidation; returns a Future for the new snapshot
+    def refresh(self):
+        with self.lock:
+            if self.flight is not None:
+                return self.flight
+            flight = self.flight = Future()
+
+        threading.Thread(target=self._run_flight, args=(flight,), daemon=True).start()
+        return flight
+
+    def _run_flight(self, flight):
+        try:
+            snapshot = self._revalidate()
+        except Exception as error:
+            with self.lock:
+                self.flight = None
+            flight.set_exception(error)
+            return
+
+        with self.lock:
+            self.snapshot = snapshot
+            self.flight = None
+        flight.set_result(snapshot)
+
+    def _revalidate(self):
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # Another process may have refreshed while we waited for the lock
+            snapshot = self._load_snapshot()
+            if self._is_fresh(snapshot):
+                return snapshot
+            return self._fetch(snapshot)
+
+    def _fetch(self, snapshot):
+        headers = {}
+        if snapshot is not None and os.path.exists(self.payload_path):
+            if snapshot.get("etag"):
+                headers["If-None-Match"] = snapshot["etag"]
+            if snapshot.get("lastModified"):
+                headers["If-Modified-Since"] = snapshot["lastModified"]
+
+        request = urllib.request.Request(self.url, headers=headers)
+        self.upstream_requests += 1
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as error:
+            if error.code != 304:
+                raise
+            snapshot = dict(snapshot, fetchedAt=time.time())
+            self._write_snapshot(snapshot)
+            return snapshot
+
+        # Spool the raw payload to disk, then stream-parse just the upcoming block
+        tmp_path = self.payload_path + ".tmp"
+        with response, open(tmp_path, "wb") as f:
+            shutil.copyfileobj(response, f)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        with open(tmp_path, "rb") as f:
+            contests = list(iter_upcoming_contests(f))
+        os.replace(tmp_path, self.payload_path)
+
+        snapshot = {
+            "etag": etag,
+            "lastModified": last_modified,
+            "fetchedAt": time.time(),
+            "contests": contests,
+        }
+        self._write_snapshot(snapshot)
+        return snapshot
+
+    def _write_snapshot(self, snapshot):
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.snapshot_path)
@@ -0,0 +1,182 @@
+# SQLite contest catalog
+#
+# Persists contest records in the upcoming_contests shape (plus `phase`,
+# which background.js filters on) and answers the popup's questions with
+# indexed queries instead of filtering a JSON list: upcoming contests, by
+# type, by division and by start-time window. Each refresh is upserted in a
+# single transaction and rows that did not change are not rewritten. The
+# SQL strings are module constants, so sqlite3's statement cache keeps them
+# prepared across calls. Upserts go through one writer connection; each
+# reading thread gets its own connection, so under WAL queries keep reading
+# the last committed state while a refresh commits.
+import sqlite3
+import threading
+import time
+
+from contest_classifier import classify
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contests (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    start_time_seconds INTEGER NOT NULL,
+    duration_seconds INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    phase TEXT
+);
+CREATE INDEX IF NOT EXISTS contests_phase_start ON contests (phase, start_time_seconds);
+CREATE INDEX IF NOT EXISTS contests_type_start ON contests (type, start_time_seconds);
+CREATE INDEX IF NOT EXISTS contests_start ON contests (start_time_seconds);
+-- Keyed in start order so a division is read without sorting; rewritten with its contest
+CREATE TABLE IF NOT EXISTS contest_divisions (
+    division INTEGER NOT NULL,
+    start_time_seconds INTEGER NOT NULL,
+    contest_id INTEGER NOT NULL REFERENCES contests (id) ON DELETE CASCADE,
+    PRIMARY KEY (division, start_time_seconds, contest_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS contest_divisions_contest ON contest_divisions (contest_id);
+"""
+
+_COLUMNS = "id, name, start_time_seconds, duration_seconds, type, phase"
+
+_UPSERT = f"""
+INSERT INTO contests ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    name = excluded.name,
+    start_time_seconds = excluded.start_time_seconds,
+    duration_seconds = excluded.duration_seconds,
+    type = excluded.type,
+    phase = excluded.phase
+WHERE (name, start_time_seconds, duration_seconds, type, phase) IS NOT
+      (excluded.name, excluded.start_time_seconds, excluded.duration_seconds,
+       excluded.type, excluded.phase)
+"""
+_DELETE_DIVISIONS = "DELETE FROM contest_divisions WHERE contest_id = ?"
+_INSERT_DIVISION = """
+INSERT OR IGNORE INTO contest_divisions (division, start_time_seconds, contest_id) VALUES (?, ?, ?)
+"""
+
+_UPCOMING = f"""
+SELECT {_COLUMNS} FROM contests
+WHERE phase = 'BEFORE' AND start_time_seconds > ?
+ORDER BY start_time_seconds LIMIT ?
+"""
+_BY_TYPE = f"SELECT {_COLUMNS} FROM contests WHERE type = ? ORDER BY start_time_seconds LIMIT ?"
+_BY_DIVISION = f"""
+SELECT {', '.join('c.' + column for column in _COLUMNS.split(', '))}
+FROM contest_divisions d JOIN contests c ON c.id = d.contest_id
+WHERE d.division = ? ORDER BY d.start_time_seconds, d.contest_id LIMIT ?
+"""
+_IN_WINDOW = f"""
+SELECT {_COLUMNS} FROM contests
+WHERE start_time_seconds >= ? AND start_time_seconds < ?
+ORDER BY start_time_seconds LIMIT ?
+"""
+_IN_WINDOW_PHASE = f"""
+SELECT {_COLUMNS} FROM contests
+WHERE phase = ? AND start_time_seconds >= ? AND start_time_seconds < ?
+ORDER BY start_time_seconds LIMIT ?
+"""
+
+
+def _row_to_contest(row):
+    contest = {
+        "id": row[0],
+        "name": row[1],
+        "startTimeSeconds": row[2],
+        "durationSeconds": row[3],
+        "type": row[4],
+    }
+    if row[5] is not None:
+        contest["phase"] = row[5]
+    return contest
+
+
+class ContestCatalog:
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path, check_same_thread=False, cached_statements=32)
+        self.lock = threading.Lock()  # serializes use of the writer connection
+        self.local = threading.local()
+        self.readers = []
+        self.readers_lock = threading.Lock()
+        with self.lock:
+            # WAL lets the read connections run while a refresh commits
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("PRAGMA foreign_keys=ON")
+            with self.db:
+                self.db.executescript(_SCHEMA)
+
+    def close(self):
+        with self.readers_lock:
+            for reader in self.readers:
+                reader.close()
+            self.readers.clear()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Upsert one refresh in a single transaction; returns the number of rows written
+    def upsert(self, contests):
+        rows = [
+            (c["id"], c["name"], c["startTimeSeconds"], c["durationSeconds"], c["type"], c.get("phase"))
+            for c in contests
+        ]
+        with self.lock, self.db:
+            before = self.db.total_changes
+            changed = []
+            for row in rows:
+                # Row by row so unchanged contests can be told apart (and skipped below)
+                if self.db.execute(_UPSERT, row).rowcount:
+                    changed.append(row)
+            written = self.db.total_changes - before
+            self.db.executemany(_DELETE_DIVISIONS, ((row[0],) for row in changed))
+            self.db.executemany(_INSERT_DIVISION, (
+                (division, row[2], row[0]) for row in changed for division in classify(row[1]).divisions
+            ))
+        return written
+
+    # This thread's read connection
+    def _reader(self):
+        reader = getattr(self.local, "db", None)
+        if reader is None:
+            reader = sqlite3.connect(self.path, check_same_thread=False, cached_statements=32)
+            reader.execute("PRAGMA query_only=ON")
+            self.local.db = reader
+            with self.readers_lock:
+                self.readers.append(reader)
+        return reader
+
+    def _execute(self, sql, params=()):
+        if self.path == ":memory:":
+            # A second connection would open a different, empty database
+            with self.lock:
+                return self.db.execute(sql, params).fetchall()
+        return self._reader().execute(sql, params).fetchall()
+
+    def _query(self, sql, params):
+        return [_row_to_contest(row) for row in self._execute(sql, params)]
+
+    def upcoming(self, now=None, limit=-1):
+        now = int(time.time()) if now is None else now
+        return self._query(_UPCOMING, (now, limit))
+
+    def by_type(self, contest_type, limit=-1):
+        return self._query(_BY_TYPE, (contest_type, limit))
+
+    def by_division(self, division, limit=-1):
+        return self._query(_BY_DIVISION, (division, limit))
+
+    # Contests starting in [start, end), optionally only in one phase
+    def in_window(self, start, end, phase=None, limit=-1):
+        if phase is None:
+            return self._query(_IN_WINDOW, (start, end, limit))
+        return self._query(_IN_WINDOW_PHASE, (phase, start, end, limit))
+
+    def __len__(self):
+        return self._execute("SELECT COUNT(*) FROM contests")[0][0]
@@ -0,0 +1,106 @@
+# Contest name classifier
+#
+# Contest names carry what the contest.list schema does not: the divisions
+# ("Codeforces Round 934 (Div. 1 + Div. 2)"), the round kind (Educational,
+# Global, Div. 3, ...) and sponsor tags ("CodeTON Round 8", "... based on
+# VK Cup", "sponsored by ..."). classify() extracts them with patterns
+# compiled once at import and memoizes results by name, so filters and
+# reminder policies can ask per contest on every render or sync without
+# repeating regex work. classify_all() classifies a whole history in one
+# pass; repeated names (mirrors, re-listed rounds) are classified once.
+#
+# Usage: python scripts/contest_classifier.py "Educational Codeforces Round 160 (Rated for Div. 2)"
+import collections
+import functools
+import re
+import sys
+
+Classification = collections.namedtuple("Classification", "kind divisions number sponsors")
+
+# Round kinds, most specific first; division kinds are derived from the divisions found
+APRIL_FOOLS = "April Fools"
+KOTLIN_HEROES = "Kotlin Heroes"
+EDUCATIONAL = "Educational"
+GLOBAL = "Global"
+COMBINED = "Div. 1 + Div. 2"
+OTHER = "Other"
+
+_KINDS = (
+    (APRIL_FOOLS, re.compile(r"\bApril\s+Fools\b", re.IGNORECASE)),
+    (KOTLIN_HEROES, re.compile(r"\bKotlin\s+Heroes\b", re.IGNORECASE)),
+    (EDUCATIONAL, re.compile(r"\bEducational\b", re.IGNORECASE)),
+    (GLOBAL, re.compile(r"\bGlobal\s+Round\b", re.IGNORECASE)),
+)
+# "Div. 2", "Division 1", and combined "Div. 1 + Div. 2" or "Div. 1 + 2"
+_DIVISION = re.compile(
+    r"\bDiv(?:ision)?\.?\s*(\d)\b(?:\s*\+\s*(?:Div(?:ision)?\.?\s*)?(\d)\b)?", re.IGNORECASE
+)
+_NUMBER = re.compile(r"\bRound\s*#?\s*(\d+)\b", re.IGNORECASE)
+# "CodeTON Round 8", "Pinely Round 3": a sponsor's own round series
+_SERIES = re.compile(r"^\s*([A-Z][\w.\-]*(?:\s+[A-Z][\w.\-]*)*?)\s+Round\b")
+# "(Div. 2, based on VK Cup 2019)", "sponsored by Deltix", "powered by think-cell"
+_CREDIT = re.compile(r"\b(?:based\s+on|sponsored\s+by|supported\s+by|powered\s+by)\s+([^,()]+)", re.IGNORECASE)
+# Series that are Codeforces' own rather than a sponsor's
+_HOUSE_SERIES = frozenset(("codeforces", "educational codeforces", "codeforces global"))
+
+
+# Classification of one contest name; memoized by the name string
+@functools.lru_cache(maxsize=16384)
+def classify(name):
+    numbers = {number for match in _DIVISION.findall(name) for number in match if number}
+    divisions = tuple(sorted(int(number) for number in numbers))
+
+    kind = None
+    for label, pattern in _KINDS:
+        if pattern.search(name):
+            kind = label
+            break
+    if kind is None:
+        if divisions == (1, 2):
+            kind = COMBINED
+        elif len(divisions) == 1:
+            kind = f"Div. {divisions[0]}"
+        else:
+            kind = OTHER
+
+    number = _NUMBER.search(name)
+    sponsors = []
+    series = _SERIES.match(name)
+    if series and series.group(1).lower() not in _HOUSE_SERIES:
+        sponsors.append(series.group(1))
+    for credit in _CREDIT.findall(name):
+        sponsor = credit.strip()
+        if sponsor and sponsor not in sponsors:
+            sponsors.append(sponsor)
+    return Classification(kind, divisions, int(number.group(1)) if number else None, tuple(sponsors))
+
+
+# {contest id: Classification} for a whole contest list in one pass. Each
+# distinct name is classified once even when the list outgrows the memo.
+def classify_all(contests):
+    by_name = {}
+    result = {}
+    for contest in contests:
+        name = contest["name"]
+        classification = by_name.get(name)
+        if classification is None:
+            classification = by_name[name] = classify(name)
+        result[contest["id"]] = classification
+    return result
+
+
+# Contests whose name names `division` (combined rounds count for each of theirs)
+def in_division(contests, division):
+    return [contest for contest in contests if division in classify(contest["name"]).divisions]
+
+
+def main():
+    names = sys.argv[1:] or ["Codeforces Round (Div. 1 + Div. 2)"]
+    for name in names:
+        result = classify(name)
+        print(f"{name}\n  kind={result.kind} divisions={list(result.divisions)} "
+              f"number={result.number} sponsors={list(result.sponsors)}")
+
+
+if __name__ == "__main__":
+    main()
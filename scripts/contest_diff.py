@@ -0,0 +1,85 @@
+# Typed changes between two contest.list snapshots
+#
+# fetchAndCacheContests() replaces the cached list wholesale, so nothing
+# downstream knows what changed. diff_contests() compares two snapshots
+# keyed by contest id in a single pass: records are compared as whole dicts,
+# only unequal ones are compared field by field, and every difference becomes
+# its own record (a rescheduled and renamed round yields both).
+# SnapshotDiffer keeps the last snapshot's index, so each refresh only
+# indexes the new one; records are held by reference and must not be
+# mutated in place.
+import collections
+
+ContestAdded = collections.namedtuple("ContestAdded", "contest")
+ContestRemoved = collections.namedtuple("ContestRemoved", "contest")
+ContestRescheduled = collections.namedtuple("ContestRescheduled", "contest old_start new_start")
+DurationChanged = collections.namedtuple("DurationChanged", "contest old_duration new_duration")
+ContestRenamed = collections.namedtuple("ContestRenamed", "contest old_name new_name")
+TypeChanged = collections.namedtuple("TypeChanged", "contest old_type new_type")
+PhaseChanged = collections.namedtuple("PhaseChanged", "contest old_phase new_phase")
+
+# (field, change record) for every field a change record exists for
+_FIELD_CHANGES = (
+    ("startTimeSeconds", ContestRescheduled),
+    ("durationSeconds", DurationChanged),
+    ("name", ContestRenamed),
+    ("type", TypeChanged),
+    ("phase", PhaseChanged),
+)
+# Changes that alter the calendar event built from a contest (phase is not part of it)
+EVENT_CHANGES = (ContestRescheduled, DurationChanged, ContestRenamed, TypeChanged)
+
+# Minimal sets for consumers that only add, update and remove whole records
+Delta = collections.namedtuple("Delta", "added updated removed")
+
+
+# {contest id: contest} for a snapshot
+def index_snapshot(contests):
+    return {contest["id"]: contest for contest in contests}
+
+
+# Changes that turn the `old` index into the `new` one; new contests keep snapshot order
+def diff_indexes(old, new):
+    changes = []
+    for contest_id, contest in new.items():
+        before = old.get(contest_id)
+        if before is None:
+            changes.append(ContestAdded(contest))
+        elif before != contest:
+            for field, change in _FIELD_CHANGES:
+                if before.get(field) != contest.get(field):
+                    changes.append(change(contest, before.get(field), contest.get(field)))
+    for contest_id, contest in old.items():
+        if contest_id not in new:
+            changes.append(ContestRemoved(contest))
+    return changes
+
+
+def diff_contests(old, new):
+    return diff_indexes(index_snapshot(old), index_snapshot(new))
+
+
+# Collapse change records into whole-record add/update/remove lists.
+# Contests whose only change is their phase are left out of `updated`.
+def delta(changes):
+    added, removed, updated = [], [], {}
+    for change in changes:
+        if isinstance(change, ContestAdded):
+            added.append(change.contest)
+        elif isinstance(change, ContestRemoved):
+            removed.append(change.contest)
+        elif isinstance(change, EVENT_CHANGES):
+            updated[change.contest["id"]] = change.contest
+    return Delta(added, list(updated.values()), removed)
+
+
+class SnapshotDiffer:
+    def __init__(self, contests=()):
+        self.index = index_snapshot(contests)
+
+    # Diff against the previous snapshot and make `contests` the new baseline
+    def update(self, contests):
+        index = index_snapshot(contests)
+        changes = diff_indexes(self.index, index)
+        self.index = index
+        return changes
@@ -0,0 +1,160 @@
+# Offline iCalendar (RFC 5545) feed for the contest list
+#
+# Produces the same summary, description, URL and 30/10-minute reminders as
+# createCalendarEvent() in background.js, but as one static .ics file that any
+# number of calendar clients can subscribe to. Serialized VEVENTs are cached
+# by contest id and a hash of the event they produce, so a rebuild only
+# re-serializes contests whose event changed (not ones whose phase or
+# relativeTimeSeconds moved).
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+from calendar_event import (REMINDER_MINUTES, build_calendar_event, content_hash, contest_url,
+                            event_description)
+from contest_model import Contest
+
+PRODID = "-//CodeForces Calendar Extension//Contest Feed//EN"
+UID_DOMAIN = "codeforces.com"
+
+
+def _ics_escape(text):
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _ics_time(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+# Fold content lines at 75 octets without splitting a UTF-8 sequence
+def _fold(line):
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def serialize_event(contest, sequence=0, stamp=None):
+    stamp = stamp if stamp is not None else datetime.now(timezone.utc).timestamp()
+    start = contest["startTimeSeconds"]
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:contest-{contest['id']}@{UID_DOMAIN}",
+        f"DTSTAMP:{_ics_time(stamp)}",
+        f"SEQUENCE:{sequence}",
+        f"DTSTART:{_ics_time(start)}",
+        f"DTEND:{_ics_time(start + contest['durationSeconds'])}",
+        f"SUMMARY:{_ics_escape(contest['name'])}",
+        f"DESCRIPTION:{_ics_escape(event_description(contest))}",
+        f"URL:{contest_url(contest)}",
+    ]
+    for minutes in REMINDER_MINUTES:
+        lines += [
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            f"DESCRIPTION:{_ics_escape(contest['name'])}",
+            f"TRIGGER:-PT{minutes}M",
+            "END:VALARM",
+        ]
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+class IcsFeed:
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.events = {}  # contest id -> {"hash", "sequence", "start", "end", "ics"}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                self.events = {int(k): v for k, v in json.load(f).items()}
+
+    # Refresh cached VEVENTs for the given contests; returns (rebuilt, reused, removed)
+    def update(self, contests, now=None):
+        now = now if now is not None else time.time()
+        rebuilt = reused = 0
+        seen = set()
+        for contest in contests:
+            if isinstance(contest, Contest):
+                contest = contest.to_dict()
+            contest_id = contest["id"]
+            seen.add(contest_id)
+
+            digest = content_hash(build_calendar_event(contest))
+            cached = self.events.get(contest_id)
+            if cached and cached["hash"] == digest:
+                reused += 1
+                continue
+
+            sequence = cached["sequence"] + 1 if cached else 0
+            self.events[contest_id] = {
+                "hash": digest,
+                "sequence": sequence,
+                "start": contest["startTimeSeconds"],
+                "end": contest["startTimeSeconds"] + contest["durationSeconds"],
+                "ics": serialize_event(contest, sequence),
+            }
+            rebuilt += 1
+
+        # Contests that vanished before starting were cancelled; ones that
+        # started simply left an upcoming-only list and stay until they end
+        removed = [
+            contest_id for contest_id, event in self.events.items()
+            if contest_id not in seen and not event.get("start", 0) <= now < event.get("end", 0)
+        ]
+        for contest_id in removed:
+            del self.events[contest_id]
+        return rebuilt, reused, len(removed)
+
+    # Stream the calendar to any text file object
+    def write(self, fp):
+        fp.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+        fp.write(_fold(f"PRODID:{PRODID}"))
+        fp.write("CALSCALE:GREGORIAN\r\nMETHOD:PUBLISH\r\n")
+        fp.write("X-WR-CALNAME:CodeForces Contests\r\n")
+        for contest_id in sorted(self.events):
+            fp.write(self.events[contest_id]["ics"])
+        fp.write("END:VCALENDAR\r\n")
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.events, f)
+        os.replace(tmp_path, self.cache_path)
+
+
+# Rebuild `out_path` from `contests`, re-serializing only what changed
+def build_feed(contests, out_path, cache_path=None):
+    feed = IcsFeed(cache_path if cache_path is not None else out_path + ".cache.json")
+    stats = feed.update(contests)
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        feed.write(f)
+    os.replace(tmp_path, out_path)
+    feed.save_cache()
+    return stats
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Usage: python scripts/contest_ics.py contests.json contests.ics
+    with open(sys.argv[1]) as f:
+        data = json.load(f)
+    contests = data["contests"] if isinstance(data, dict) else data
+    rebuilt, reused, removed = build_feed(contests, sys.argv[2])
+    print(f"{sys.argv[2]}: {rebuilt} rebuilt, {reused} reused, {removed} removed")
@@ -0,0 +1,67 @@
+# Interval index over contest [start, start + duration) windows
+#
+# Contests are sorted by start time once; a max-end segment tree over that
+# order lets overlap queries skip every subtree that finished before the
+# window, so each query is O(log n + k log n) instead of a linear scan.
+from array import array
+from bisect import bisect_left, bisect_right
+
+from contest_model import ContestTable
+
+
+class ContestIndex:
+    def __init__(self, contests):
+        if not isinstance(contests, ContestTable):
+            contests = ContestTable.from_dicts(contests)
+        self.table = contests
+
+        order = sorted(range(len(contests)), key=contests.start_times.__getitem__)
+        self.rows = array("q", order)
+        self.starts = array("q", (contests.start_times[i] for i in order))
+        self.ends = array("q", (contests.start_times[i] + contests.durations[i] for i in order))
+
+        # Implicit binary tree: leaves hold end times, inner nodes the max of their children
+        size = 1
+        while size < len(order):
+            size *= 2
+        self.size = size
+        self.max_end = array("q", [-(2 ** 63)]) * (2 * size)
+        self.max_end[size:size + len(order)] = self.ends
+        for node in range(size - 1, 0, -1):
+            self.max_end[node] = max(self.max_end[2 * node], self.max_end[2 * node + 1])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _contest(self, position):
+        return self.table[self.rows[position]]
+
+    # Contests starting in [now, now + hours)
+    def upcoming_within(self, now, hours):
+        lo = bisect_left(self.starts, now)
+        hi = bisect_left(self.starts, now + int(hours * 3600))
+        return [self._contest(position) for position in range(lo, hi)]
+
+    # First contest starting strictly after `timestamp`, or None
+    def next_after(self, timestamp):
+        position = bisect_right(self.starts, timestamp)
+        if position == len(self.starts):
+            return None
+        return self._contest(position)
+
+    # Contests whose [start, end) intersects the busy window [window_start, window_end)
+    def overlapping(self, window_start, window_end):
+        limit = bisect_left(self.starts, window_end)
+        found = []
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= limit or self.max_end[node] <= window_start:
+                continue
+            if hi - lo == 1:
+                found.append(lo)
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        return [self._contest(position) for position in found]
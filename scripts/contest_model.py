@@ -0,0 +1,149 @@
+# Compact contest records
+#
+# script_1.py keeps each contest as a plain dict ({"id", "name",
+# "startTimeSeconds", "durationSeconds", "type"}). Contest is the same record
+# with __slots__, and ContestTable stores a whole contest list column-wise:
+# integers in array('q') and interned strings for names, types and phases.
+# Both convert back to the dict/JSON shape without loss.
+import json
+import sys
+from array import array
+
+# Fields of the upcoming_contests schema shared by every contest source
+SCHEMA_FIELDS = ("id", "name", "startTimeSeconds", "durationSeconds", "type", "phase")
+
+
+class Contest:
+    __slots__ = ("id", "name", "start_time_seconds", "duration_seconds", "type", "phase")
+
+    def __init__(self, id, name, start_time_seconds, duration_seconds, type, phase=None):
+        self.id = id
+        self.name = name
+        self.start_time_seconds = start_time_seconds
+        self.duration_seconds = duration_seconds
+        self.type = type
+        self.phase = phase
+
+    @property
+    def end_time_seconds(self):
+        return self.start_time_seconds + self.duration_seconds
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["id"],
+            sys.intern(data["name"]),
+            data["startTimeSeconds"],
+            data["durationSeconds"],
+            sys.intern(data["type"]),
+            _intern_optional(data.get("phase")),
+        )
+
+    def to_dict(self):
+        data = {
+            "id": self.id,
+            "name": self.name,
+            "startTimeSeconds": self.start_time_seconds,
+            "durationSeconds": self.duration_seconds,
+            "type": self.type,
+        }
+        if self.phase is not None:
+            data["phase"] = self.phase
+        return data
+
+    def _key(self):
+        return (self.id, self.name, self.start_time_seconds,
+                self.duration_seconds, self.type, self.phase)
+
+    def __eq__(self, other):
+        if not isinstance(other, Contest):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"Contest(id={self.id}, name={self.name!r}, start_time_seconds={self.start_time_seconds})"
+
+
+def _intern_optional(value):
+    return sys.intern(value) if value is not None else None
+
+
+class ContestTable:
+    __slots__ = ("ids", "start_times", "durations", "names", "types", "phases")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.start_times = array("q")
+        self.durations = array("q")
+        self.names = []
+        self.types = []
+        self.phases = []
+
+    @classmethod
+    def from_dicts(cls, contests):
+        table = cls()
+        for data in contests:
+            table.append_dict(data)
+        return table
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        return cls.from_dicts(data["contests"] if isinstance(data, dict) else data)
+
+    def append_dict(self, data):
+        self.ids.append(data["id"])
+        self.start_times.append(data["startTimeSeconds"])
+        self.durations.append(data["durationSeconds"])
+        self.names.append(sys.intern(data["name"]))
+        self.types.append(sys.intern(data["type"]))
+        self.phases.append(_intern_optional(data.get("phase")))
+
+    def append(self, contest):
+        self.ids.append(contest.id)
+        self.start_times.append(contest.start_time_seconds)
+        self.durations.append(contest.duration_seconds)
+        self.names.append(sys.intern(contest.name))
+        self.types.append(sys.intern(contest.type))
+        self.phases.append(_intern_optional(contest.phase))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        return Contest(
+            self.ids[index],
+            self.names[index],
+            self.start_times[index],
+            self.durations[index],
+            self.types[index],
+            self.phases[index],
+        )
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield self[index]
+
+    def to_dict(self, index):
+        return self[index].to_dict()
+
+    def to_dicts(self):
+        return [self.to_dict(index) for index in range(len(self.ids))]
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dicts(), **kwargs)
+
+    # Bytes held by the table itself; interned strings are shared and not counted twice
+    def nbytes(self):
+        total = sum(sys.getsizeof(column) for column in (
+            self.ids, self.start_times, self.durations, self.names, self.types, self.phases
+        ))
+        seen = set()
+        for value in (*self.names, *self.types, *self.phases):
+            if value is not None and id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+        return total
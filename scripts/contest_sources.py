@@ -0,0 +1,137 @@
+# Async fan-out over several contest sources behind one schema
+#
+# script_1.py knows a single api_endpoint and background.js keeps only
+# CodeForces rounds. ContestAggregator fetches every source concurrently
+# (CodeForces contest.list, the gym list, or any object with `name` and an
+# async `fetch()`), each with its own timeout and retry budget, normalizes
+# the results to the upcoming_contests schema and merges them. A refresh can
+# return at a deadline with the last good data of slower sources while those
+# keep running in the background.
+import asyncio
+import random
+import time
+import urllib.request
+
+from contest_model import SCHEMA_FIELDS
+from contest_stream import API_ENDPOINT, iter_upcoming_contests
+from rate_limiter import BACKGROUND
+
+
+class SourceError(Exception):
+    pass
+
+
+# Reduce an API contest object to the upcoming_contests schema
+def normalize_contest(contest):
+    if "startTimeSeconds" not in contest:  # gym contests may not be scheduled yet
+        return None
+    return {field: contest[field] for field in SCHEMA_FIELDS if field in contest}
+
+
+class HttpContestSource:
+    def __init__(self, name, url, timeout=10.0, retries=2, backoff_seconds=0.5,
+                 scheduler=None, priority=BACKGROUND):
+        self.name = name
+        self.url = url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def _fetch_blocking(self):
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+            contests = (normalize_contest(c) for c in iter_upcoming_contests(response))
+            return [contest for contest in contests if contest is not None]
+
+    async def fetch(self):
+        if self.scheduler is not None:
+            # The shared scheduler owns rate limiting, dedup and FAILED backoff
+            future = self.scheduler.submit(self.url, self._fetch_blocking, self.priority)
+            # Shield it: the Future is shared with other callers of the same URL
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        for attempt in range(self.retries + 1):
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(self._fetch_blocking), self.timeout
+                )
+            except Exception as error:
+                if attempt == self.retries:
+                    raise SourceError(f"{self.name}: {error}") from error
+                await asyncio.sleep(self.backoff_seconds * (2 ** attempt) * random.random())
+
+
+def codeforces_sources(url=API_ENDPOINT, **options):
+    return [
+        HttpContestSource("codeforces", url, **options),
+        HttpContestSource("codeforces-gym", url + "?gym=true", **options),
+    ]
+
+
+class ContestAggregator:
+    def __init__(self, sources):
+        self.sources = list(sources)
+        self.results = {}  # source name -> last good contest list
+        self.errors = {}
+        self.inflight = {}  # source name -> task still running from an earlier refresh
+        self.missing = set()  # sources with no successful fetch in the latest refresh
+
+    # Merge the latest result of every source, ordered by start time
+    def merged(self):
+        contests = {}
+        for source in self.sources:
+            for contest in self.results.get(source.name, ()):
+                contests[contest["id"]] = contest
+        return sorted(contests.values(), key=lambda c: (c["startTimeSeconds"], c["id"]))
+
+    async def _run(self, source):
+        try:
+            self.results[source.name] = await source.fetch()
+            self.errors.pop(source.name, None)
+        except Exception as error:
+            self.errors[source.name] = error
+        finally:
+            self.inflight.pop(source.name, None)
+
+    # Refresh all sources; with a deadline, return what is ready by then
+    async def refresh(self, deadline=None):
+        tasks = []
+        for source in self.sources:
+            task = self.inflight.get(source.name)
+            if task is None:
+                task = self.inflight[source.name] = asyncio.create_task(self._run(source))
+            tasks.append(task)
+
+        await asyncio.wait(tasks, timeout=deadline)
+        # Failed or still running: merged() holds at best their last good data
+        self.missing = {
+            source.name for source, task in zip(self.sources, tasks)
+            if not task.done() or source.name in self.errors
+        }
+        return self.merged()
+
+    # Yield the merged list each time another source finishes
+    async def refresh_incrementally(self):
+        tasks = {}
+        for source in self.sources:
+            task = self.inflight.get(source.name)
+            if task is None:
+                task = self.inflight[source.name] = asyncio.create_task(self._run(source))
+            tasks[task] = source.name
+
+        for next_done in asyncio.as_completed(tasks):
+            await next_done
+            yield self.merged()
+
+
+if __name__ == "__main__":
+    async def main():
+        aggregator = ContestAggregator(codeforces_sources())
+        start = time.perf_counter()
+        contests = await aggregator.refresh(deadline=15)
+        print(f"{len(contests)} upcoming contests in {time.perf_counter() - start:.2f}s")
+        for name, error in aggregator.errors.items():
+            print(f"{name} failed: {error}")
+
+    asyncio.run(main())
@@ -0,0 +1,283 @@
+# Append-only, columnar contest history
+#
+# Every contest.list snapshot is appended as one block that logs only the
+# records that changed since the previous snapshot (contest_diff) plus the
+# ids that disappeared. A block is a fixed header followed by little-endian
+# columns:
+#
+#   ids, start times, durations         int64[rows]
+#   removed ids                         int64[removed]
+#   name, type, phase string refs       uint32[rows]  (0xFFFFFFFF: no phase)
+#   string offsets                      uint32[strings + 1]
+#   string heap                         UTF-8 bytes, each string once per block
+#
+# Rows are sorted by start time and the header carries the block's start
+# range, so range queries skip whole blocks and bisect the rest. Readers
+# mmap the file and cast columns in place: opening only walks block headers
+# and nothing is decoded until a row is returned. A block cut short by a
+# crash mid-append is ignored, and cut off by the next append.
+import array
+import bisect
+import collections
+import mmap
+import os
+import struct
+import sys
+import time
+
+from contest_diff import ContestRemoved, diff_indexes, index_snapshot
+
+MAGIC = b"CFSTORE1"
+BLOCK_MAGIC = b"BLK1"
+NO_STRING = 0xFFFFFFFF
+# Columns are cast in place on little-endian hosts and byteswapped copies elsewhere
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# magic, reserved, snapshot time, rows, removed, strings, heap bytes, min start, max start
+_BLOCK_HEADER = struct.Struct("<4sIqIIIIqq")
+
+Block = collections.namedtuple(
+    "Block", "offset snapshot_time rows removed strings heap_size min_start max_start "
+             "ids starts durations removed_ids name_refs type_refs phase_refs string_offsets heap end"
+)
+
+
+def _pad(size):
+    return -size % 8
+
+
+def _encode_block(snapshot_time, rows, removed_ids):
+    rows = sorted(rows, key=lambda c: (c["startTimeSeconds"], c["id"]))
+    strings = {}
+
+    def ref(value):
+        if value is None:
+            return NO_STRING
+        return strings.setdefault(value, len(strings))
+
+    name_refs = [ref(c["name"]) for c in rows]
+    type_refs = [ref(c["type"]) for c in rows]
+    phase_refs = [ref(c.get("phase")) for c in rows]
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    heap = b"".join(encoded)
+
+    n = len(rows)
+    starts = [c["startTimeSeconds"] for c in rows]
+    parts = [
+        _BLOCK_HEADER.pack(BLOCK_MAGIC, 0, snapshot_time, n, len(removed_ids), len(strings),
+                           len(heap), starts[0] if n else 0, starts[-1] if n else -1),
+        struct.pack(f"<{n}q", *(c["id"] for c in rows)),
+        struct.pack(f"<{n}q", *starts),
+        struct.pack(f"<{n}q", *(c["durationSeconds"] for c in rows)),
+        struct.pack(f"<{len(removed_ids)}q", *removed_ids),
+    ]
+    refs = struct.pack(f"<{3 * n}I", *name_refs, *type_refs, *phase_refs)
+    parts += [refs, b"\0" * _pad(len(refs))]
+    table = struct.pack(f"<{len(offsets)}I", *offsets)
+    parts += [table, b"\0" * _pad(len(table)), heap, b"\0" * _pad(len(heap))]
+    return b"".join(parts)
+
+
+class ContestStore:
+    def __init__(self, path):
+        self.path = path
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as f:
+                f.write(MAGIC)
+        self.file = open(path, "rb")
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is not a contest store")
+        self.map = None
+        self.view = None
+        self.size = len(MAGIC)  # end of the last complete block
+        self.blocks = []
+        self._views = []
+        self._index = None  # contest id -> contest of the latest snapshot
+        self._latest = None  # contest id -> (block number, row) of the live version
+        self._map()
+
+    def close(self):
+        self._unmap()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _unmap(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self.view is not None:
+            self.view.release()
+            self.map.close()
+            self.view = self.map = None
+
+    # (Re)map the whole file and walk its block headers, stopping at a partial block
+    def _map(self):
+        self._unmap()
+        self.blocks = []
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        offset = len(MAGIC)
+        while offset < len(self.map):
+            block = self._block_at(offset)
+            if block is None:
+                break
+            self.blocks.append(block)
+            offset = block.end
+        self.size = offset
+
+    def _cast(self, start, count, fmt, width):
+        view = self.view[start:start + count * width]
+        if _LITTLE_ENDIAN:
+            typed = view.cast(fmt)
+            self._views += [view, typed]
+            return typed
+        typed = array.array(fmt)
+        typed.frombytes(view)
+        typed.byteswap()
+        view.release()
+        return typed
+
+    # Block at `offset`, or None if the file ends before the block does
+    def _block_at(self, offset):
+        if offset + _BLOCK_HEADER.size > len(self.map):
+            return None
+        (magic, _, snapshot_time, rows, removed, strings, heap_size,
+         min_start, max_start) = _BLOCK_HEADER.unpack_from(self.map, offset)
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"corrupt block at offset {offset}")
+        refs_size = 12 * rows + _pad(12 * rows)
+        offsets_size = 4 * (strings + 1) + _pad(4 * (strings + 1))
+        end = (offset + _BLOCK_HEADER.size + 24 * rows + 8 * removed + refs_size + offsets_size
+               + heap_size + _pad(heap_size))
+        if end > len(self.map):
+            return None
+        at = offset + _BLOCK_HEADER.size
+        ids = self._cast(at, rows, "q", 8)
+        starts = self._cast(at + 8 * rows, rows, "q", 8)
+        durations = self._cast(at + 16 * rows, rows, "q", 8)
+        at += 24 * rows
+        removed_ids = self._cast(at, removed, "q", 8)
+        at += 8 * removed
+        name_refs = self._cast(at, rows, "I", 4)
+        type_refs = self._cast(at + 4 * rows, rows, "I", 4)
+        phase_refs = self._cast(at + 8 * rows, rows, "I", 4)
+        at += refs_size
+        string_offsets = self._cast(at, strings + 1, "I", 4)
+        heap = at + offsets_size
+        return Block(offset, snapshot_time, rows, removed, strings, heap_size, min_start, max_start,
+                     ids, starts, durations, removed_ids, name_refs, type_refs, phase_refs,
+                     string_offsets, heap, end)
+
+    def _string(self, block, ref):
+        if ref == NO_STRING:
+            return None
+        start = block.heap + block.string_offsets[ref]
+        end = block.heap + block.string_offsets[ref + 1]
+        return str(self.map[start:end], "utf-8")
+
+    # Decode one row into the upcoming_contests dict shape
+    def row(self, block, index):
+        contest = {
+            "id": block.ids[index],
+            "name": self._string(block, block.name_refs[index]),
+            "startTimeSeconds": block.starts[index],
+            "durationSeconds": block.durations[index],
+            "type": self._string(block, block.type_refs[index]),
+        }
+        phase = self._string(block, block.phase_refs[index])
+        if phase is not None:
+            contest["phase"] = phase
+        return contest
+
+    def snapshot_times(self):
+        return [block.snapshot_time for block in self.blocks]
+
+    # Contest list as of `snapshot_time` (default: the latest snapshot)
+    def state_at(self, snapshot_time=None):
+        state = {}
+        for block in self.blocks:
+            if snapshot_time is not None and block.snapshot_time > snapshot_time:
+                break
+            for contest_id in block.removed_ids:
+                state.pop(contest_id, None)
+            for index in range(block.rows):
+                state[block.ids[index]] = (block, index)
+        return [self.row(block, index) for block, index in state.values()]
+
+    # Every logged version whose start time is in [start, end), as (snapshot time, contest)
+    def rows_between(self, start, end):
+        for block in self.blocks:
+            if block.rows == 0 or block.max_start < start or block.min_start >= end:
+                continue
+            first = bisect.bisect_left(block.starts, start)
+            last = bisect.bisect_left(block.starts, end, first)
+            for index in range(first, last):
+                yield block.snapshot_time, self.row(block, index)
+
+    # contest id -> (block number, row) of the version in the latest snapshot
+    def _live_rows(self):
+        if self._latest is None:
+            latest = {}
+            for number, block in enumerate(self.blocks):
+                for contest_id in block.removed_ids:
+                    latest.pop(contest_id, None)
+                for index, contest_id in enumerate(block.ids):
+                    latest[contest_id] = (number, index)
+            self._latest = latest
+        return self._latest
+
+    # Contests of the latest snapshot whose start time is in [start, end)
+    def contests_between(self, start, end):
+        live = self._live_rows()
+        found = []
+        for number, block in enumerate(self.blocks):
+            if block.rows == 0 or block.max_start < start or block.min_start >= end:
+                continue
+            first = bisect.bisect_left(block.starts, start)
+            last = bisect.bisect_left(block.starts, end, first)
+            for index in range(first, last):
+                if live.get(block.ids[index]) == (number, index):
+                    found.append(self.row(block, index))
+        found.sort(key=lambda c: (c["startTimeSeconds"], c["id"]))
+        return found
+
+    # Append a snapshot; only records that changed since the last one are written.
+    # Returns the number of change records (contest_diff) it contained.
+    def append_snapshot(self, contests, snapshot_time=None):
+        if self._index is None:
+            self._index = index_snapshot(self.state_at())
+        index = index_snapshot(contests)
+        changes = diff_indexes(self._index, index)
+
+        changed, removed = {}, []
+        for change in changes:
+            if isinstance(change, ContestRemoved):
+                removed.append(change.contest["id"])
+            else:
+                changed[change.contest["id"]] = change.contest
+        snapshot_time = int(time.time()) if snapshot_time is None else snapshot_time
+
+        self._unmap()
+        with open(self.path, "r+b") as f:
+            # Drop any partial block left by an interrupted append
+            f.truncate(self.size)
+            f.seek(self.size)
+            f.write(_encode_block(snapshot_time, list(changed.values()), removed))
+        self._index = index
+        self._latest = None
+        self._map()
+        return len(changes)
+
+    # Bytes on disk
+    def nbytes(self):
+        return len(self.map)
+
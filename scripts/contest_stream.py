@@ -0,0 +1,126 @@
+# Streaming parser for the CodeForces contest.list payload
+#
+# contest.list returns every contest ever held (several megabytes), newest
+# first, so the upcoming (phase BEFORE) contests sit at the head of `result`.
+# Instead of json.load()-ing the whole response we decode one contest object
+# at a time from a file or socket and stop reading once the BEFORE block ends.
+import codecs
+import json
+import urllib.request
+
+API_ENDPOINT = "https://codeforces.com/api/contest.list"
+CHUNK_SIZE = 16 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class ContestStreamError(ValueError):
+    pass
+
+
+# Incremental reader over a file-like object (bytes or text)
+class _StreamReader:
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def fill(self):
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            if isinstance(chunk, bytes):
+                self.buf += self.utf8.decode(b"", final=True)
+            return False
+        if isinstance(chunk, bytes):
+            chunk = self.utf8.decode(chunk)
+
+        # Drop the consumed prefix so the buffer never grows past a chunk or two
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ContestStreamError("Unexpected end of contest.list payload")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ContestStreamError(
+                f"Expected {char!r} at offset {self.pos}, got {self.buf[self.pos]!r}"
+            )
+        self.pos += 1
+
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof or not self.fill():
+                    raise ContestStreamError("Malformed contest.list payload")
+                continue
+
+            # A number cut at the chunk boundary still decodes, so make sure
+            # the value is terminated before trusting it
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+# Yield every contest object in `result`, reading only as far as the caller consumes
+def iter_contests(fp, chunk_size=CHUNK_SIZE):
+    reader = _StreamReader(fp, chunk_size)
+    reader.expect("{")
+
+    while reader.peek() != "}":
+        key = reader.read_value()
+        reader.expect(":")
+
+        if key == "result":
+            reader.expect("[")
+            while reader.peek() != "]":
+                yield reader.read_value()
+                if reader.peek() == ",":
+                    reader.pos += 1
+            reader.pos += 1
+        elif key == "status":
+            status = reader.read_value()
+            if status != "OK":
+                raise ContestStreamError("Failed to fetch contests from CodeForces API")
+        else:
+            reader.read_value()  # e.g. "comment"
+
+        if reader.peek() == ",":
+            reader.pos += 1
+
+
+# Yield only the upcoming contests and stop once the BEFORE block is over
+def iter_upcoming_contests(fp, chunk_size=CHUNK_SIZE):
+    for contest in iter_contests(fp, chunk_size):
+        if contest.get("phase") != "BEFORE":
+            return
+        yield contest
+
+
+# Open the live contest.list endpoint as a socket-backed stream
+def open_contest_stream(url=API_ENDPOINT, timeout=30):
+    return urllib.request.urlopen(url, timeout=timeout)
+
+
+if __name__ == "__main__":
+    with open_contest_stream() as response:
+        for contest in iter_upcoming_contests(response):
+            print(f"{contest['id']}: {contest['name']}")
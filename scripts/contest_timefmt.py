@@ -0,0 +1,113 @@
+# Batch formatting of contest start/end times for every popup timezone
+#
+# script_1.py formats contests one at a time with
+# datetime.fromtimestamp(...).strftime('%B %d, %Y at %I:%M %p'). Here a whole
+# column of start/duration seconds is converted with NumPy: each zone's UTC
+# offsets and DST transitions are computed once and cached, offsets are looked
+# up with searchsorted, and each distinct day and minute-of-day is formatted
+# only once.
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# Same zones as the timezone-select dropdown in popup.html (script_5.py)
+POPUP_TIMEZONES = (
+    "UTC",
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "Europe/London",
+    "Europe/Paris",
+    "Asia/Tokyo",
+    "Asia/Shanghai",
+    "Asia/Kolkata",
+)
+
+MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December")
+
+_DAY = 86400
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+def _utc_offset(zone, timestamp):
+    return int(datetime.fromtimestamp(timestamp, zone).utcoffset().total_seconds())
+
+
+# Offset transitions for a zone over whole calendar years, cached per (zone, years)
+@lru_cache(maxsize=None)
+def zone_transitions(zone_name, first_year, last_year):
+    zone = ZoneInfo(zone_name)
+    lo = int(datetime(first_year, 1, 1, tzinfo=timezone.utc).timestamp())
+    hi = int(datetime(last_year + 1, 1, 1, tzinfo=timezone.utc).timestamp())
+
+    times = [lo]
+    offsets = [_utc_offset(zone, lo)]
+    for day_start in range(lo, hi, _DAY):
+        day_end = min(day_start + _DAY, hi)
+        if _utc_offset(zone, day_end) == offsets[-1]:
+            continue
+
+        # Binary search the exact second the offset changed inside this day
+        left, right = day_start, day_end
+        while right - left > 1:
+            mid = (left + right) // 2
+            if _utc_offset(zone, mid) == offsets[-1]:
+                left = mid
+            else:
+                right = mid
+        times.append(right)
+        offsets.append(_utc_offset(zone, right))
+
+    return np.array(times, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+
+@lru_cache(maxsize=1)
+def _minute_labels():
+    labels = []
+    for minute in range(1440):
+        hour, minute_of_hour = divmod(minute, 60)
+        suffix = "AM" if hour < 12 else "PM"
+        labels.append(f" at {(hour % 12) or 12:02d}:{minute_of_hour:02d} {suffix}")
+    return np.array(labels, dtype=object)
+
+
+def _format_local(local_seconds):
+    days, seconds = np.divmod(local_seconds, _DAY)
+    unique_days, inverse = np.unique(days, return_inverse=True)
+
+    day_labels = np.empty(len(unique_days), dtype=object)
+    for i, day in enumerate(unique_days.tolist()):
+        date = datetime.fromordinal(_EPOCH_ORDINAL + day)
+        day_labels[i] = f"{MONTHS[date.month - 1]} {date.day:02d}, {date.year}"
+
+    return day_labels[inverse.ravel()] + _minute_labels()[seconds // 60]
+
+
+# Local offsets for a column of UTC timestamps
+def utc_offsets(zone_name, timestamps):
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if timestamps.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    first_year = datetime.fromtimestamp(int(timestamps.min()), timezone.utc).year - 1
+    last_year = datetime.fromtimestamp(int(timestamps.max()), timezone.utc).year + 1
+    times, offsets = zone_transitions(zone_name, first_year, last_year)
+    return offsets[np.searchsorted(times, timestamps, side="right") - 1]
+
+
+# Format start/end strings for every zone: {zone: (start_labels, end_labels)}
+def format_contest_times(start_seconds, duration_seconds, zones=POPUP_TIMEZONES):
+    starts = np.asarray(start_seconds, dtype=np.int64)
+    ends = starts + np.asarray(duration_seconds, dtype=np.int64)
+
+    formatted = {}
+    for zone_name in zones:
+        formatted[zone_name] = (
+            _format_local(starts + utc_offsets(zone_name, starts)),
+            _format_local(ends + utc_offsets(zone_name, ends)),
+        )
+    return formatted
@@ -0,0 +1,208 @@
+# Local stand-in for the Google Calendar API
+#
+# Implements just enough of the API for offline throughput and failure
+# testing: single event insert/patch/delete, the multipart/mixed batch
+# endpoint, and calendars/primary for token checks. Events are kept in memory
+# per bearer token. Latency and failures can be injected per request (including
+# inserts that are applied but whose response is lost), and a per-user quota
+# answers 403 rateLimitExceeded the way Google does. Client-chosen event ids
+# are kept, and reusing one answers 409. As on Google, a deleted event stays
+# behind as `cancelled` under its id until a PATCH confirms it again.
+import collections
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from calendar_sync import (
+    BATCH_PATH,
+    EVENTS_PATH,
+    encode_http_message,
+    encode_multipart,
+    parse_http_message,
+    split_multipart,
+)
+
+_REASONS = {200: "OK", 204: "No Content", 401: "Unauthorized", 403: "Forbidden",
+            404: "Not Found", 405: "Method Not Allowed", 409: "Conflict", 410: "Gone",
+            503: "Service Unavailable"}
+_DUPLICATE = {"error": {"code": 409, "message": "The requested identifier already exists.",
+                        "errors": [{"domain": "global", "reason": "duplicate"}]}}
+_BACKEND_ERROR = {"error": {"code": 503, "message": "Backend Error"}}
+_RATE_LIMITED = {"error": {"code": 403, "message": "Rate Limit Exceeded",
+                           "errors": [{"domain": "usageLimits", "reason": "rateLimitExceeded"}]}}
+
+
+class FakeCalendar:
+    def __init__(self, latency=0.0, fail_rate=0.0, seed=None, quota_per_second=None, lost_rate=0.0):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.lost_rate = lost_rate
+        self.quota_per_second = quota_per_second
+        self.recent = collections.defaultdict(collections.deque)  # token -> operation times
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.events = {}  # token -> {event id: event}
+        self.http_requests = 0
+        self.operations = 0
+        self.rate_limited = 0
+
+    # Events not deleted, across all users
+    def event_count(self):
+        with self.lock:
+            return sum(event["status"] != "cancelled" for events in self.events.values()
+                       for event in events.values())
+
+    # Sliding one-second window of operations per user
+    def _over_quota(self, token):
+        now = time.monotonic()
+        recent = self.recent[token]
+        while recent and recent[0] <= now - 1.0:
+            recent.popleft()
+        if len(recent) >= self.quota_per_second:
+            return True
+        recent.append(now)
+        return False
+
+    # Apply one (possibly batched) operation; returns (status, body)
+    def apply(self, token, method, path, body):
+        with self.lock:
+            self.operations += 1
+            if self.quota_per_second and self._over_quota(token):
+                self.rate_limited += 1
+                return 403, _RATE_LIMITED
+            if self.fail_rate and self.random.random() < self.fail_rate:
+                return 503, _BACKEND_ERROR
+
+            events = self.events.setdefault(token, {})
+            if path == "/calendar/v3/calendars/primary" and method == "GET":
+                return 200, {"id": "primary"}
+            if path == EVENTS_PATH and method == "POST":
+                event = dict(body, id=body.get("id") or uuid.uuid4().hex, status="confirmed")
+                if event["id"] in events:
+                    return 409, _DUPLICATE
+                events[event["id"]] = event
+                if self.lost_rate and self.random.random() < self.lost_rate:
+                    # Stored, but the client only sees an error
+                    return 503, _BACKEND_ERROR
+                return 200, event
+            if path == EVENTS_PATH and method == "GET":
+                live = [event for event in events.values() if event["status"] != "cancelled"]
+                return 200, {"items": live}
+            if path.startswith(EVENTS_PATH + "/"):
+                event_id = path[len(EVENTS_PATH) + 1:]
+                if event_id not in events:
+                    return 404, {"error": {"code": 404, "message": "Not Found"}}
+                if method == "GET":
+                    return 200, events[event_id]
+                if method == "PATCH":
+                    events[event_id].update(body)
+                    return 200, events[event_id]
+                if method == "DELETE":
+                    if events[event_id]["status"] == "cancelled":
+                        return 410, {"error": {"code": 410, "message": "Resource has been deleted"}}
+                    events[event_id]["status"] = "cancelled"
+                    return 204, None
+            return 405, {"error": {"code": 405, "message": "Method Not Allowed"}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        calendar = self.server.calendar
+        with calendar.lock:
+            calendar.http_requests += 1
+        if calendar.latency:
+            time.sleep(calendar.latency)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        auth = self.headers.get("Authorization", "")
+        if not auth.startswith("Bearer "):
+            return self._send(401, {"error": {"code": 401, "message": "Login Required"}})
+        token = auth[len("Bearer "):]
+
+        if self.path == BATCH_PATH and self.command == "POST":
+            return self._handle_batch(token, raw)
+
+        body = json.loads(raw) if raw else None
+        status, response = calendar.apply(token, self.command, self.path, body)
+        self._send(status, response)
+
+    def _handle_batch(self, token, raw):
+        parts = []
+        for headers, payload in split_multipart(self.headers["Content-Type"], raw):
+            start_line, _, body = parse_http_message(payload)
+            method, path = start_line.split()[:2]
+            status, response = self.server.calendar.apply(token, method, path, body)
+            content_id = headers.get("content-id", "").strip("<>")
+            parts.append((
+                {"Content-Type": "application/http", "Content-ID": f"<response-{content_id}>"},
+                encode_http_message(f"HTTP/1.1 {status} {_REASONS.get(status, '')}", response),
+            ))
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        self._send_raw(200, encode_multipart(parts, boundary),
+                       f"multipart/mixed; boundary={boundary}")
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self._send_raw(status, payload, "application/json")
+
+    def _send_raw(self, status, payload, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+
+class _Server(ThreadingHTTPServer):
+    # Clients dropping keep-alive connections is routine here, not an error to print
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+
+class FakeCalendarServer:
+    def __init__(self, host="127.0.0.1", port=0, **options):
+        self.calendar = FakeCalendar(**options)
+        self.httpd = _Server((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.calendar = self.calendar
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    server = FakeCalendarServer(port=8765)
+    print(f"Fake Google Calendar API on {server.base_url}")
+    server.httpd.serve_forever()
@@ -0,0 +1,103 @@
+# Local stand-in for the CodeForces contest.list API
+#
+# Serves /api/contest.list (and ?gym=true) from in-memory contest lists,
+# with ETag/Last-Modified validators, optional injected latency and an
+# optional `status: FAILED` mode to exercise error handling offline.
+import hashlib
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeCodeforces:
+    def __init__(self, contests=None, gym_contests=None, latency=0.0, failing=False):
+        self.lock = threading.Lock()
+        self.latency = latency
+        self.failing = failing
+        self.requests = 0
+        self.not_modified = 0
+        self.payloads = {}
+        self.set_contests(contests or [], gym=False)
+        self.set_contests(gym_contests or [], gym=True)
+
+    # Replace a contest list; bumps its ETag and Last-Modified
+    def set_contests(self, contests, gym=False):
+        body = json.dumps({"status": "OK", "result": contests}).encode("utf-8")
+        with self.lock:
+            self.payloads[gym] = (
+                body,
+                '"' + hashlib.sha1(body).hexdigest() + '"',
+                formatdate(time.time(), usegmt=True),
+            )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        api = self.server.api
+        with api.lock:
+            api.requests += 1
+        if api.latency:
+            time.sleep(api.latency() if callable(api.latency) else api.latency)
+
+        parts = urlsplit(self.path)
+        if parts.path != "/api/contest.list":
+            return self._send(404, b"{}", {})
+        if api.failing:
+            body = json.dumps({"status": "FAILED", "comment": "Call limit exceeded"}).encode()
+            return self._send(503, body, {})
+
+        gym = parse_qs(parts.query).get("gym", ["false"])[0] == "true"
+        with api.lock:
+            body, etag, last_modified = api.payloads[gym]
+        validators = {"ETag": etag, "Last-Modified": last_modified}
+        if self.headers.get("If-None-Match") == etag:
+            with api.lock:
+                api.not_modified += 1
+            return self._send(304, b"", validators)
+        self._send(200, body, validators)
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeCodeforcesServer:
+    def __init__(self, host="127.0.0.1", port=0, **options):
+        self.api = FakeCodeforces(**options)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self.api
+        self.thread = None
+
+    @property
+    def contest_list_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/contest.list"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
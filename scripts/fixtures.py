@@ -0,0 +1,106 @@
+# Shared fixtures for the benchmarks, harnesses and demos
+#
+# make_contests() builds contest.list-shaped records (Codeforces rounds at a
+# fixed spacing), make_contest_history() a mixed history of rounds and gym
+# contests around now, and popup_chrome_stub() the chrome.* stand-in that
+# lets popup.js run in a plain page.
+import json
+import random
+import time
+
+DAY = 86400
+BASE_START = 1720180500  # fixed start time so runs are comparable
+
+_POPUP_CHROME_STUB = """
+// Stand-in for the chrome.* APIs used by popup.js (%(purpose)s only)
+(() => {
+    const responses = {
+%(responses)s
+    };
+    const delays = %(delays)s;
+    const later = (ms, fn) => (ms ? setTimeout(fn, ms) : fn());
+    const sendMessage = (message, callback) => {
+        const respond = responses[message.action] || (() => ({ success: true }));
+        later(delays[message.action] ?? %(delay)d, () => callback && callback(respond()));
+    };
+    window.chrome = {
+        runtime: {
+            sendMessage,
+            connect() {
+                // Port stand-in: answers each request through sendMessage
+                const listeners = [];
+                return {
+                    onMessage: { addListener: fn => listeners.push(fn) },
+                    onDisconnect: { addListener() {} },
+                    postMessage: message => sendMessage(message, response =>
+                        listeners.forEach(fn => fn({ id: message.id, type: 'response', response })))
+                };
+            }
+        },
+        storage: {
+            sync: {
+                get: () => new Promise(resolve => later(%(settings_delay)d, () => resolve({}))),
+                set: () => Promise.resolve()
+            }
+        },
+        tabs: { create() {} }
+    };
+})();
+"""
+
+
+# `count` Codeforces rounds (Div. 1-3 in turn) `spacing` seconds apart from
+# `start`. `varied` mixes durations and ICPC-type rounds; `newest_first`
+# orders them the way contest.list does.
+def make_contests(count, first_id=2000, start=BASE_START, spacing=DAY, phase="BEFORE",
+                  varied=False, newest_first=False):
+    contests = [
+        {
+            "id": first_id + i,
+            "name": f"Codeforces Round {first_id + i} (Div. {1 + i % 3})",
+            "startTimeSeconds": start + i * spacing,
+            "durationSeconds": 7200 + (i % 3) * 1800 if varied else 7200,
+            "type": ("CF" if i % 4 else "ICPC") if varied else "CF",
+            "phase": phase,
+        }
+        for i in range(count)
+    ]
+    if newest_first:
+        contests.reverse()
+    return contests
+
+
+# Contest history around `now`: every third entry a gym contest, half of them finished
+def make_contest_history(count, seed=1, now=None):
+    rng = random.Random(seed)
+    now = int(time.time()) if now is None else now
+    contests = []
+    for i in range(count):
+        gym = i % 3 == 0
+        contest_id = 100000 + i if gym else 1 + i
+        start = now + (count // 2 - i) * 6 * 3600
+        contests.append({
+            "id": contest_id,
+            "name": (f"{rng.choice(['ICPC', 'OI', 'Training'])} Gym Contest {contest_id}"
+                     if gym else f"Codeforces Round {contest_id} (Div. {rng.choice([1, 2, 3, 4])})"),
+            "type": "ICPC" if gym else rng.choice(["CF", "CF", "ICPC"]),
+            "phase": "BEFORE" if start > now else "FINISHED",
+            "startTimeSeconds": start,
+            "durationSeconds": rng.choice([5400, 7200, 9000, 10800, 18000]),
+        })
+    return contests
+
+
+# chrome.* stand-in (JavaScript) for popup pages built outside the extension.
+# `responses` maps a message action to a JavaScript expression for its
+# response, evaluated per request after delays[action] (default `delay`) ms;
+# other actions answer { success: true }.
+def popup_chrome_stub(purpose, responses, delays=None, delay=0, settings_delay=0):
+    entries = ",\n".join(f"        {action}: () => ({value})" for action, value in responses.items())
+    return _POPUP_CHROME_STUB % {
+        "purpose": purpose,
+        "responses": entries,
+        "delays": json.dumps(delays or {}),
+        "delay": delay,
+        "settings_delay": settings_delay,
+    }
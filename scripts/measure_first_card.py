@@ -0,0 +1,113 @@
+# Time-to-first-contest-card harness for headless Chromium
+#
+# Builds the popup twice (plain, and with contests prerendered by
+# prerender.py), loads each in headless Chromium with a stand-in for the
+# chrome.* APIs that answers after realistic delays, and reads the
+# `first-contest-card` performance mark that popup.js records.
+#
+# Usage: python scripts/measure_first_card.py [--chrome PATH] [--runs N] [--contests FILE]
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from build import build
+from fixtures import DAY, make_contests, popup_chrome_stub
+from prerender import load_contests
+
+CHROME_CANDIDATES = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable",
+                     "headless_shell")
+
+# Delays (ms) of the background round trips the popup waits on
+MESSAGE_DELAYS = {
+    "checkAuthStatus": 20,  # answered from the cached token expiry, no network round trip
+    "fetchContests": 400,
+}
+
+CHROME_STUB = popup_chrome_stub("measurement", {
+    "checkAuthStatus": "{ isAuthenticated: false }",
+    "fetchContests": "{ success: true, contests: window.SAMPLE_CONTESTS }",
+    "refreshContests": "{ success: true, contests: window.SAMPLE_CONTESTS }",
+}, delays=MESSAGE_DELAYS, delay=20, settings_delay=30)
+
+# Publishes the first-contest-card mark on <html> for --dump-dom to pick up
+FIRST_CARD_OBSERVER = """
+new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+        if (entry.name === 'first-contest-card') {
+            document.documentElement.dataset.firstContestCard = entry.startTime.toFixed(1);
+        }
+    }
+}).observe({ entryTypes: ['mark'] });
+"""
+
+
+def find_chrome(explicit=None):
+    for candidate in (explicit, os.environ.get("CHROME_BIN"), *CHROME_CANDIDATES):
+        if candidate and shutil.which(candidate):
+            return shutil.which(candidate)
+    return None
+
+
+def sample_contests(count=10):
+    return make_contests(count, first_id=2200, start=int(time.time()) + DAY)
+
+
+def prepare(out_dir, contests, prerender):
+    build(out_dir, minify=True, contests=contests if prerender else None)
+    stub = f"window.SAMPLE_CONTESTS = {json.dumps(contests)};\n{CHROME_STUB}{FIRST_CARD_OBSERVER}"
+    (Path(out_dir) / "chrome_stub.js").write_text(stub, encoding="utf-8")
+
+    popup = Path(out_dir) / "popup.html"
+    html = popup.read_text(encoding="utf-8")
+    html = html.replace('<script src="popup.js"></script>',
+                        '<script src="chrome_stub.js"></script>\n<script src="popup.js"></script>')
+    popup.write_text(html, encoding="utf-8")
+    return popup.resolve().as_uri()
+
+
+def first_card_ms(chrome, url):
+    output = subprocess.run(
+        [chrome, "--headless=new", "--disable-gpu", "--no-sandbox",
+         "--allow-file-access-from-files", "--virtual-time-budget=5000", "--dump-dom", url],
+        capture_output=True, text=True, timeout=60, check=True,
+    ).stdout
+    match = re.search(r'data-first-contest-card="([\d.]+)"', output)
+    return float(match.group(1)) if match else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure popup time to first contest card")
+    parser.add_argument("--chrome", help="Chromium/Chrome binary")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--contests", help="cached contest list to render (default: sample)")
+    args = parser.parse_args()
+
+    chrome = find_chrome(args.chrome)
+    if chrome is None:
+        print("No Chromium binary found; pass --chrome or set CHROME_BIN", file=sys.stderr)
+        return 2
+
+    contests = load_contests(args.contests) if args.contests else sample_contests()
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'popup':<14}{'median (ms)':>12}{'min (ms)':>10}")
+        for label, prerender in (("live render", False), ("prerendered", True)):
+            url = prepare(os.path.join(tmp, label.replace(" ", "-")), contests, prerender)
+            samples = [first_card_ms(chrome, url) for _ in range(args.runs)]
+            samples = [sample for sample in samples if sample is not None]
+            if not samples:
+                print(f"{label:<14}{'no card painted':>22}")
+                continue
+            print(f"{label:<14}{statistics.median(samples):>12.1f}{min(samples):>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
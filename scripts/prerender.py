@@ -0,0 +1,127 @@
+# Prerender the popup's contest cards from a cached contest list
+#
+# popup.js only paints contests after checkAuthStatus, loadUserSettings and
+# loadContests have all answered. This renders the same markup as
+# createContestCard() into popup.html's #contests-list, marked
+# data-prerendered="true", so the popup paints real cards on its first frame
+# and hydrates them once fresh data arrives.
+#
+# Usage: python scripts/prerender.py contests.json [dist/popup.html] [--timezone Zone]
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from calendar_event import contest_url
+
+DEFAULT_POPUP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "dist", "popup.html")
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+_CONTESTS_LIST = re.compile(
+    r'(<div id="contests-list" class="contests-list")[^>]*>.*?(</div>\s*</div>\s*<div class="settings-section">)',
+    re.S,
+)
+
+
+# Same escaping as escapeHtml() in popup.js (textContent -> innerHTML)
+def escape_html(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+# toLocaleDateString('en-US', {weekday, month: 'short', day, hour: '2-digit', minute: '2-digit'})
+def format_start(timestamp, zone):
+    start = datetime.fromtimestamp(timestamp, zone)
+    suffix = "AM" if start.hour < 12 else "PM"
+    return (f"{WEEKDAYS[start.weekday()]}, {MONTHS[start.month - 1]} {start.day}, "
+            f"{(start.hour % 12) or 12:02d}:{start.minute:02d} {suffix}")
+
+
+# Math.round(durationSeconds / 3600 * 10) / 10, printed the way JavaScript prints numbers
+def format_duration(seconds):
+    hours = int(seconds / 3600 * 10 + 0.5) / 10
+    return str(int(hours)) if hours == int(hours) else str(hours)
+
+
+def render_contest_card(contest, zone, is_authenticated=False):
+    disabled = "" if is_authenticated else "disabled"
+    button_text = "Add to Calendar" if is_authenticated else "Connect Google First"
+    return f"""
+        <div class="contest-card" data-contest-id="{contest['id']}">
+            <div class="contest-header">
+                <h3 class="contest-title">{escape_html(contest['name'])}</h3>
+                <span class="contest-type">{contest['type']}</span>
+            </div>
+            <div class="contest-details">
+                <div class="contest-time">
+                    <span class="time-icon">🕒</span>
+                    <span>{format_start(contest['startTimeSeconds'], zone)}</span>
+                </div>
+                <div class="contest-duration">
+                    <span class="duration-icon">⏱️</span>
+                    <span>{format_duration(contest['durationSeconds'])} hours</span>
+                </div>
+            </div>
+            <div class="contest-actions">
+                <a href="{contest_url(contest)}" target="_blank" class="btn btn--outline btn--sm">
+                    View Contest
+                </a>
+                <button
+                    id="add-btn-{contest['id']}"
+                    class="btn btn--primary btn--sm"
+                    {disabled}
+                >
+                    {button_text}
+                </button>
+            </div>
+        </div>
+    """
+
+
+def render_fragment(contests, time_zone="UTC"):
+    zone = ZoneInfo(time_zone)
+    return "".join(render_contest_card(contest, zone) for contest in contests)
+
+
+# Insert the fragment into popup.html markup; returns the new markup
+def prerender_popup(html, contests, time_zone="UTC"):
+    if not contests:
+        return html
+    fragment = render_fragment(contests, time_zone)
+    html, count = _CONTESTS_LIST.subn(
+        lambda m: f'{m.group(1)} data-prerendered="true">{fragment}{m.group(2)}', html, count=1
+    )
+    if not count:
+        raise ValueError("popup.html has no #contests-list container")
+    return html
+
+
+def load_contests(path):
+    with open(path) as f:
+        data = json.load(f)
+    # Accept a contest list, extension_data-style {"contests": [...]} or a ContestCache snapshot
+    return data["contests"] if isinstance(data, dict) else data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prerender contest cards into popup.html")
+    parser.add_argument("contests", help="cached contest list (JSON)")
+    parser.add_argument("popup", nargs="?", default=DEFAULT_POPUP, help="popup.html to update")
+    parser.add_argument("--timezone", default="UTC")
+    args = parser.parse_args()
+
+    with open(args.popup, encoding="utf-8") as f:
+        html = f.read()
+    html = prerender_popup(html, load_contests(args.contests), args.timezone)
+    with open(args.popup, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"Prerendered contests into {args.popup}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# Shared, rate-limit-aware scheduler for CodeForces API calls
+#
+# CodeForces allows roughly one call every two seconds per client. Every
+# outgoing request goes through one token bucket here. Interactive refreshes
+# are served before background alarm work, identical requests that are
+# already queued or in flight share one call, and `status: FAILED` responses
+# (usually "Call limit exceeded") are retried with jittered exponential
+# backoff that also pauses the whole bucket.
+import itertools
+import json
+import random
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+CALLS_PER_SECOND = 0.5
+
+
+class CodeforcesApiError(Exception):
+    pass
+
+
+def fetch_json(url, timeout=30):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.load(response)
+
+
+def _is_failure(result):
+    return isinstance(result, dict) and result.get("status") == "FAILED"
+
+
+class _Job:
+    __slots__ = ("key", "fn", "priority", "future", "attempt", "running")
+
+    def __init__(self, key, fn, priority):
+        self.key = key
+        self.fn = fn
+        self.priority = priority
+        self.future = Future()
+        self.attempt = 0
+        self.running = False
+
+
+class RequestScheduler:
+    def __init__(self, rate=CALLS_PER_SECOND, burst=1, max_retries=4,
+                 backoff_seconds=2.0, max_workers=4, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.clock = clock
+
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.paused_until = 0.0
+
+        self.queue = []  # (not_before, lane, seq, job)
+        self.jobs = {}  # key -> job, queued or in flight
+        self.seq = itertools.count()
+        self.cond = threading.Condition()
+        self.closed = False
+        self.calls = 0
+        self.deduplicated = 0
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self.dispatcher.start()
+
+    # Queue `fn()` under `key`; identical keys share one call and one Future
+    def submit(self, key, fn, priority=BACKGROUND):
+        with self.cond:
+            job = self.jobs.get(key)
+            if job is not None:
+                self.deduplicated += 1
+                if priority < job.priority and not job.running:
+                    # An interactive caller joined a queued background request; promote it
+                    job.priority = priority
+                    self.queue = [
+                        (entry[0], priority, entry[2], job) if entry[3] is job else entry
+                        for entry in self.queue
+                    ]
+                    self.cond.notify()
+                return job.future
+
+            job = self.jobs[key] = _Job(key, fn, priority)
+            self.queue.append((0.0, priority, next(self.seq), job))
+            self.cond.notify()
+            return job.future
+
+    def get(self, url, priority=BACKGROUND):
+        return self.submit(url, lambda: fetch_json(url), priority)
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _is_live(self, entry):
+        job = entry[3]
+        return self.jobs.get(job.key) is job and not job.running
+
+    def _next_job(self):
+        while not self.closed:
+            now = self.clock()
+            self._refill(now)
+            self.queue = [entry for entry in self.queue if self._is_live(entry)]
+            if not self.queue:
+                self.cond.wait()
+                continue
+
+            # Most urgent job that may run now: lowest lane first, then FIFO
+            ready = [entry for entry in self.queue if entry[0] <= now]
+            if ready and now >= self.paused_until and self.tokens >= 1:
+                entry = min(ready, key=lambda e: (e[1], e[2]))
+                self.queue.remove(entry)
+                self.tokens -= 1
+                return entry[3]
+
+            if ready:
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            else:
+                wait = max(min(entry[0] for entry in self.queue), self.paused_until) - now
+            self.cond.wait(timeout=max(wait, 0.001))
+        return None
+
+    def _dispatch(self):
+        with self.cond:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    return
+                job.running = True
+                self.calls += 1
+                self.executor.submit(self._run, job)
+
+    def _run(self, job):
+        try:
+            result, error = job.fn(), None
+        except Exception as exc:
+            result, error = None, exc
+
+        failed = error is not None or _is_failure(result)
+        with self.cond:
+            job.running = False
+            if failed and job.attempt < self.max_retries:
+                job.attempt += 1
+                delay = self.backoff_seconds * (2 ** (job.attempt - 1)) * (0.5 + random.random())
+                retry_at = self.clock() + delay
+                self.paused_until = max(self.paused_until, retry_at)
+                self.queue.append((retry_at, job.priority, next(self.seq), job))
+                self.cond.notify()
+                return
+            del self.jobs[job.key]
+
+        if error is not None:
+            job.future.set_exception(error)
+        elif _is_failure(result):
+            job.future.set_exception(CodeforcesApiError(result.get("comment", "FAILED")))
+        else:
+            job.future.set_result(result)
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.executor.shutdown(wait=False)
@@ -27,22 +27,23 @@ upcoming_contests = [
     }
 ]
 
-# Format the data for better understanding
-for contest in upcoming_contests:
-    start_time = datetime.fromtimestamp(contest['startTimeSeconds'])
-    duration_hours = contest['durationSeconds'] / 3600
-    
-    print(f"Contest: {contest['name']}")
-    print(f"Start: {start_time.strftime('%B %d, %Y at %I:%M %p')}")
-    print(f"Duration: {duration_hours} hours")
-    print(f"End: {(start_time + timedelta(seconds=contest['durationSeconds'])).strftime('%B %d, %Y at %I:%M %p')}")
-    print("-" * 50)
-
 # Create JSON data for the extension
 extension_data = {
     "contests": upcoming_contests,
     "api_endpoint": "https://codeforces.com/api/contest.list"
 }
 
-print("\nExtension data structure:")
-print(json.dumps(extension_data, indent=2))
\ No newline at end of file
+if __name__ == "__main__":
+    # Format the data for better understanding
+    for contest in upcoming_contests:
+        start_time = datetime.fromtimestamp(contest['startTimeSeconds'])
+        duration_hours = contest['durationSeconds'] / 3600
+
+        print(f"Contest: {contest['name']}")
+        print(f"Start: {start_time.strftime('%B %d, %Y at %I:%M %p')}")
+        print(f"Duration: {duration_hours} hours")
+        print(f"End: {(start_time + timedelta(seconds=contest['durationSeconds'])).strftime('%B %d, %Y at %I:%M %p')}")
+        print("-" * 50)
+
+    print("\nExtension data structure:")
+    print(json.dumps(extension_data, indent=2))
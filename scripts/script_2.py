@@ -29,14 +29,16 @@ manifest_json = {
         "storage",
         "identity",
         "activeTab",
-        "alarms"
+        "alarms",
+        "idle",
+        "notifications"
     ],
     "host_permissions": [
         "https://codeforces.com/*",
         "https://www.googleapis.com/*"
     ],
     "oauth2": {
-        "client_id": "YOUR_GOOGLE_OAUTH_CLIENT_ID.apps.googleusercontent.com",
+        "client_id": "1073705367280-34ocbvfn4okoq312sq308m13np2ca146.apps.googleusercontent.com",
         "scopes": [
             "https://www.googleapis.com/auth/calendar.events"
         ]
@@ -46,6 +48,7 @@ manifest_json = {
     }
 }
 
-import json
-print("manifest.json:")
-print(json.dumps(manifest_json, indent=2))
\ No newline at end of file
+if __name__ == "__main__":
+    import json
+    print("manifest.json:")
+    print(json.dumps(manifest_json, indent=2))
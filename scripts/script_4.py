@@ -2,16 +2,93 @@
 popup_js = '''// Popup script for CodeForces Calendar Extension
 
 // DOM elements
-let connectBtn, disconnectBtn, refreshBtn, contestsList, loading, errorMessage;
+let connectBtn, disconnectBtn, refreshBtn, addAllBtn, contestsList, loading, errorMessage;
 let authStatus, timezoneSelect, reminderCheckbox, successToast, errorToast;
 
 // State
 let isAuthenticated = false;
 let contests = [];
+const renderedCards = new Map(); // contest id -> { element, signature }
+const addState = new Map(); // contest id -> 'adding' | 'added'; cards are drawn from it
+
+// Windowed rendering for long lists (gym and past contests)
+const VIRTUAL_LIST_THRESHOLD = 100; // contests; shorter lists use keyed cards
+const VIRTUAL_ROW_HEIGHT = 156; // px per row: 144px card + 12px gap (see popup.html)
+const VIRTUAL_OVERSCAN = 4; // rows rendered above and below the viewport
+let virtualList = null; // { spacer, pool: [{ element, index, signature }], frame }
+
+// Timing trace: records when each init phase starts and how long it takes,
+// so time to interactive can be compared between builds (window.popupTrace)
+const popupTrace = {
+    phases: {},
+    
+    start(phase) {
+        performance.mark(`popup:${phase}:start`);
+    },
+    
+    end(phase) {
+        performance.mark(`popup:${phase}:end`);
+        const measure = performance.measure(`popup:${phase}`, `popup:${phase}:start`, `popup:${phase}:end`);
+        this.phases[phase] = { start: measure.startTime, duration: measure.duration };
+    },
+    
+    async run(phase, fn) {
+        this.start(phase);
+        try {
+            return await fn();
+        } finally {
+            this.end(phase);
+        }
+    }
+};
+window.popupTrace = popupTrace;
+
+// One long-lived port to the background worker. Requests are tagged with an id
+// so several can be in flight at once; bulk requests stream progress events
+// back before their final response.
+const backgroundChannel = {
+    port: null,
+    nextId: 1,
+    pending: new Map(), // request id -> { resolve, onProgress }
+    
+    connect() {
+        if (this.port) return this.port;
+        
+        this.port = chrome.runtime.connect({ name: 'popup' });
+        this.port.onMessage.addListener(message => {
+            const request = this.pending.get(message.id);
+            if (!request) return;
+            
+            if (message.type === 'progress') {
+                request.onProgress(message.progress);
+            } else {
+                this.pending.delete(message.id);
+                request.resolve(message.response);
+            }
+        });
+        this.port.onDisconnect.addListener(() => {
+            // The worker went away; fail what was in flight and reconnect on the next request
+            this.port = null;
+            this.pending.forEach(request => request.resolve({ success: false, error: 'Lost connection to the extension' }));
+            this.pending.clear();
+        });
+        return this.port;
+    },
+    
+    request(action, payload = {}, onProgress = () => {}) {
+        const port = this.connect();
+        const id = this.nextId++;
+        return new Promise(resolve => {
+            this.pending.set(id, { resolve, onProgress });
+            port.postMessage({ id, action, ...payload });
+        });
+    }
+};
 
 // Initialize popup when DOM is loaded
 document.addEventListener('DOMContentLoaded', () => {
     initializeElements();
+    markFirstContestCard(); // Prerendered cards (scripts/prerender.py) paint immediately
     setupEventListeners();
     initializePopup();
 });
@@ -20,6 +97,7 @@ function initializeElements() {
     connectBtn = document.getElementById('connect-btn');
     disconnectBtn = document.getElementById('disconnect-btn');
     refreshBtn = document.getElementById('refresh-btn');
+    addAllBtn = document.getElementById('add-all-btn');
     contestsList = document.getElementById('contests-list');
     loading = document.getElementById('loading');
     errorMessage = document.getElementById('error-message');
@@ -43,6 +121,10 @@ function setupEventListeners() {
         refreshBtn.addEventListener('click', handleRefreshContests);
     }
     
+    if (addAllBtn) {
+        addAllBtn.addEventListener('click', handleAddAllToCalendar);
+    }
+    
     if (timezoneSelect) {
         timezoneSelect.addEventListener('change', handleTimezoneChange);
     }
@@ -50,19 +132,40 @@ function setupEventListeners() {
     if (reminderCheckbox) {
         reminderCheckbox.addEventListener('change', handleReminderChange);
     }
+    
+    // One delegated handler for every card button instead of one listener per card
+    if (contestsList) {
+        contestsList.addEventListener('click', handleContestsListClick);
+    }
+}
+
+function handleContestsListClick(event) {
+    const button = event.target.closest('button');
+    if (!button || !contestsList.contains(button)) return;
+    
+    if (button.dataset.action === 'refresh') {
+        handleRefreshContests();
+        return;
+    }
+    
+    const card = button.closest('.contest-card');
+    if (card && button.id === `add-btn-${card.dataset.contestId}`) {
+        const contest = contests.find(c => String(c.id) === card.dataset.contestId);
+        if (contest) {
+            handleAddToCalendar(contest);
+        }
+    }
 }
 
 async function initializePopup() {
     try {
-        // Check authentication status
-        await checkAuthStatus();
-        
-        // Load user settings
-        await loadUserSettings();
-        
-        // Load contests
-        await loadContests();
-        
+        // Auth status, settings and contests are independent; load them concurrently
+        await popupTrace.run('interactive', () => Promise.all([
+            popupTrace.run('auth', checkAuthStatus),
+            popupTrace.run('settings', loadUserSettings),
+            popupTrace.run('contests', loadContests)
+        ]));
+        console.debug('Popup init timing (ms):', popupTrace.phases);
     } catch (error) {
         console.error('Error initializing popup:', error);
         showError('Failed to initialize extension');
@@ -71,28 +174,16 @@ async function initializePopup() {
 
 // Authentication functions
 async function checkAuthStatus() {
-    return new Promise((resolve) => {
-        chrome.runtime.sendMessage(
-            { action: 'checkAuthStatus' },
-            (response) => {
-                isAuthenticated = response && response.isAuthenticated;
-                updateAuthUI();
-                resolve();
-            }
-        );
-    });
+    const response = await backgroundChannel.request('checkAuthStatus');
+    isAuthenticated = response && response.isAuthenticated;
+    updateAuthUI();
 }
 
 async function handleGoogleConnect() {
     try {
         showLoading('Connecting to Google Calendar...');
         
-        const response = await new Promise((resolve) => {
-            chrome.runtime.sendMessage(
-                { action: 'authenticateGoogle' },
-                resolve
-            );
-        });
+        const response = await backgroundChannel.request('authenticateGoogle');
         
         if (response.success) {
             isAuthenticated = true;
@@ -111,12 +202,7 @@ async function handleGoogleConnect() {
 
 async function handleGoogleDisconnect() {
     try {
-        const response = await new Promise((resolve) => {
-            chrome.runtime.sendMessage(
-                { action: 'logout' },
-                resolve
-            );
-        });
+        const response = await backgroundChannel.request('logout');
         
         if (response.success) {
             isAuthenticated = false;
@@ -144,24 +230,30 @@ function updateAuthUI() {
         connected.classList.add('hidden');
         disconnected.classList.remove('hidden');
     }
+    updateAddAllButton();
+    
+    // Contests may have rendered before auth status arrived; refresh their buttons
+    if (contests && contests.length > 0) {
+        renderContests();
+    }
 }
 
-// Contest functions
-async function loadContests() {
+// Contest functions; `action` is 'refreshContests' to bypass the worker's cache
+async function loadContests(action = 'fetchContests') {
     try {
-        showLoading('Loading contests...');
+        // Keep prerendered cards on screen instead of a spinner while fresh data loads
+        if (!hasPrerenderedContests()) {
+            showLoading('Loading contests...');
+        }
         hideError();
         
-        const response = await new Promise((resolve) => {
-            chrome.runtime.sendMessage(
-                { action: 'fetchContests' },
-                resolve
-            );
-        });
+        const response = await backgroundChannel.request(action);
         
         if (response.success) {
             contests = response.contests;
+            markAddedContests(response.addedContestIds || []);
             renderContests();
+            updateAddAllButton();
         } else {
             showError(response.error || 'Failed to load contests');
         }
@@ -173,21 +265,28 @@ async function loadContests() {
     }
 }
 
-async function handleRefreshContests() {
-    // Clear cache by removing stored contests
-    chrome.storage.local.remove(['contests', 'lastFetch'], () => {
-        loadContests();
-    });
+function handleRefreshContests() {
+    // The worker drops its cached list and fetches before answering
+    return loadContests('refreshContests');
 }
 
+// Long lists are windowed, short ones rendered as keyed cards
 function renderContests() {
     if (!contestsList) return;
     
+    // Fresh data replaces (hydrates) any prerendered snapshot
+    if (hasPrerenderedContests()) {
+        contestsList.innerHTML = '';
+    }
+    delete contestsList.dataset.prerendered;
+    
     if (!contests || contests.length === 0) {
+        teardownVirtualList();
+        renderedCards.clear();
         contestsList.innerHTML = `
             <div class="no-contests">
                 <p>No upcoming contests found.</p>
-                <button class="btn btn--secondary btn--sm" onclick="handleRefreshContests()">
+                <button class="btn btn--secondary btn--sm" data-action="refresh">
                     Refresh
                 </button>
             </div>
@@ -195,13 +294,177 @@ function renderContests() {
         return;
     }
     
-    contestsList.innerHTML = contests.map(contest => createContestCard(contest)).join('');
+    if (contests.length > VIRTUAL_LIST_THRESHOLD) {
+        renderVirtualContests();
+    } else {
+        renderKeyedContests();
+    }
+    markFirstContestCard();
+}
+
+// Keyed reconciliation: cards are keyed by contest id and only patched when
+// their rendered content changes, so re-renders keep untouched cards in place
+function renderKeyedContests() {
+    teardownVirtualList();
+    
+    const emptyState = contestsList.querySelector('.no-contests');
+    if (emptyState) {
+        emptyState.remove();
+    }
+    
+    const seen = new Set();
+    contests.forEach((contest, index) => {
+        const signature = contestCardSignature(contest);
+        let card = renderedCards.get(contest.id);
+        
+        if (!card || card.signature !== signature) {
+            const element = createContestCardElement(contest);
+            if (card) {
+                card.element.replaceWith(element);
+            }
+            card = { element, signature };
+            renderedCards.set(contest.id, card);
+        }
+        
+        // Move the card into position only if it is out of order
+        const current = contestsList.children[index];
+        if (current !== card.element) {
+            contestsList.insertBefore(card.element, current || null);
+        }
+        seen.add(contest.id);
+    });
+    
+    renderedCards.forEach((card, id) => {
+        if (!seen.has(id)) {
+            card.element.remove();
+            renderedCards.delete(id);
+        }
+    });
+}
+
+// Everything createContestCard() output depends on
+function contestCardSignature(contest) {
+    return [contest.name, contest.type, contest.startTimeSeconds, contest.durationSeconds, isAuthenticated,
+        addState.get(contest.id) || ''].join('|');
+}
+
+function createContestCardElement(contest) {
+    const template = document.createElement('template');
+    template.innerHTML = createContestCard(contest).trim();
+    return template.content.firstElementChild;
+}
+
+// Virtual list: only the rows in view (plus overscan) are in the DOM, drawn
+// by a fixed pool of card nodes that are recycled as the list scrolls
+function setupVirtualList() {
+    if (virtualList) return virtualList;
+    
+    renderedCards.clear();
+    contestsList.innerHTML = '';
+    contestsList.classList.add('virtual');
+    
+    const spacer = document.createElement('div');
+    spacer.className = 'virtual-spacer';
+    contestsList.appendChild(spacer);
+    contestsList.addEventListener('scroll', scheduleVirtualWindow, { passive: true });
+    
+    virtualList = { spacer, pool: [], frame: 0 };
+    return virtualList;
+}
+
+function teardownVirtualList() {
+    if (!virtualList) return;
+    
+    contestsList.removeEventListener('scroll', scheduleVirtualWindow);
+    cancelAnimationFrame(virtualList.frame);
+    contestsList.classList.remove('virtual');
+    contestsList.innerHTML = '';
+    virtualList = null;
+}
+
+function renderVirtualContests() {
+    const list = setupVirtualList();
+    list.spacer.style.height = `${contests.length * VIRTUAL_ROW_HEIGHT}px`;
+    renderVirtualWindow();
+}
+
+// Coalesce scroll events into at most one window update per frame
+function scheduleVirtualWindow() {
+    if (!virtualList || virtualList.frame) return;
+    
+    virtualList.frame = requestAnimationFrame(() => {
+        if (!virtualList) return;
+        virtualList.frame = 0;
+        renderVirtualWindow();
+    });
+}
+
+function renderVirtualWindow() {
+    const list = virtualList;
+    const scrollTop = contestsList.scrollTop;
+    const viewportHeight = contestsList.clientHeight;
+    const first = Math.max(0, Math.floor(scrollTop / VIRTUAL_ROW_HEIGHT) - VIRTUAL_OVERSCAN);
+    const last = Math.min(contests.length, Math.ceil((scrollTop + viewportHeight) / VIRTUAL_ROW_HEIGHT) + VIRTUAL_OVERSCAN);
+    
+    while (list.pool.length < last - first) {
+        const element = document.createElement('div');
+        element.className = 'contest-card virtual-row';
+        contestsList.appendChild(element);
+        list.pool.push({ element, index: -1, signature: null });
+    }
+    
+    // Rows still in the window keep their node; the others are free for reuse
+    const visible = new Map();
+    const free = [];
+    list.pool.forEach(row => {
+        if (row.index >= first && row.index < last) {
+            visible.set(row.index, row);
+        } else {
+            free.push(row);
+        }
+    });
+    
+    for (let index = first; index < last; index++) {
+        const contest = contests[index];
+        const signature = `${contest.id}|${contestCardSignature(contest)}`;
+        const row = visible.get(index) || free.pop();
+        
+        if (row.signature !== signature) {
+            patchCardElement(row.element, contest);
+            row.signature = signature;
+        }
+        if (row.index !== index) {
+            row.element.style.transform = `translateY(${index * VIRTUAL_ROW_HEIGHT}px)`;
+            row.index = index;
+        }
+        row.element.hidden = false;
+    }
+    
+    free.forEach(row => {
+        row.element.hidden = true;
+        row.index = -1;
+    });
+}
+
+// Reuse an existing card node for another contest
+function patchCardElement(element, contest) {
+    const fresh = createContestCardElement(contest);
+    element.replaceChildren(...fresh.childNodes);
+    element.dataset.contestId = contest.id;
+}
+
+function hasPrerenderedContests() {
+    return !!contestsList && contestsList.dataset.prerendered === 'true';
+}
+
+// Record when the first contest card reaches the screen (read by scripts/measure_first_card.py)
+function markFirstContestCard() {
+    if (performance.getEntriesByName('first-contest-card').length > 0) return;
+    if (!contestsList || !contestsList.querySelector('.contest-card')) return;
     
-    // Add event listeners to "Add to Calendar" buttons
-    contests.forEach(contest => {
-        const button = document.getElementById(`add-btn-${contest.id}`);
-        if (button) {
-            button.addEventListener('click', () => handleAddToCalendar(contest));
+    requestAnimationFrame(() => {
+        if (performance.getEntriesByName('first-contest-card').length === 0) {
+            performance.mark('first-contest-card');
         }
     });
 }
@@ -219,11 +482,10 @@ function createContestCard(contest) {
         minute: '2-digit'
     });
     
-    const disabled = !isAuthenticated ? 'disabled' : '';
-    const buttonText = isAuthenticated ? 'Add to Calendar' : 'Connect Google First';
+    const button = addButtonView(contest.id);
     
     return `
-        <div class="contest-card">
+        <div class="contest-card" data-contest-id="${contest.id}">
             <div class="contest-header">
                 <h3 class="contest-title">${escapeHtml(contest.name)}</h3>
                 <span class="contest-type">${contest.type}</span>
@@ -244,10 +506,10 @@ function createContestCard(contest) {
                 </a>
                 <button 
                     id="add-btn-${contest.id}" 
-                    class="btn btn--primary btn--sm" 
-                    ${disabled}
+                    class="btn ${button.variant} btn--sm" 
+                    ${button.disabled ? 'disabled' : ''}
                 >
-                    ${buttonText}
+                    ${button.text}
                 </button>
             </div>
         </div>
@@ -256,42 +518,106 @@ function createContestCard(contest) {
 
 async function handleAddToCalendar(contest) {
     try {
-        const button = document.getElementById(`add-btn-${contest.id}`);
-        if (button) {
-            button.textContent = 'Adding...';
-            button.disabled = true;
-        }
+        setAddState(contest.id, 'adding');
         
-        const response = await new Promise((resolve) => {
-            chrome.runtime.sendMessage(
-                { action: 'addToCalendar', contest },
-                resolve
-            );
-        });
+        const response = await backgroundChannel.request('addToCalendar', { contest });
         
         if (response.success) {
             showSuccess(`Added "${contest.name}" to your calendar!`);
-            if (button) {
-                button.textContent = 'Added ✓';
-                button.classList.remove('btn--primary');
-                button.classList.add('btn--success');
-            }
+            setAddState(contest.id, 'added');
         } else {
             showError(response.error || 'Failed to add event to calendar');
-            if (button) {
-                button.textContent = 'Add to Calendar';
-                button.disabled = false;
-            }
+            setAddState(contest.id, null);
         }
     } catch (error) {
         console.error('Error adding to calendar:', error);
         showError('Failed to add event to calendar');
+        setAddState(contest.id, null);
+    }
+}
+
+// Contests the worker already added (its addedContests) show as added, even
+// after the popup was closed while a bulk add was running
+function markAddedContests(ids) {
+    ids.forEach(id => {
+        if (addState.get(id) !== 'adding') {
+            addState.set(id, 'added');
+        }
+    });
+}
+
+// Add every listed contest not yet added with one batched request; cards update as progress arrives
+async function handleAddAllToCalendar() {
+    const pending = contests.filter(contest => !addState.has(contest.id));
+    if (pending.length === 0) return;
+    
+    addAllBtn.disabled = true;
+    pending.forEach(contest => setAddState(contest.id, 'adding'));
+    
+    try {
+        const response = await backgroundChannel.request('addManyToCalendar', { contests: pending }, progress => {
+            addAllBtn.textContent = `Adding ${progress.done}/${progress.total}...`;
+            setAddState(progress.contestId, progress.success ? 'added' : null);
+        });
         
-        const button = document.getElementById(`add-btn-${contest.id}`);
-        if (button) {
-            button.textContent = 'Add to Calendar';
-            button.disabled = false;
+        if (response.success) {
+            showSuccess(`Added ${response.added} contests to your calendar!`);
+        } else {
+            showError(response.error || `Added ${response.added}, ${response.failed + response.skipped} failed`);
         }
+    } catch (error) {
+        console.error('Error adding contests to calendar:', error);
+        showError('Failed to add contests to calendar');
+    } finally {
+        // Contests the worker never reported on are clickable again
+        pending.forEach(contest => {
+            if (addState.get(contest.id) === 'adding') {
+                setAddState(contest.id, null);
+            }
+        });
+        addAllBtn.textContent = 'Add All';
+        updateAddAllButton();
+    }
+}
+
+// Text, style and disabled flag of a contest's add button, from the model
+function addButtonView(contestId) {
+    const state = addState.get(contestId);
+    if (state === 'added') {
+        return { text: 'Added ✓', variant: 'btn--success', disabled: true };
+    }
+    if (state === 'adding') {
+        return { text: 'Adding...', variant: 'btn--primary', disabled: true };
+    }
+    return {
+        text: isAuthenticated ? 'Add to Calendar' : 'Connect Google First',
+        variant: 'btn--primary',
+        disabled: !isAuthenticated
+    };
+}
+
+// Update the model (null clears the state) and patch the button if it is on
+// screen. Off-screen and recycled cards pick the state up when next drawn.
+function setAddState(contestId, state) {
+    if (state) {
+        addState.set(contestId, state);
+    } else {
+        addState.delete(contestId);
+    }
+    
+    const button = document.getElementById(`add-btn-${contestId}`);
+    if (!button) return;
+    
+    const view = addButtonView(contestId);
+    button.textContent = view.text;
+    button.disabled = view.disabled;
+    button.classList.remove('btn--primary', 'btn--success');
+    button.classList.add(view.variant);
+}
+
+function updateAddAllButton() {
+    if (addAllBtn) {
+        addAllBtn.disabled = !isAuthenticated || !contests || contests.length === 0;
     }
 }
 
@@ -393,5 +719,6 @@ document.addEventListener('click', (e) => {
 });
 '''
 
-print("popup.js:")
-print(popup_js)
\ No newline at end of file
+if __name__ == "__main__":
+    print("popup.js:")
+    print(popup_js)
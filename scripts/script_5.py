@@ -126,6 +126,10 @@ popup_html = '''<!DOCTYPE html>
             align-items: center;
         }
 
+        .header-actions {
+            gap: 6px;
+        }
+
         .contests-section h2 {
             margin: 0 0 12px 0;
             font-size: 16px;
@@ -185,6 +189,32 @@ popup_html = '''<!DOCTYPE html>
             margin-bottom: 12px;
         }
 
+        /* Windowed list for long histories: fixed-height rows positioned by popup.js */
+        .contests-list.virtual {
+            position: relative;
+            height: 300px;
+            overscroll-behavior: contain;
+        }
+
+        .contests-list.virtual .virtual-row {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            height: 144px; /* VIRTUAL_ROW_HEIGHT in popup.js minus the 12px gap */
+            margin: 0;
+            box-sizing: border-box;
+            overflow: hidden;
+            will-change: transform;
+        }
+
+        .contests-list.virtual .contest-title {
+            display: -webkit-box;
+            -webkit-line-clamp: 2;
+            -webkit-box-orient: vertical;
+            overflow: hidden;
+        }
+
         .contest-header {
             display: flex;
             justify-content: space-between;
@@ -359,9 +389,12 @@ popup_html = '''<!DOCTYPE html>
         <div class="contests-section">
             <div class="flex justify-between items-center">
                 <h2>Upcoming Contests</h2>
-                <button id="refresh-btn" class="btn btn--secondary btn--sm">
-                    <span class="refresh-icon">↻</span> Refresh
-                </button>
+                <div class="flex items-center header-actions">
+                    <button id="add-all-btn" class="btn btn--primary btn--sm" disabled>Add All</button>
+                    <button id="refresh-btn" class="btn btn--secondary btn--sm">
+                        <span class="refresh-icon">↻</span> Refresh
+                    </button>
+                </div>
             </div>
 
             <div id="loading" class="loading hidden">
@@ -410,7 +443,9 @@ popup_html = '''<!DOCTYPE html>
 
     <script src="popup.js"></script>
 </body>
-</html>'''
+</html>
+'''
 
-print("popup.html for Chrome Extension:")
-print(popup_html)
\ No newline at end of file
+if __name__ == "__main__":
+    print("popup.html for Chrome Extension:")
+    print(popup_html)
@@ -0,0 +1,190 @@
+# Simulation: background refresh policies replayed over a year of contest.list snapshots
+#
+# Generates a year of CodeForces-like contest history (announcements, start
+# time changes, cancellations), replays it against the old fixed hourly poll
+# and the adaptive schedule in background.js, and counts fetches against
+# freshness misses: a change the extension had not fetched by the time it
+# mattered.
+#   announcement   seen within 24 h, and before the first reminder
+#   time change    seen before the first reminder of the earlier start time
+#   cancellation   seen before the first reminder
+#
+# The adaptive policy mirrors nextRefreshDelayMinutes() and refreshIfDue();
+# its constants are read from background.js (script_3.py) so the two cannot drift.
+#
+# Usage: python scripts/simulate_refresh.py [seed]
+import bisect
+import collections
+import random
+import re
+import statistics
+import sys
+
+from script_3 import background_js
+
+HOUR = 3600
+DAY = 24 * HOUR
+YEAR = 365 * DAY
+ACTIVE_HOURS = (9, 23)  # the user is at the machine between these (UTC) hours
+
+Change = collections.namedtuple("Change", "kind time deadline")
+# versions: [(time, start_seconds or None when cancelled)], first entry is the announcement
+SimContest = collections.namedtuple("SimContest", "id versions")
+
+
+def _js_minutes(expression):
+    if not re.fullmatch(r"[\d\s*]+", expression):
+        raise ValueError(f"unexpected constant in background.js: {expression}")
+    value = 1
+    for factor in expression.split("*"):
+        value *= int(factor)
+    return value
+
+
+# REFRESH_MINUTES, IMMINENT_WINDOW_MINUTES, IDLE_DETECTION_SECONDS and REMINDER_MINUTES
+def background_constants(source=background_js):
+    block = re.search(r"const REFRESH_MINUTES = \{(.*?)\};", source, re.S).group(1)
+    refresh = {name: _js_minutes(value.strip())
+               for name, value in re.findall(r"(\w+):\s*([\d\s*]+)", block)}
+    window = _js_minutes(re.search(r"const IMMINENT_WINDOW_MINUTES = ([\d\s*]+);", source).group(1))
+    idle = _js_minutes(re.search(r"const IDLE_DETECTION_SECONDS = ([\d\s*]+);", source).group(1))
+    reminders = [int(m) for m in
+                 re.search(r"const REMINDER_MINUTES = \[([\d,\s]+)\];", source).group(1).split(",")]
+    return refresh, window, idle, reminders
+
+
+def generate_history(seed=1, start=0, span=YEAR):
+    rng = random.Random(seed)
+    contests = []
+    t = start + rng.uniform(0, 2 * DAY)
+    while t < start + span:
+        # Rounds start at 14:35 UTC, roughly every two to three days
+        day = int(t // DAY) * DAY
+        begin = day + 14 * HOUR + 35 * 60
+        announced = begin - rng.uniform(3, 14) * DAY
+        versions = [(announced, begin)]
+        if rng.random() < 0.10:
+            # Moved in the last two days, usually by an hour or two
+            moved_at = begin - rng.uniform(1, 48) * HOUR
+            versions.append((moved_at, begin + rng.choice((-2, -1, 1, 2, 24)) * HOUR))
+        elif rng.random() < 0.02:
+            versions.append((begin - rng.uniform(1, 72) * HOUR, None))
+        contests.append(SimContest(len(contests) + 1, versions))
+        t += rng.expovariate(1 / (2.5 * DAY))
+    return contests
+
+
+# Start time of a contest as listed at time t (None if not listed / cancelled)
+def start_at(contest, t):
+    current = None
+    for time, start in contest.versions:
+        if time > t:
+            break
+        current = start
+    return current
+
+
+# Upcoming (phase BEFORE) start times in the contest.list snapshot at time t
+def upcoming_starts(contests, t):
+    starts = []
+    for contest in contests:
+        if contest.versions[0][0] <= t:
+            start = start_at(contest, t)
+            if start is not None and start > t:
+                starts.append(start)
+    return starts
+
+
+def freshness_changes(contests, reminder_lead):
+    changes = []
+    for contest in contests:
+        announced, start = contest.versions[0]
+        changes.append(Change("announcement", announced, min(announced + DAY, start - reminder_lead)))
+        for (_, old_start), (time, new_start) in zip(contest.versions, contest.versions[1:]):
+            if new_start is None:
+                changes.append(Change("cancellation", time, old_start - reminder_lead))
+            else:
+                changes.append(Change("time change", time, min(old_start, new_start) - reminder_lead))
+    return [change for change in changes if change.time < change.deadline]
+
+
+# chrome.idle reports 'idle' once there has been no input for idle_seconds
+def is_active(t, idle_seconds):
+    return ACTIVE_HOURS[0] * HOUR <= t % DAY < ACTIVE_HOURS[1] * HOUR + idle_seconds
+
+
+def next_active(t):
+    day = int(t // DAY) * DAY
+    opens = day + ACTIVE_HOURS[0] * HOUR
+    return opens if t < opens else opens + DAY
+
+
+def hourly_policy(contests, start, end):
+    return [start + i * HOUR for i in range(int((end - start) // HOUR) + 1)]
+
+
+# Mirror of nextRefreshDelayMinutes() in background.js, in seconds
+def adaptive_delay(starts, t, refresh, window_minutes):
+    if not starts:
+        return refresh["quiet"] * 60
+    until_next = (min(starts) - t) / 60
+    if until_next <= window_minutes:
+        return refresh["imminent"] * 60
+    return max(refresh["imminent"], min(refresh["sparse"], until_next - window_minutes)) * 60
+
+
+def adaptive_policy(contests, start, end, constants, skip_idle):
+    refresh, window, idle_seconds, _ = constants
+    fetches = []
+    t = start
+    while t <= end:
+        fetches.append(t)
+        t += adaptive_delay(upcoming_starts(contests, t), t, refresh, window)
+        # refreshIfDue() skips while idle; idle.onStateChanged('active') catches up
+        # as soon as input resumes
+        if skip_idle and not is_active(t, idle_seconds):
+            t = next_active(t)
+    return fetches
+
+
+def evaluate(fetches, changes):
+    misses = collections.Counter()
+    lags = []
+    for change in changes:
+        i = bisect.bisect_left(fetches, change.time)
+        seen = fetches[i] if i < len(fetches) else None
+        if seen is None or seen > change.deadline:
+            misses[change.kind] += 1
+        if seen is not None:
+            lags.append((seen - change.time) / HOUR)
+    return misses, lags
+
+
+def main():
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    constants = background_constants()
+    reminder_lead = max(constants[3]) * 60
+    contests = generate_history(seed)
+    start = min(contest.versions[0][0] for contest in contests)
+    end = max(version[0] for contest in contests for version in contest.versions)
+    changes = freshness_changes(contests, reminder_lead)
+    kinds = collections.Counter(change.kind for change in changes)
+
+    print(f"{len(contests)} contests over {(end - start) / DAY:.0f} days; changes: "
+          + ", ".join(f"{count} {kind}s" for kind, count in sorted(kinds.items())))
+    print(f"{'policy':<24}{'fetches':>9}{'misses':>8}  {'by kind':<46}{'lag p50':>9}{'lag p95':>9}")
+    policies = (
+        ("hourly (old)", hourly_policy(contests, start, end)),
+        ("adaptive", adaptive_policy(contests, start, end, constants, skip_idle=False)),
+        ("adaptive, idle paused", adaptive_policy(contests, start, end, constants, skip_idle=True)),
+    )
+    for label, fetches in policies:
+        misses, lags = evaluate(fetches, changes)
+        by_kind = ", ".join(f"{kind} {misses[kind]}" for kind in sorted(kinds))
+        lags.sort()
+        print(f"{label:<24}{len(fetches):>9}{sum(misses.values()):>8}  {by_kind:<46}"
+              f"{statistics.median(lags):>8.1f}h{lags[int(0.95 * (len(lags) - 1))]:>8.1f}h")
+
+
+if __name__ == "__main__":
+    main()
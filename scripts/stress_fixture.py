@@ -0,0 +1,49 @@
+# Stress fixture for the popup's virtualized contest list
+#
+# Writes dist/stress/: a contest history of CodeForces rounds and gym
+# contests (default 20,000 entries) and a copy of the popup whose chrome.*
+# stand-in serves it from fetchContests. Open dist/stress/popup.html in
+# Chrome and scroll the list.
+#
+# Usage: python scripts/stress_fixture.py [count] [out_dir]
+import json
+import os
+import sys
+
+from build import DIST_DIR
+from fixtures import make_contest_history, popup_chrome_stub
+from script_4 import popup_js
+from script_5 import popup_html
+
+CHROME_STUB = popup_chrome_stub("stress fixture", {
+    "checkAuthStatus": "{ isAuthenticated: true }",
+    "fetchContests": "{ success: true, contests: window.STRESS_CONTESTS }",
+    "refreshContests": "{ success: true, contests: window.STRESS_CONTESTS }",
+}, delay=20)
+
+
+def write_fixture(out_dir, count):
+    os.makedirs(out_dir, exist_ok=True)
+    contests = make_contest_history(count)
+    files = {
+        "contests.json": json.dumps(contests),
+        "contests.js": "window.STRESS_CONTESTS = " + json.dumps(contests) + ";\n",
+        "chrome_stub.js": CHROME_STUB,
+        "popup.js": popup_js,
+        "popup.html": popup_html.replace(
+            '<script src="popup.js"></script>',
+            '<script src="contests.js"></script>\n'
+            '    <script src="chrome_stub.js"></script>\n'
+            '    <script src="popup.js"></script>',
+        ),
+    }
+    for name, content in files.items():
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            f.write(content)
+    return os.path.join(out_dir, "popup.html")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.join(DIST_DIR, "stress")
+    print(f"{count} contests; open {write_fixture(out_dir, count)} in Chrome")
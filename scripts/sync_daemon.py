@@ -0,0 +1,217 @@
+# Multi-tenant calendar sync daemon
+#
+# In the extension every user's service worker polls contest.list on its
+# own. SyncDaemon fetches the contest list once per cycle (through a
+# ContestAggregator) and fans it out to every subscribed account. Each
+# tenant has its own bounded queue and worker, which syncs through the
+# shared SyncLedger and CalendarSyncEngine, so only what changed for that
+# account reaches its calendar. A slow tenant never holds up the others:
+# when its queue is full the oldest queued snapshot is dropped, since a newer
+# contest list supersedes it, and at most `max_concurrent_syncs` tenants
+# talk to the Calendar API at once. Each cycle's typed changes (contest_diff)
+# are kept in `last_changes` and passed to `on_changes` for notifications or
+# cache invalidation. A cycle in which some source failed or had no result
+# yet is incomplete: tenants still get its additions and updates, but no
+# event is deleted and no changes are reported until a complete cycle.
+#
+# Usage: python scripts/sync_daemon.py [tenants] [cycles]
+#   runs against FakeCodeforcesServer and FakeCalendarServer
+import asyncio
+import collections
+import sys
+import tempfile
+import time
+
+from calendar_event import content_hash
+from calendar_sync import CalendarSyncEngine
+from contest_diff import SnapshotDiffer
+from contest_sources import ContestAggregator, codeforces_sources
+
+Tenant = collections.namedtuple("Tenant", "account token time_zone", defaults=("UTC",))
+
+
+class TenantStats:
+    __slots__ = ("syncs", "coalesced", "failures", "POST", "PATCH", "DELETE", "failed", "last_error")
+
+    def __init__(self):
+        self.syncs = self.coalesced = self.failures = 0
+        self.POST = self.PATCH = self.DELETE = self.failed = 0
+        self.last_error = None
+
+
+class _TenantWorker:
+    def __init__(self, daemon, tenant, queue_size):
+        self.daemon = daemon
+        self.tenant = tenant
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.stats = TenantStats()
+        self.synced_hash = None  # last snapshot this account fully synced
+        self.task = asyncio.create_task(self._run())
+
+    # Queue a snapshot without waiting; a full queue sheds its oldest entry
+    def offer(self, digest, contests, complete=True):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.stats.coalesced += 1
+        self.queue.put_nowait((digest, contests, complete))
+
+    async def _run(self):
+        daemon = self.daemon
+        while True:
+            digest, contests, complete = await self.queue.get()
+            try:
+                async with daemon.sync_slots:
+                    counts = await asyncio.to_thread(
+                        daemon.ledger.sync, daemon.engine, self.tenant.account,
+                        self.tenant.token, contests, self.tenant.time_zone, complete,
+                    )
+                self.stats.syncs += 1
+                for name, count in counts.items():
+                    setattr(self.stats, name, getattr(self.stats, name) + count)
+                # Failed operations (and skipped deletions) are retried with the next snapshot
+                self.synced_hash = digest if complete and not counts["failed"] else None
+            except Exception as error:
+                self.stats.failures += 1
+                self.stats.last_error = error
+            finally:
+                self.queue.task_done()
+
+
+class SyncDaemon:
+    def __init__(self, aggregator, engine, ledger, interval=300.0, queue_size=1,
+                 max_concurrent_syncs=8, fetch_deadline=None, on_changes=None):
+        self.aggregator = aggregator
+        self.engine = engine
+        self.ledger = ledger
+        self.interval = interval
+        self.queue_size = queue_size
+        self.max_concurrent_syncs = max_concurrent_syncs
+        self.fetch_deadline = fetch_deadline
+        self.on_changes = on_changes
+        self.differ = SnapshotDiffer()
+        self.last_changes = []
+        self.workers = {}  # account -> _TenantWorker
+        self.sync_slots = None
+        self.cycles = 0
+
+    # Must be called from the running event loop
+    def subscribe(self, tenant):
+        if self.sync_slots is None:
+            self.sync_slots = asyncio.Semaphore(self.max_concurrent_syncs)
+        if tenant.account in self.workers:
+            self.workers[tenant.account].tenant = tenant
+            return
+        self.workers[tenant.account] = _TenantWorker(self, tenant, self.queue_size)
+
+    def unsubscribe(self, account):
+        worker = self.workers.pop(account, None)
+        if worker is not None:
+            worker.task.cancel()
+
+    def stats(self, account):
+        return self.workers[account].stats
+
+    # One upstream fetch, fanned out to every tenant; returns the contest list
+    async def run_cycle(self):
+        contests = await self.aggregator.refresh(deadline=self.fetch_deadline)
+        self.cycles += 1
+        # Contests of a failed source would read as removed
+        complete = not self.aggregator.missing
+        self.last_changes = self.differ.update(contests) if complete else []
+        if self.last_changes and self.on_changes is not None:
+            self.on_changes(self.last_changes)
+        digest = content_hash(contests)
+        for worker in self.workers.values():
+            # Tenants already in sync with this exact list have nothing to do
+            if worker.synced_hash != digest:
+                worker.offer(digest, contests, complete)
+        return contests
+
+    # Wait until every queued snapshot has been synced
+    async def drain(self):
+        await asyncio.gather(*(worker.queue.join() for worker in self.workers.values()))
+
+    async def run(self, cycles=None):
+        count = 0
+        while cycles is None or count < cycles:
+            started = time.monotonic()
+            await self.run_cycle()
+            count += 1
+            if cycles is None or count < cycles:
+                await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def close(self):
+        tasks = [worker.task for worker in self.workers.values()]
+        for account in list(self.workers):
+            self.unsubscribe(account)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    from fake_calendar_server import FakeCalendarServer
+    from fake_codeforces_server import FakeCodeforcesServer
+    from fixtures import DAY, make_contests
+    from sync_ledger import SyncLedger
+
+    tenant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    cycle_count = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    # contest.list lists the newest first
+    contests = make_contests(20, first_id=2200, start=int(time.time()) + DAY, newest_first=True)
+
+    async def run(codeforces, calendar, ledger_path):
+        with CalendarSyncEngine(calendar.base_url, max_connections=8,
+                                backoff_seconds=0.01) as engine:
+            def start():
+                aggregator = ContestAggregator(codeforces_sources(codeforces.contest_list_url, retries=0))
+                daemon = SyncDaemon(aggregator, engine, SyncLedger(ledger_path), interval=0)
+                for i in range(tenant_count):
+                    daemon.subscribe(Tenant(f"user{i}", f"token-{i}"))
+                return daemon
+
+            async def cycle(daemon, label):
+                await daemon.run_cycle()
+                await daemon.drain()
+                totals = {name: sum(getattr(daemon.stats(a), name) for a in daemon.workers)
+                          for name in ("POST", "PATCH", "DELETE")}
+                events = calendar.calendar.event_count()
+                print(f"{label:<8}{codeforces.api.requests:>9}{calendar.calendar.http_requests:>10}"
+                      f"{totals['POST']:>7}{totals['PATCH']:>7}{totals['DELETE']:>8}{events:>8}  "
+                      + ", ".join(type(change).__name__ for change in daemon.last_changes[:4])
+                      + (" ..." if len(daemon.last_changes) > 4 else ""))
+
+            async def stop(daemon):
+                await daemon.close()
+                daemon.ledger.close()
+
+            print(f"{'cycle':<8}{'upstream':>9}{'calendar':>10}{'POST':>7}{'PATCH':>7}{'DELETE':>8}"
+                  f"{'events':>8}  changes")
+            daemon = start()
+            for number in range(1, cycle_count + 1):
+                if number == 3:
+                    # A round is rescheduled and another one cancelled upstream
+                    contests[0] = dict(contests[0], startTimeSeconds=contests[0]["startTimeSeconds"] + 3600)
+                    del contests[1]
+                    codeforces.api.set_contests(contests)
+                await cycle(daemon, str(number))
+            await stop(daemon)
+
+            # Restart on the same ledger while contest.list fails: an empty
+            # list must not read as every contest cancelled
+            print("restart; contest.list failing, then back")
+            daemon = start()
+            codeforces.api.failing = True
+            await cycle(daemon, "failing")
+            codeforces.api.failing = False
+            await cycle(daemon, "back")
+            await stop(daemon)
+
+    with FakeCodeforcesServer(contests=contests) as codeforces, \
+            FakeCalendarServer(latency=0.005) as calendar, \
+            tempfile.NamedTemporaryFile(suffix=".sqlite") as ledger_file:
+        print(f"{tenant_count} tenants, {len(contests)} upcoming contests (counts cumulative per daemon)")
+        asyncio.run(run(codeforces, calendar, ledger_file.name))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Idempotent calendar sync backed by a local SQLite ledger
+#
+# The ledger records which contest went to which account's calendar, under
+# which event id, and a hash of the event body that was sent. A repeat sync
+# only inserts contests it has never sent, PATCHes events whose contest was
+# rescheduled or renamed, and DELETEs events for contests that disappeared
+# before they started, so a steady-state sync makes no API calls at all.
+import sqlite3
+import threading
+import time
+
+from calendar_event import build_calendar_event, content_hash
+from calendar_sync import EVENTS_PATH, CalendarOperation
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS synced_events (
+    account TEXT NOT NULL,
+    contest_id INTEGER NOT NULL,
+    event_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    start_time_seconds INTEGER NOT NULL,
+    PRIMARY KEY (account, contest_id)
+)
+"""
+
+
+class SyncLedger:
+    def __init__(self, path):
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.db:
+            self.db.execute(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def entries(self, account):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT contest_id, event_id, content_hash, start_time_seconds "
+                "FROM synced_events WHERE account = ?",
+                (account,),
+            ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    # Work out the calendar operations needed to bring `account` up to date.
+    # With deletions=False (an incomplete contest list) nothing is deleted.
+    def plan(self, account, contests, time_zone="UTC", now=None, deletions=True):
+        now = now if now is not None else time.time()
+        known = self.entries(account)
+        operations = []
+        pending = {}  # contest id -> (content hash, start time)
+
+        for contest in contests:
+            event = build_calendar_event(contest, time_zone)
+            digest = content_hash(event)
+            entry = known.pop(contest["id"], None)
+            if entry is None:
+                operations.append(CalendarOperation(contest["id"], "POST", EVENTS_PATH, event))
+            elif entry[1] != digest:
+                operations.append(CalendarOperation(
+                    contest["id"], "PATCH", f"{EVENTS_PATH}/{entry[0]}", event
+                ))
+            else:
+                continue
+            pending[contest["id"]] = (digest, contest["startTimeSeconds"])
+
+        # Contests that vanished before starting were cancelled; ones that
+        # started simply left the upcoming list and keep their event
+        if not deletions:
+            return operations, pending
+        for contest_id, (event_id, _, start_time) in known.items():
+            if start_time > now:
+                operations.append(CalendarOperation(
+                    contest_id, "DELETE", f"{EVENTS_PATH}/{event_id}", None
+                ))
+        return operations, pending
+
+    # Record the outcome of executed operations
+    def record(self, account, operations, results, pending):
+        with self.lock, self.db:
+            for op, result in zip(operations, results):
+                if op.method == "DELETE":
+                    if result.status in (200, 204, 404, 410):
+                        self.db.execute(
+                            "DELETE FROM synced_events WHERE account = ? AND contest_id = ?",
+                            (account, op.key),
+                        )
+                    continue
+                if result.status == 404 and op.method == "PATCH":
+                    # The user deleted the event by hand; forget it so the next sync re-adds it
+                    self.db.execute(
+                        "DELETE FROM synced_events WHERE account = ? AND contest_id = ?",
+                        (account, op.key),
+                    )
+                    continue
+                if result.status != 200:
+                    continue
+                digest, start_time = pending[op.key]
+                self.db.execute(
+                    "INSERT OR REPLACE INTO synced_events VALUES (?, ?, ?, ?, ?)",
+                    (account, op.key, result.body["id"], digest, start_time),
+                )
+
+    # Plan, execute through a CalendarSyncEngine and record; returns counts per method
+    def sync(self, engine, account, token, contests, time_zone="UTC", deletions=True):
+        operations, pending = self.plan(account, contests, time_zone, deletions=deletions)
+        results = engine.execute(token, operations) if operations else []
+        self.record(account, operations, results, pending)
+
+        counts = {"POST": 0, "PATCH": 0, "DELETE": 0, "failed": 0}
+        for op, result in zip(operations, results):
+            if result.status in (200, 204):
+                counts[op.method] += 1
+            else:
+                counts["failed"] += 1
+        return counts